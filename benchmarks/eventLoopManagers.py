@@ -0,0 +1,93 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Compares the threaded EventLoopManager with the
+CooperativeEventLoopManager by running a headless
+scene for a few seconds and measuring the update
+rate and frame time jitter.
+
+Usage: python benchmarks/eventLoopManagers.py [seconds] [fps] [behaviours]
+
+"""
+
+import os
+import sys
+os.environ["PYUNITY_INTERACTIVE"] = "0"
+os.environ["PYUNITY_DEBUG_MODE"] = "0"
+# Use the checkout this script is in, not an installed version
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyunity import (Behaviour, CooperativeEventLoopManager, EventLoopManager,
+                     GameObject, SceneManager, config)
+from pyunity.scenes.runner import NonInteractiveRunner
+import statistics
+import threading
+import time
+
+class Recorder(Behaviour):
+    def Start(self):
+        self.frames = []
+        self.fixedFrames = 0
+
+    def Update(self, dt):
+        self.frames.append(dt)
+
+    def FixedUpdate(self, dt):
+        self.fixedFrames += 1
+
+class Busy(Behaviour):
+    def Update(self, dt):
+        sum(range(200))
+
+def run(managerClass, seconds, behaviours):
+    scene = SceneManager.AddScene(managerClass.__name__)
+    recorderObject = GameObject("Recorder")
+    recorder = recorderObject.AddComponent(Recorder)
+    scene.Add(recorderObject)
+    for i in range(behaviours):
+        gameObject = GameObject(f"Busy {i}")
+        gameObject.AddComponent(Busy)
+        scene.Add(gameObject)
+
+    runner = NonInteractiveRunner()
+    runner.setScene(scene, clone=False)
+    runner.open()
+    runner.load(managerClass)
+    manager = runner.eventLoopManager
+
+    def stop():
+        manager.running = False
+    timer = threading.Timer(seconds, stop)
+    timer.start()
+    start = time.perf_counter()
+    try:
+        manager.start()
+    finally:
+        elapsed = time.perf_counter() - start
+        runner.quit()
+        SceneManager.RemoveScene(scene)
+
+    frames = recorder.frames[1:]
+    return {
+        "updates/s": len(frames) / elapsed,
+        "fixed/s": recorder.fixedFrames / elapsed,
+        "mean ms": statistics.mean(frames) * 1000,
+        "stdev ms": statistics.pstdev(frames) * 1000,
+        "max ms": max(frames) * 1000,
+    }
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3
+    config.fps = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    behaviours = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+
+    print(f"{seconds}s per run, fps={config.fps}, {behaviours} behaviours")
+    for managerClass in (EventLoopManager, CooperativeEventLoopManager):
+        results = run(managerClass, seconds, behaviours)
+        line = ", ".join(f"{k}: {v:.2f}" for k, v in results.items())
+        print(f"{managerClass.__name__:>28}: {line}")
+
+if __name__ == "__main__":
+    main()
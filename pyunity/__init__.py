@@ -231,7 +231,7 @@ if "PYUNITY_TESTING" not in os.environ:
     config.windowProvider = Window.GetWindowProvider()
 
 __all__ = ["Logger", "Loader", "Window", "Primitives", "Screen",
-           "SceneManager"]
+           "SceneManager", "Profiler"]
 
 from .audio import __all__ as _audio_all
 from .core import __all__ as _core_all
@@ -240,6 +240,7 @@ from .events import __all__ as _events_all
 from .files import __all__ as _files_all
 from .gui import __all__ as _gui_all
 from .input import __all__ as _input_all
+from .lod import __all__ as _lod_all
 from .meshes import __all__ as _meshes_all
 from .physics import __all__ as _physics_all
 from .render import __all__ as _render_all
@@ -250,6 +251,7 @@ __all__.extend(_values_all)
 __all__.extend(_core_all)
 __all__.extend(_events_all)
 __all__.extend(_meshes_all)
+__all__.extend(_lod_all)
 __all__.extend(_files_all)
 __all__.extend(_render_all)
 __all__.extend(_audio_all)
@@ -258,6 +260,7 @@ __all__.extend(_input_all)
 __all__.extend(_gui_all)
 
 from . import loader as Loader
+from . import profiler as Profiler
 from ._version import __version__
 from .audio import *
 from .core import *
@@ -266,6 +269,7 @@ from .events import *
 from .files import *
 from .gui import *
 from .input import *
+from .lod import *
 from .loader import Primitives
 from .meshes import *
 from .physics import *
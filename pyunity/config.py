@@ -27,5 +27,9 @@ faceCulling = True
 windowProvider = None
 vsync = False
 exitOnError = True
+jobBudget = 0.004
+threadPoolWorkers = None
+processPoolWorkers = None
+gcPolicy = None
 
 Logger.LogLine(Logger.DEBUG, "Loaded config")
@@ -152,17 +152,25 @@ class GameObject(SavesProjectID):
     transform : Transform
         Transform that belongs to the GameObject
 
+    Notes
+    -----
+    Component lookups are cached per type and the cache is
+    cleared whenever a component is added or removed. Do not
+    modify :attr:`components` directly, instead use
+    :meth:`AddComponent` and :meth:`RemoveComponent`.
+
     """
 
     def __init__(self, name="GameObject", parent=None):
         self.name = name
         self.components = []
+        self._componentCache = {}
+        self.scene = None
         self.transform = self.AddComponent(Transform)
         if parent is not None:
             self.transform.ReparentTo(parent.transform)
         self.tag = Tag(0)
         self.enabled = True
-        self.scene = None
 
     @classmethod
     def BareObject(cls, name="GameObject"):
@@ -178,6 +186,7 @@ class GameObject(SavesProjectID):
         obj = cls.__new__(cls)
         obj.name = name
         obj.components = []
+        obj._componentCache = {}
         obj.transform = None
         obj.scene = None
         return obj
@@ -228,8 +237,22 @@ class GameObject(SavesProjectID):
         component.__init__()
 
         self.components.append(component)
+        self._componentCache.clear()
+        self._syncOctree()
         return component
 
+    def _syncOctree(self):
+        if self.scene is not None and self.scene.octree is not None:
+            self.scene.octree.Sync(self)
+
+    def _getCachedComponents(self, componentClass):
+        cached = self._componentCache.get(componentClass)
+        if cached is None:
+            cached = tuple(cpnt for cpnt in self.components
+                           if isinstance(cpnt, componentClass))
+            self._componentCache[componentClass] = cached
+        return cached
+
     def GetComponent(self, componentClass):
         """
         Gets a component from the GameObject. Will return first match.
@@ -247,10 +270,9 @@ class GameObject(SavesProjectID):
             The specified component, or ``None`` if the component is not found
 
         """
-        for component in self.components:
-            if isinstance(component, componentClass):
-                return component
-
+        components = self._getCachedComponents(componentClass)
+        if len(components):
+            return components[0]
         return None
 
     def RemoveComponent(self, componentClass):
@@ -281,6 +303,8 @@ class GameObject(SavesProjectID):
             raise ComponentException(
                 "Cannot remove a Transform from a GameObject")
         self.components.remove(component)
+        self._componentCache.clear()
+        self._syncOctree()
 
     def GetComponents(self, componentClass):
         """
@@ -298,7 +322,7 @@ class GameObject(SavesProjectID):
 
         """
 
-        return [cpnt for cpnt in self.components if isinstance(cpnt, componentClass)]
+        return list(self._getCachedComponents(componentClass))
 
     def RemoveComponents(self, componentClass):
         """
@@ -321,6 +345,8 @@ class GameObject(SavesProjectID):
                 "Cannot remove a Transform from a GameObject")
         for component in components:
             self.components.remove(component)
+        self._componentCache.clear()
+        self._syncOctree()
 
     def __repr__(self):
         return (f"<GameObject name={self.name!r} components="
@@ -692,9 +718,13 @@ class Transform(SingleComponent):
         self.hasChanged = False
         self.children = []
         self.modelMatrix = None
+        self.normalMatrix = None
 
     def _setChanged(self):
         self.hasChanged = True
+        scene = self.gameObject.scene
+        if scene is not None and scene.octree is not None:
+            scene.octree.dirty.add(self)
         for child in self.children:
             child._setChanged()
 
@@ -4,19 +4,27 @@
 
 __all__ = ["Event", "EventLoopManager", "EventLoop", "WaitFor", "WaitForSeconds",
            "WaitForEventLoop", "WaitForUpdate", "WaitForFixedUpdate",
-           "WaitForRender", "StartCoroutine"]
+           "WaitForRender", "StartCoroutine", "Job", "JobScheduler",
+           "ScheduleJob", "RunInThreadPool", "RunInProcessPool",
+           "CooperativeEventLoopManager", "TimerWheel", "Timers",
+           "WaitForSecondsRealtime", "WaitForFrames", "GCPolicy"]
 
 from . import Logger, config
 from .core import Component, GameObject
 from .errors import PyUnityException
-from .values import Clock, SavableStruct, StructEntry
+from .values import Clock, FrameStats, SavableStruct, StructEntry
+import gc
 import sys
+import math
 import time
 import signal
 import asyncio
+import heapq
 import inspect
+import itertools
 import functools
 import threading
+import concurrent.futures
 
 # TODO: support kwargs=StructEntry(dict, required=True)
 # see issue #72 in github
@@ -93,6 +101,9 @@ class EventLoopManager:
     exceptions = []
     exceptionLock = threading.RLock()
     waitingLock = threading.RLock()
+    poolLock = threading.Lock()
+    threadPool = None
+    processPool = None
 
     def __init__(self):
         self.threads = []
@@ -104,6 +115,10 @@ class EventLoopManager:
         self.mainLoop = None
         self.mainWaitFor = None
         self.running = False
+        self.jobs = JobScheduler()
+        self.timers = Timers()
+        self.frameStats = {}
+        self.gcPolicy = config.gcPolicy
 
     def schedule(self, *funcs, main=False, ups=None, waitFor=None):
         functions = list(funcs)
@@ -122,9 +137,12 @@ class EventLoopManager:
             self.waiting[waitFor] = []
             loop = EventLoop()
             self.loops.append(loop)
+            clock = Clock()
+            self.frameStats[waitFor] = clock.stats
+            if waitFor is WaitForUpdate:
+                clock.idleCallback = self.idle
 
             def inner():
-                clock = Clock()
                 clock.Start(ups)
                 while self.running:
                     with EventLoopManager.waitingLock:
@@ -167,6 +185,8 @@ class EventLoopManager:
         EventLoopManager.current = self
 
         self.waiting[self.mainWaitFor] = []
+        if self.updates:
+            self.frameStats[self.mainWaitFor] = FrameStats()
 
         for loop in self.separateLoops:
             loop.call_soon(loop.stop)
@@ -179,6 +199,74 @@ class EventLoopManager:
 
         self.mainLoop = EventLoop()
         asyncio.set_event_loop(self.mainLoop)
+        if self.gcPolicy is not None:
+            self.gcPolicy.Start()
+
+    def begin(self, *waitFors):
+        """
+        Makes this the running manager without starting
+        any threads, so that the caller can run every
+        update itself with :meth:`step`. Set
+        :attr:`mainLoop` before the first step.
+
+        Parameters
+        ----------
+        *waitFors : type
+            WaitFor classes that :meth:`step` is called with
+
+        Raises
+        ------
+        PyUnityException
+            If another manager is running
+
+        """
+        if EventLoopManager.current is not None:
+            raise PyUnityException("Only one EventLoopManager can be running")
+        EventLoopManager.current = self
+        self.waiting = {waitFor: [] for waitFor in (None,) + waitFors}
+        self.timers.singleThreaded = True
+
+    def step(self, waitFor, *funcs):
+        """
+        Runs one update on the calling thread, after
+        :meth:`begin`. Coroutines waiting for ``waitFor``
+        are released, each function is called with
+        :attr:`mainLoop`, pending events are triggered and
+        :attr:`mainLoop` is run until it has nothing left
+        to do.
+
+        Parameters
+        ----------
+        waitFor : type or None
+            WaitFor class of the update
+        *funcs : Callable[[EventLoop], None]
+            Functions to call
+
+        Raises
+        ------
+        ChangeScene
+            If the scene was changed during the update
+
+        """
+        for waiter in list(self.waiting[waitFor]):
+            waiter.event.set()
+        for func in funcs:
+            func(self.mainLoop)
+        for event in self.pending:
+            event.trigger()
+        self.pending.clear()
+        self.mainLoop.call_soon(self.mainLoop.stop)
+        self.mainLoop.run_forever()
+        EventLoopManager.handleExceptions()
+
+    def idle(self, remaining):
+        """
+        Called at the end of every update with the time
+        left until the next update.
+
+        """
+        if self.gcPolicy is not None:
+            self.gcPolicy.Idle(remaining)
 
     @classmethod
     def handleExceptions(cls):
@@ -203,6 +291,50 @@ class EventLoopManager:
                         Logger.LogException(exception)
                     cls.exceptions.clear()
 
+    @classmethod
+    def getThreadPool(cls):
+        """
+        Gets the shared thread pool, creating it with
+        :attr:`config.threadPoolWorkers` workers if needed.
+
+        """
+        with cls.poolLock:
+            if cls.threadPool is None:
+                cls.threadPool = concurrent.futures.ThreadPoolExecutor(
+                    config.threadPoolWorkers, thread_name_prefix="PyUnity")
+            return cls.threadPool
+
+    @classmethod
+    def getProcessPool(cls):
+        """
+        Gets the shared process pool, creating it with
+        :attr:`config.processPoolWorkers` workers if needed.
+
+        """
+        with cls.poolLock:
+            if cls.processPool is None:
+                cls.processPool = concurrent.futures.ProcessPoolExecutor(
+                    config.processPoolWorkers)
+            return cls.processPool
+
+    @classmethod
+    def shutdownPools(cls):
+        """
+        Shuts down the shared thread and process pools
+        without waiting for running work to finish. This is
+        done when a :class:`Runner` quits, and not on scene
+        changes, so that work started in one scene can
+        finish in the next.
+
+        """
+        with cls.poolLock:
+            pools = (cls.threadPool, cls.processPool)
+            cls.threadPool = None
+            cls.processPool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=False)
+
     def updateEvents(self):
         with EventLoopManager.waitingLock:
             for waiter in self.waiting[self.mainWaitFor]:
@@ -216,6 +348,8 @@ class EventLoopManager:
         self.pending.clear()
 
     def update(self):
+        if self.updates:
+            self.frameStats[self.mainWaitFor].Tick()
         EventLoopManager.handleExceptions()
         self.updateEvents()
         self.mainLoop.call_soon(self.mainLoop.stop)
@@ -233,9 +367,372 @@ class EventLoopManager:
         self.pending = []
         self.updates = []
         self.mainLoop = None
+        self.jobs.Clear()
+        self.timers.Clear()
+        if self.gcPolicy is not None:
+            self.gcPolicy.Stop()
 
         EventLoopManager.current = None
 
+class _Schedule:
+    def __init__(self, functions, ups, waitFor, loop):
+        self.functions = functions
+        self.period = 1 / ups if ups else 0
+        self.waitFor = waitFor
+        self.loop = loop
+        self.stats = FrameStats()
+
+class CooperativeEventLoopManager(EventLoopManager):
+    """
+    EventLoopManager that runs every schedule on the
+    calling thread instead of one thread per schedule.
+    Schedules are kept in a queue ordered by when they
+    are next due, and the main updates are run after
+    every due schedule. Pass it as the ``managerClass``
+    of :meth:`Runner.load` to use it.
+
+    Notes
+    -----
+    As nothing runs in parallel, a slow schedule delays
+    the others. This avoids the thread switches and lock
+    contention of :class:`EventLoopManager`, which cannot
+    run schedules in parallel anyway because of the GIL.
+
+    """
+
+    def __init__(self):
+        super(CooperativeEventLoopManager, self).__init__()
+        self.queue = []
+        self.counter = itertools.count()
+        self.cooperativeLoops = []
+        self.timers.singleThreaded = True
+
+    def schedule(self, *funcs, main=False, ups=None, waitFor=None):
+        if main:
+            super(CooperativeEventLoopManager, self).schedule(
+                *funcs, main=main, ups=ups, waitFor=waitFor)
+            return
+        if ups is None:
+            raise PyUnityException("ups argument is required if main is False")
+
+        functions = list(funcs)
+        for i in range(len(functions)):
+            sig = inspect.signature(functions[i])
+            if "loop" not in sig.parameters:
+                functions[i] = wrap(functions[i])
+
+        self.waiting[waitFor] = []
+        loop = EventLoop()
+        self.loops.append(loop)
+        entry = _Schedule(functions, ups, waitFor, loop)
+        self.frameStats[waitFor] = entry.stats
+        heapq.heappush(self.queue, (0, next(self.counter), entry))
+
+    def addLoop(self, loop):
+        self.loops.append(loop)
+        self.separateLoops.append(loop)
+        self.cooperativeLoops.append(loop)
+
+    def setup(self):
+        super(CooperativeEventLoopManager, self).setup()
+        now = time.perf_counter()
+        self.queue = [(now, order, entry) for _, order, entry in self.queue]
+        heapq.heapify(self.queue)
+
+    def runSchedule(self, entry):
+        entry.stats.Tick()
+        for waiter in self.waiting[entry.waitFor]:
+            waiter.loop.call_soon(waiter.event.set)
+
+        loop = entry.loop
+        for func in entry.functions:
+            try:
+                func(loop)
+            except Exception as e:
+                with EventLoopManager.exceptionLock:
+                    EventLoopManager.exceptions.append(e)
+                break
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+
+    def start(self):
+        self.setup()
+        while self.running:
+            now = time.perf_counter()
+            due = []
+            while self.queue and self.queue[0][0] <= now:
+                due.append(heapq.heappop(self.queue))
+            updated = False
+            for deadline, order, entry in due:
+                self.runSchedule(entry)
+                updated = updated or entry.waitFor is WaitForUpdate
+                deadline += entry.period
+                if deadline < now:
+                    # Too far behind, skip missed frames
+                    deadline = now + entry.period
+                heapq.heappush(self.queue, (deadline, order, entry))
+
+            for loop in self.cooperativeLoops:
+                loop.call_soon(loop.stop)
+                loop.run_forever()
+
+            if updated:
+                if self.updates or not self.queue:
+                    self.idle(0)
+                else:
+                    self.idle(max(self.queue[0][0] - time.perf_counter(), 0))
+
+            if self.updates:
+                self.update()
+            else:
+                EventLoopManager.handleExceptions()
+                if self.queue:
+                    wait = self.queue[0][0] - time.perf_counter()
+                    if wait > 0:
+                        time.sleep(wait)
+
+    def quit(self):
+        super(CooperativeEventLoopManager, self).quit()
+        self.queue = []
+        self.cooperativeLoops = []
+
+class Job:
+    """
+    Work item submitted to a :class:`JobScheduler`.
+    Awaiting a Job waits until it has finished and
+    returns its result.
+
+    Attributes
+    ----------
+    priority : int
+        Jobs with a higher priority are run first
+    done : bool
+        Whether the job has finished, failed or
+        been cancelled
+    result : Any
+        Return value of the job once it has finished
+    exception : Exception or None
+        Exception raised by the job, if any
+
+    """
+
+    def __init__(self, func, args, kwargs, priority):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.done = False
+        self.cancelled = False
+        self.result = None
+        self.exception = None
+        self.generator = None
+        self.waiters = []
+        self.lock = threading.Lock()
+
+    def step(self):
+        """
+        Runs the job, or the next slice of it if it is a
+        generator. Returns True when the job has finished.
+
+        """
+        try:
+            if self.generator is None:
+                result = self.func(*self.args, **self.kwargs)
+                if not inspect.isgenerator(result):
+                    self.finish(result)
+                    return True
+                self.generator = result
+            next(self.generator)
+        except StopIteration as e:
+            self.finish(e.value)
+            return True
+        except Exception as e:
+            self.finish(None, e)
+            return True
+        return False
+
+    def finish(self, result, exception=None, cancelled=False):
+        with self.lock:
+            if self.done:
+                # Cancelled while the last slice was running
+                return
+            self.cancelled = cancelled
+            self.result = result
+            self.exception = exception
+            self.done = True
+            waiters, self.waiters = self.waiters, []
+        if exception is not None and not waiters:
+            with EventLoopManager.exceptionLock:
+                EventLoopManager.exceptions.append(exception)
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(Job._resolve, future)
+
+    @staticmethod
+    def _resolve(future):
+        if not future.done():
+            future.set_result(None)
+
+    def Cancel(self):
+        """
+        Cancel the job. If the job is a generator that has
+        already started, it is closed by the scheduler
+        before its next slice. Safe to call while a slice
+        of the job is running on another thread.
+
+        """
+        self.finish(None, cancelled=True)
+
+    def close(self):
+        if self.generator is not None:
+            self.generator.close()
+
+    def __await__(self):
+        with self.lock:
+            if not self.done:
+                loop = asyncio.get_running_loop()
+                future = loop.create_future()
+                self.waiters.append((loop, future))
+            else:
+                future = None
+        if future is not None:
+            yield from future.__await__()
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+class JobScheduler:
+    """
+    Runs work items submitted by Behaviours after every
+    update, within a per-frame time budget. Jobs that do
+    not fit in the budget are carried over to the next
+    frame. A job that is a generator function is run one
+    ``yield`` at a time, so long jobs can be sliced
+    across frames.
+
+    Parameters
+    ----------
+    budget : float, optional
+        Time in seconds that jobs may take each frame.
+        Defaults to :attr:`config.jobBudget`.
+
+    Attributes
+    ----------
+    ran : int
+        Number of job slices run in the last frame
+    carried : int
+        Number of jobs carried over in the last frame
+
+    Notes
+    -----
+    At least one slice is run every frame so that jobs
+    always progress, even if that slice takes longer
+    than the budget.
+
+    """
+
+    def __init__(self, budget=None):
+        self.budget = budget
+        self.queue = []
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.ran = 0
+        self.carried = 0
+
+    def __len__(self):
+        return len(self.queue)
+
+    def Submit(self, func, *args, priority=0, **kwargs):
+        """
+        Submit a job.
+
+        Parameters
+        ----------
+        func : Callable
+            Function or generator function to run
+        *args
+            Positional arguments for ``func``
+        priority : int, optional
+            Jobs with a higher priority are run first.
+            Jobs with the same priority run in the order
+            they were submitted. Defaults to 0.
+        **kwargs
+            Keyword arguments for ``func``
+
+        Returns
+        -------
+        Job
+            The submitted job
+
+        """
+        job = Job(func, args, kwargs, priority)
+        with self.lock:
+            heapq.heappush(self.queue, (-priority, next(self.counter), job))
+        return job
+
+    def run(self, loop=None, slices=None):
+        """
+        Runs jobs until the budget for this frame is used.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop, optional
+            Unused, for use with :meth:`EventLoopManager.schedule`
+        slices : int, optional
+            If provided, run this many slices instead of
+            using the time budget, or fewer if the queue
+            runs out. The same jobs are then run every time,
+            however fast the machine is.
+
+        """
+        budget = config.jobBudget if self.budget is None else self.budget
+        deadline = time.perf_counter() + budget
+        self.ran = 0
+        while True:
+            with self.lock:
+                if not self.queue:
+                    break
+                if slices is not None:
+                    if self.ran >= slices:
+                        break
+                elif self.ran and time.perf_counter() >= deadline:
+                    break
+                entry = heapq.heappop(self.queue)
+            job = entry[2]
+            if job.done:
+                # Cancelled, possibly while a slice was running
+                job.close()
+                continue
+            self.ran += 1
+            if not job.step():
+                with self.lock:
+                    heapq.heappush(self.queue, entry)
+        self.carried = len(self.queue)
+
+    def Clear(self):
+        """Cancels all queued jobs."""
+        with self.lock:
+            queue, self.queue = self.queue, []
+        for _, _, job in queue:
+            # Queued jobs are not running, so they can be closed now
+            job.Cancel()
+            job.close()
+
+def ScheduleJob(func, *args, priority=0, **kwargs):
+    """
+    Submit a job to the scheduler of the running
+    :class:`EventLoopManager`. See :meth:`JobScheduler.Submit`.
+
+    Raises
+    ------
+    PyUnityException
+        If there is no EventLoopManager running
+
+    """
+    if EventLoopManager.current is None:
+        raise PyUnityException("No EventLoopManager running")
+    return EventLoopManager.current.jobs.Submit(
+        func, *args, priority=priority, **kwargs)
+
 class EventLoop(asyncio.SelectorEventLoop):
     def __init__(self, selector=None):
         super(EventLoop, self).__init__(selector)
@@ -273,16 +770,509 @@ def StartCoroutine(coro):
 class WaitFor:
     pass
 
+class GCPolicy:
+    """
+    Controls the cyclic garbage collector while a scene
+    is running, to avoid collections in the middle of a
+    frame. Set :attr:`config.gcPolicy` to an instance to
+    use it, or set the ``gcPolicy`` attribute of an
+    :class:`EventLoopManager` before it is started.
+
+    Parameters
+    ----------
+    freeze : bool, optional
+        Move every object that exists once the scene has
+        loaded into the permanent generation with
+        :func:`gc.freeze`, so that collections skip them.
+        Defaults to True.
+    disableFull : bool, optional
+        Stop the collector from running full (generation 2)
+        collections by itself. Defaults to True.
+    idleCollect : bool, optional
+        Run young generation collections at the end of an
+        update when there is at least ``minIdle`` seconds
+        until the next one, and full collections when
+        there is at least ``fullIdle`` seconds. Defaults
+        to True.
+    minIdle : float, optional
+        By default 0.001
+    fullIdle : float, optional
+        By default 0.008
+
+    Attributes
+    ----------
+    pauses : FrameStats
+        Time spent in collections started by the
+        collector itself during each update
+    idlePauses : FrameStats
+        Time spent in idle collections during each update
+    collections : list
+        Number of collections of each generation
+    totalPause : float
+        Total time spent in collections
+
+    """
+
+    def __init__(self, freeze=True, disableFull=True, idleCollect=True,
+                 minIdle=0.001, fullIdle=0.008):
+        self.freeze = freeze
+        self.disableFull = disableFull
+        self.idleCollect = idleCollect
+        self.minIdle = minIdle
+        self.fullIdle = fullIdle
+        self.pauses = FrameStats()
+        self.idlePauses = FrameStats()
+        self.collections = [0, 0, 0]
+        self.totalPause = 0
+        self.running = False
+        self.threshold = None
+        self.framePause = 0
+        self.frameIdlePause = 0
+        self.collectStart = None
+        self.idling = False
+
+    def Start(self):
+        """Applies the policy. Called once the scene has loaded."""
+        if self.running:
+            return
+        self.running = True
+        gc.callbacks.append(self.callback)
+        if self.freeze and hasattr(gc, "freeze"):
+            gc.collect()
+            gc.freeze()
+        self.threshold = gc.get_threshold()
+        if self.disableFull:
+            # Generation 2 is only collected after this many
+            # generation 1 collections
+            gc.set_threshold(self.threshold[0], self.threshold[1], 2 ** 30)
+
+    def Stop(self):
+        """Restores the collector to how it was before :meth:`Start`."""
+        if not self.running:
+            return
+        self.running = False
+        gc.callbacks.remove(self.callback)
+        gc.set_threshold(*self.threshold)
+        if self.freeze and hasattr(gc, "unfreeze"):
+            gc.unfreeze()
+
+    def Idle(self, remaining):
+        """
+        Ends the current frame, collecting if there is
+        enough time left.
+
+        Parameters
+        ----------
+        remaining : float
+            Time in seconds until the next update
+
+        """
+        if self.running and self.idleCollect and remaining >= self.minIdle:
+            count = gc.get_count()
+            generation = None
+            if remaining >= self.fullIdle and count[2] >= self.threshold[2]:
+                generation = 2
+            elif count[1] >= self.threshold[1]:
+                generation = 1
+            elif count[0] >= self.threshold[0] // 2:
+                generation = 0
+            if generation is not None:
+                self.idling = True
+                try:
+                    gc.collect(generation)
+                finally:
+                    self.idling = False
+
+        self.pauses.Record(self.framePause)
+        self.idlePauses.Record(self.frameIdlePause)
+        self.framePause = 0
+        self.frameIdlePause = 0
+
+    def callback(self, phase, info):
+        if phase == "start":
+            self.collectStart = time.perf_counter()
+        elif self.collectStart is not None:
+            pause = time.perf_counter() - self.collectStart
+            self.collectStart = None
+            self.totalPause += pause
+            self.collections[info["generation"]] += 1
+            if self.idling:
+                self.frameIdlePause += pause
+            else:
+                self.framePause += pause
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel counting in whole ticks.
+    Each level has ``2 ** bits`` slots, and every slot of
+    a level spans a full rotation of the level below.
+    Adding a timer is constant time, and timers are
+    moved down a level only when their slot is reached.
+
+    Parameters
+    ----------
+    bits : int, optional
+        Number of bits of the tick used by each level,
+        by default 6
+    levels : int, optional
+        Number of levels, by default 4. Timers further
+        away than ``2 ** (bits * levels)`` ticks are kept
+        in an overflow heap.
+
+    Attributes
+    ----------
+    current : int
+        Number of ticks advanced so far
+
+    """
+
+    def __init__(self, bits=6, levels=4):
+        self.bits = bits
+        self.size = 1 << bits
+        self.mask = self.size - 1
+        self.levels = levels
+        self.range = 1 << (bits * levels)
+        self.wheels = [[[] for _ in range(self.size)] for _ in range(levels)]
+        self.overflow = []
+        self.counter = itertools.count()
+        self.current = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def Schedule(self, delay, item):
+        """
+        Add an item that expires after ``delay`` ticks.
+        A delay below 1 expires on the next tick.
+
+        """
+        self._insert(self.current + max(delay, 1), item)
+        self.count += 1
+
+    def _insert(self, tick, item):
+        delta = tick - self.current
+        for level in range(self.levels):
+            if delta < 1 << (self.bits * (level + 1)):
+                slot = (tick >> (self.bits * level)) & self.mask
+                self.wheels[level][slot].append((tick, item))
+                return
+        heapq.heappush(self.overflow, (tick, next(self.counter), item))
+
+    def Advance(self, ticks):
+        """
+        Advance the wheel.
+
+        Parameters
+        ----------
+        ticks : int
+            Number of ticks to advance by
+
+        Returns
+        -------
+        list
+            Items that expired, in order of expiry
+
+        """
+        expired = []
+        target = self.current + ticks
+        while self.current < target:
+            if self.count == 0:
+                self.current = target
+                break
+            self.current += 1
+            tick = self.current
+
+            if tick % self.range == 0:
+                while self.overflow and self.overflow[0][0] - tick < self.range:
+                    entry = heapq.heappop(self.overflow)
+                    self._insert(entry[0], entry[2])
+            for level in range(self.levels - 1, 0, -1):
+                if tick & ((1 << (self.bits * level)) - 1):
+                    continue
+                slot = (tick >> (self.bits * level)) & self.mask
+                entries = self.wheels[level][slot]
+                self.wheels[level][slot] = []
+                for entry in entries:
+                    self._insert(*entry)
+
+            slot = tick & self.mask
+            entries = self.wheels[0][slot]
+            if entries:
+                self.wheels[0][slot] = []
+                self.count -= len(entries)
+                expired.extend(item for _, item in entries)
+        return expired
+
+    def Clear(self):
+        """Remove all timers."""
+        for wheel in self.wheels:
+            for slot in wheel:
+                slot.clear()
+        self.overflow.clear()
+        self.count = 0
+
+class Timers:
+    """
+    Engine-level timers of an :class:`EventLoopManager`,
+    used by :class:`WaitForSeconds`,
+    :class:`WaitForSecondsRealtime` and :class:`WaitForFrames`.
+    Timers are kept in :class:`TimerWheel` objects, which are
+    advanced once per update by :meth:`Tick`, and all
+    expired waiters of a loop are resumed in one batch.
+
+    Attributes
+    ----------
+    resolution : float
+        Length in seconds of one tick of the game time
+        and real time wheels
+    gameTime : float
+        Sum of the ``dt`` of every update
+    frame : int
+        Number of updates
+    singleThreaded : bool
+        If True, waiters are resumed directly instead of
+        through :meth:`asyncio.loop.call_soon_threadsafe`, so
+        that they run in the same update. Only set this when
+        every event loop is run on the updating thread.
+
+    """
+
+    resolution = 0.001
+
+    def __init__(self):
+        self.singleThreaded = False
+        self.lock = threading.Lock()
+        self.gameTime = 0
+        self.realStart = time.perf_counter()
+        self.frame = 0
+        self.gameWheel = TimerWheel()
+        self.realWheel = TimerWheel()
+        self.frameWheel = TimerWheel()
+
+    def __len__(self):
+        return len(self.gameWheel) + len(self.realWheel) + len(self.frameWheel)
+
+    def _wait(self, wheel, delay):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self.lock:
+            wheel.Schedule(delay, (loop, future))
+        return future
+
+    def _ticks(self, length, roundUp=False):
+        # Allow for floating point error when summing dt
+        if roundUp:
+            return math.ceil(length / self.resolution - 1e-6)
+        return math.floor(length / self.resolution + 1e-6)
+
+    def WaitGame(self, length):
+        """
+        Future that completes with the game time after
+        ``length`` seconds of game time.
+
+        """
+        with self.lock:
+            target = self._ticks(self.gameTime + length, True)
+            delay = target - self.gameWheel.current
+        return self._wait(self.gameWheel, delay)
+
+    def WaitRealtime(self, length):
+        """
+        Future that completes with the game time after
+        ``length`` seconds of real time.
+
+        """
+        with self.lock:
+            target = self._ticks(time.perf_counter() - self.realStart + length, True)
+            delay = target - self.realWheel.current
+        return self._wait(self.realWheel, delay)
+
+    def WaitFrames(self, frames):
+        """
+        Future that completes with the game time after
+        ``frames`` updates.
+
+        """
+        return self._wait(self.frameWheel, frames)
+
+    def Tick(self, dt):
+        """
+        Advance all timers and resume the expired waiters.
+
+        Parameters
+        ----------
+        dt : float
+            Game time since the last update
+
+        """
+        with self.lock:
+            self.gameTime += dt
+            self.frame += 1
+            now = time.perf_counter() - self.realStart
+            expired = self.gameWheel.Advance(
+                self._ticks(self.gameTime) - self.gameWheel.current)
+            expired.extend(self.realWheel.Advance(
+                self._ticks(now) - self.realWheel.current))
+            expired.extend(self.frameWheel.Advance(1))
+
+        batches = {}
+        for loop, future in expired:
+            batches.setdefault(loop, []).append(future)
+        for loop, futures in batches.items():
+            if self.singleThreaded:
+                Timers._resolve(futures, self.gameTime)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(Timers._resolve, futures, self.gameTime)
+
+    @staticmethod
+    def _resolve(futures, gameTime):
+        for future in futures:
+            if not future.done():
+                future.set_result(gameTime)
+
+    def Clear(self):
+        """Remove all timers without resuming their waiters."""
+        with self.lock:
+            self.gameWheel.Clear()
+            self.realWheel.Clear()
+            self.frameWheel.Clear()
+
 class WaitForSeconds(WaitFor):
+    """
+    Awaitable that waits for a length of game time,
+    which is the sum of the ``dt`` of each update. It
+    returns the game time that passed. If no
+    :class:`EventLoopManager` is running, the wall clock
+    is used instead.
+
+    Parameters
+    ----------
+    length : float
+        Time to wait in seconds
+
+    Notes
+    -----
+    Before game time was used, the wall clock time that
+    passed was returned. Use :class:`WaitForSecondsRealtime`
+    to wait for and get wall clock time.
+
+    """
+
     def __init__(self, length):
         self.length = length
 
+    def __await__(self):
+        manager = EventLoopManager.current
+        if manager is None:
+            start = time.perf_counter()
+            sleep = asyncio.sleep(self.length)
+            yield from sleep.__await__()
+            return time.perf_counter() - start
+        start = manager.timers.gameTime
+        end = yield from manager.timers.WaitGame(self.length).__await__()
+        return end - start
+
+class WaitForSecondsRealtime(WaitForSeconds):
+    """
+    Awaitable that waits for a length of wall clock time,
+    checked once per update. It returns the wall clock
+    time that passed.
+
+    Parameters
+    ----------
+    length : float
+        Time to wait in seconds
+
+    """
+
     def __await__(self):
         start = time.perf_counter()
-        sleep = asyncio.sleep(self.length)
-        yield from sleep.__await__()
+        manager = EventLoopManager.current
+        if manager is None:
+            sleep = asyncio.sleep(self.length)
+            yield from sleep.__await__()
+        else:
+            yield from manager.timers.WaitRealtime(self.length).__await__()
         return time.perf_counter() - start
 
+class WaitForFrames(WaitFor):
+    """
+    Awaitable that waits for a number of updates. It
+    returns the game time that passed.
+
+    Parameters
+    ----------
+    frames : int
+        Number of updates to wait for
+
+    Raises
+    ------
+    PyUnityException
+        If no EventLoopManager is running when awaited
+
+    """
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def __await__(self):
+        manager = EventLoopManager.current
+        if manager is None:
+            raise PyUnityException("No EventLoopManager running")
+        start = manager.timers.gameTime
+        end = yield from manager.timers.WaitFrames(self.frames).__await__()
+        return end - start
+
+class RunInThreadPool(WaitFor):
+    """
+    Awaitable that runs a function in the shared thread
+    pool and resumes the coroutine on its own event loop
+    with the result.
+
+    Parameters
+    ----------
+    func : Callable
+        Function to run
+    *args
+        Positional arguments for ``func``
+    **kwargs
+        Keyword arguments for ``func``
+
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = functools.partial(func, *args, **kwargs)
+
+    def getExecutor(self):
+        return EventLoopManager.getThreadPool()
+
+    def __await__(self):
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.getExecutor(), self.func)
+        return (yield from future.__await__())
+
+class RunInProcessPool(RunInThreadPool):
+    """
+    Awaitable that runs a function in the shared process
+    pool and resumes the coroutine on its own event loop
+    with the result. The function and its arguments must
+    be picklable.
+
+    Parameters
+    ----------
+    func : Callable
+        Function to run
+    *args
+        Positional arguments for ``func``
+    **kwargs
+        Keyword arguments for ``func``
+
+    """
+
+    def getExecutor(self):
+        return EventLoopManager.getProcessPool()
+
 class WaitForEventLoop(WaitFor):
     def __init__(self):
         self.event = asyncio.Event()
@@ -8,14 +8,14 @@ Also manages project structure.
 
 """
 
-__all__ = ["Behaviour", "Texture2D", "Prefab", "Asset",
+__all__ = ["Behaviour", "Texture2D", "ClonePlan", "Prefab", "PrefabPool", "Asset",
            "File", "Project", "Skybox", "Scripts",
            "ProjectSavingContext"]
 
 from . import Logger
 from .core import Component, GameObject, SavesProjectID, Space, Transform
 from .errors import ProjectParseException, PyUnityException
-from .values import ABCMeta, abstractmethod
+from .values import ABCMeta, Quaternion, Vector2, Vector3, abstractmethod
 from PIL import Image
 import OpenGL.GL as gl
 from uuid import uuid4
@@ -25,6 +25,7 @@ from functools import wraps
 import os
 import sys
 import copy
+import enum
 import ctypes
 import textwrap
 
@@ -311,6 +312,7 @@ class Texture2D(Asset):
             self.imgData = self.img.tobytes()
         else:
             raise TypeError(f"Expected str, Path or Image: got {type(pathOrImg).__name__}")
+        self.transparent = Texture2D.hasTransparency(self.img)
         self.loaded = False
         self.texture = None
         self.mipmaps = False
@@ -344,6 +346,11 @@ class Texture2D(Asset):
         self.img = im
         self.path = None
         self.imgData = self.img.tobytes()
+        self.transparent = Texture2D.hasTransparency(self.img)
+
+    @staticmethod
+    def hasTransparency(img):
+        return img.mode == "RGBA" and img.getextrema()[3][0] < 255
 
     def use(self):
         """
@@ -370,6 +377,7 @@ class Texture2D(Asset):
         obj = cls.__new__(cls)
         obj.loaded = True
         obj.texture = texture
+        obj.transparent = False
         return obj
 
 class Skybox:
@@ -436,8 +444,214 @@ class Skybox:
             gl.glBindTexture(gl.GL_TEXTURE_CUBE_MAP, self.texture)
             gl.glBindVertexArray(self.vao)
 
+class ClonePlan:
+    """
+    Precomputed set of steps to clone a group of
+    GameObjects without using :func:`copy.deepcopy`.
+
+    References to GameObjects and Components inside the
+    group are remapped to the new objects, Assets and
+    immutable values are shared, and any other values
+    are deep-copied.
+
+    Parameters
+    ----------
+    gameObjects : list
+        GameObjects to clone. Every descendant of a GameObject
+        should also be in the list.
+    savedOnly : bool, optional
+        If True, each Component is recreated with
+        :meth:`GameObject.AddComponent` and only its saved
+        attributes are copied, similar to when a Scene is
+        saved and loaded. If False, every attribute of the
+        GameObjects and Components is copied without calling
+        ``__init__``, like :func:`copy.deepcopy`. Defaults
+        to True.
+
+    Attributes
+    ----------
+    gameObjects : list
+        The template GameObjects
+    savedOnly : bool
+        Whether only saved attributes are copied
+
+    Notes
+    -----
+    The plan holds references to the values in the
+    template, and so replacing an attribute of the
+    template after the plan is made will not be reflected
+    in new clones.
+
+    """
+
+    SHARE = 0
+    REMAP = 1
+    DEEPCOPY = 2
+
+    immutable = (type(None), bool, int, float, complex, str, bytes,
+                 enum.Enum, type, Vector2, Vector3, Quaternion)
+    ignored = ["gameObject", "transform", "components", "_componentCache", "scene"]
+
+    def __init__(self, gameObjects, savedOnly=True):
+        self.gameObjects = list(gameObjects)
+        self.savedOnly = savedOnly
+        self._included = set()
+        for gameObject in self.gameObjects:
+            self._included.add(id(gameObject))
+            for component in gameObject.components:
+                self._included.add(id(component))
+
+        self._creation = []
+        self._attrs = []
+        self._children = []
+        for gameObject in self.gameObjects:
+            components = []
+            for component in gameObject.components:
+                components.append((component, type(component), component.enabled))
+                if savedOnly:
+                    for k in component._saved:
+                        if hasattr(component, k):
+                            self._addAttr(component, k, getattr(component, k))
+                    if isinstance(component, Transform):
+                        children = [id(child) for child in component.children
+                                    if id(child) in self._included]
+                        self._children.append((id(component), children))
+                else:
+                    for k, v in component.__dict__.items():
+                        if k not in ClonePlan.ignored:
+                            self._addAttr(component, k, v)
+            if not savedOnly:
+                for k, v in gameObject.__dict__.items():
+                    if k not in ClonePlan.ignored:
+                        self._addAttr(gameObject, k, v)
+            self._creation.append(
+                (gameObject, gameObject.name, gameObject.tag, gameObject.enabled, components))
+        del self._included
+
+    def _addAttr(self, obj, name, value):
+        if isinstance(value, (GameObject, Component)):
+            if id(value) in self._included:
+                mode = ClonePlan.REMAP
+            else:
+                mode = ClonePlan.SHARE
+        elif isinstance(value, ClonePlan.immutable + (Asset, Skybox)):
+            mode = ClonePlan.SHARE
+        else:
+            mode = ClonePlan.DEEPCOPY
+        self._attrs.append((id(obj), name, mode, value))
+
+    def Execute(self, memo=None):
+        """
+        Create new GameObjects from the plan. The new
+        GameObjects are not part of any Scene.
+
+        Parameters
+        ----------
+        memo : dict, optional
+            If provided, this is filled with the ``id`` of
+            every template object mapped to its clone, in the
+            same way as the ``memo`` of :func:`copy.deepcopy`.
+
+        Returns
+        -------
+        list
+            New GameObjects, in the same order as
+            :attr:`gameObjects`
+
+        """
+        if memo is None:
+            memo = {}
+        gameObjects = []
+        for template, name, tag, enabled, components in self._creation:
+            if self.savedOnly:
+                gameObject = GameObject.BareObject(name)
+                gameObject.tag = tag
+                gameObject.enabled = enabled
+            else:
+                gameObject = GameObject.__new__(type(template))
+                gameObject.components = []
+                gameObject._componentCache = {}
+                gameObject.scene = None
+            memo[id(template)] = gameObject
+
+            for original, componentClass, componentEnabled in components:
+                if self.savedOnly:
+                    component = gameObject.AddComponent(componentClass)
+                    component.enabled = componentEnabled
+                else:
+                    component = Component.__new__(componentClass)
+                    component.gameObject = gameObject
+                    gameObject.components.append(component)
+                if componentClass is Transform:
+                    gameObject.transform = component
+                memo[id(original)] = component
+            for component in gameObject.components:
+                component.transform = gameObject.transform
+            gameObjects.append(gameObject)
+
+        self._assign(memo)
+        return gameObjects
+
+    def Apply(self, instances):
+        """
+        Reset existing clones to the state of the plan.
+
+        Parameters
+        ----------
+        instances : dict
+            Mapping of the ``id`` of every template GameObject
+            and Component to its clone
+
+        """
+        for template, name, tag, enabled, components in self._creation:
+            gameObject = instances[id(template)]
+            gameObject.name = name
+            gameObject.tag = tag
+            gameObject.enabled = enabled
+            for original, _, componentEnabled in components:
+                instances[id(original)].enabled = componentEnabled
+        self._assign(dict(instances))
+
+    def _assign(self, memo):
+        for objectID, name, mode, value in self._attrs:
+            if mode == ClonePlan.REMAP:
+                value = memo[id(value)]
+            elif mode == ClonePlan.DEEPCOPY:
+                value = copy.deepcopy(value, memo)
+            if self.savedOnly:
+                setattr(memo[objectID], name, value)
+            else:
+                memo[objectID].__dict__[name] = value
+
+        for transformID, children in self._children:
+            memo[transformID].children = [memo[child] for child in children]
+
 class Prefab(Asset):
-    """Prefab model"""
+    """
+    Prefab model.
+
+    Parameters
+    ----------
+    root : GameObject
+        Root GameObject of the prefab
+    prune : bool, optional
+        If True, the GameObjects are copied into the
+        prefab, otherwise they are used directly and
+        must not be part of a Scene. Defaults to True.
+
+    Attributes
+    ----------
+    gameObject : GameObject
+        Root GameObject of the prefab
+    gameObjects : list
+        All GameObjects in the prefab, with the root first
+    assets : list
+        Assets referenced by the prefab
+    plan : ClonePlan
+        Plan used by :meth:`Instantiate`, built when the
+        prefab is created
+
+    """
     def __init__(self, root, prune=True):
         if prune:
             self.gameObjects = []
@@ -507,6 +721,8 @@ class Prefab(Asset):
 
             self.gameObject = root
 
+        self.plan = ClonePlan(self.gameObjects)
+
     def Contains(self, obj):
         if not isinstance(obj, (GameObject, Component)):
             raise PyUnityException(
@@ -566,10 +782,14 @@ class Prefab(Asset):
             if scene is None:
                 raise PyUnityException("No scene running")
 
-        root = copy.deepcopy(self.gameObject)
+        root = self.plan.Execute()[0]
         for transform in root.transform.GetDescendants():
             scene.Add(transform.gameObject)
 
+        self._placeInstance(root, parent, position, rotation, scale, space)
+        return root
+
+    def _placeInstance(self, root, parent, position, rotation, scale, space):
         if parent is not None:
             if not isinstance(parent, (GameObject, Transform)):
                 raise PyUnityException(
@@ -592,7 +812,6 @@ class Prefab(Asset):
                 root.transform.localRotation = rotation
             if scale is not None:
                 root.transform.localScale = scale
-        return root
 
     def GetAssetFile(self, gameObject):
         return Path("Prefabs") / (gameObject.name + ".prefab")
@@ -604,6 +823,234 @@ class Prefab(Asset):
         path = ctx.project.path / ctx.filename
         ctx.savers[Prefab](self, path, ctx.project)
 
+class _PooledInstance:
+    def __init__(self, prefab, root):
+        self.plan = prefab.plan
+        self.root = root
+        self.pairs = []
+        self.memo = {}
+        templates = prefab.gameObject.transform.GetDescendants()
+        instances = root.transform.GetDescendants()
+        for template, instance in zip(templates, instances):
+            self.pairs.append((template.gameObject, instance.gameObject))
+            self.memo[id(template.gameObject)] = instance.gameObject
+            for a, b in zip(template.gameObject.components,
+                            instance.gameObject.components):
+                self.memo[id(a)] = b
+
+    def alive(self):
+        scene = self.root.scene
+        if scene is None:
+            return False
+        return all(instance.scene is scene for _, instance in self.pairs)
+
+    def matches(self):
+        descendants = list(self.root.transform.GetDescendants())
+        if len(descendants) != len(self.pairs):
+            return False
+        for (template, instance), transform in zip(self.pairs, descendants):
+            if transform.gameObject is not instance:
+                return False
+            if len(template.components) != len(instance.components):
+                return False
+        return True
+
+    def disable(self):
+        for _, instance in self.pairs:
+            instance.enabled = False
+
+    def reset(self):
+        self.plan.Apply(self.memo)
+
+class PrefabPool:
+    """
+    Pool of reusable instances of a :class:`Prefab`.
+
+    Released instances are disabled and kept in their
+    scene instead of being destroyed, and are reset to
+    the state of the prefab when they are acquired again.
+
+    Parameters
+    ----------
+    prefab : Prefab
+        Prefab to instantiate
+    capacity : int, optional
+        Maximum number of released instances to keep.
+        Instances released when the pool is full are
+        destroyed. If None, the pool is unbounded.
+
+    Attributes
+    ----------
+    prefab : Prefab
+        Prefab to instantiate
+    capacity : int or None
+        Maximum number of released instances to keep
+    created : int
+        Number of instances created by the pool
+    reused : int
+        Number of acquisitions served by a released instance
+    released : int
+        Number of instances returned to the pool
+    destroyed : int
+        Number of instances destroyed because the pool was
+        full or they could no longer be reset
+
+    Notes
+    -----
+    Only the saved attributes of each Component are
+    reset, along with the local position, rotation and
+    scale of each Transform. Any other state set by
+    Behaviours must be reset manually, for example in
+    :meth:`Behaviour.Start`, which is not called again.
+
+    """
+
+    def __init__(self, prefab, capacity=None):
+        if not isinstance(prefab, Prefab):
+            raise PyUnityException(
+                f"Expected Prefab, got {type(prefab).__name__}")
+        if capacity is not None and capacity < 0:
+            raise PyUnityException("Pool capacity cannot be negative")
+        self.prefab = prefab
+        self.capacity = capacity
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.destroyed = 0
+        self._active = {}
+        self._inactive = []
+
+    @property
+    def active(self):
+        """Number of acquired instances not yet released."""
+        return len(self._active)
+
+    @property
+    def inactive(self):
+        """Number of released instances ready to be reused."""
+        return len(self._inactive)
+
+    def _getScene(self, scene):
+        if scene is None:
+            from .scenes import SceneManager
+            scene = SceneManager.CurrentScene()
+            if scene is None:
+                raise PyUnityException("No scene running")
+        return scene
+
+    def _create(self, scene):
+        root = self.prefab.Instantiate(scene)
+        self.created += 1
+        return _PooledInstance(self.prefab, root)
+
+    def Prewarm(self, count, scene=None):
+        """
+        Create released instances ahead of time.
+
+        Parameters
+        ----------
+        count : int
+            Number of instances to create. Creation stops
+            once the pool is full.
+        scene : Scene, optional
+            The scene to create the instances in. If None,
+            the current scene is selected.
+
+        """
+        scene = self._getScene(scene)
+        for _ in range(count):
+            if self.capacity is not None and len(self._inactive) >= self.capacity:
+                break
+            instance = self._create(scene)
+            instance.disable()
+            self._inactive.append(instance)
+
+    def Acquire(self,
+                scene=None,
+                parent=None,
+                position=None,
+                rotation=None,
+                scale=None,
+                space=Space.World):
+        """
+        Get an instance of the prefab, reusing a released
+        instance if one is available. The parameters are
+        the same as :meth:`Prefab.Instantiate`.
+
+        Returns
+        -------
+        GameObject
+            The root GameObject of the instance
+
+        """
+        scene = self._getScene(scene)
+        instance = None
+        while len(self._inactive):
+            candidate = self._inactive.pop()
+            if not candidate.alive():
+                continue
+            if candidate.root.scene is not scene:
+                self._destroy(candidate)
+                continue
+            instance = candidate
+            break
+
+        if instance is None:
+            instance = self._create(scene)
+        else:
+            instance.reset()
+            self.reused += 1
+
+        self._active[instance.root] = instance
+        self.prefab._placeInstance(
+            instance.root, parent, position, rotation, scale, space)
+        return instance.root
+
+    def Release(self, gameObject):
+        """
+        Return an instance to the pool. The instance is
+        disabled, or destroyed if the pool is full.
+
+        Parameters
+        ----------
+        gameObject : GameObject
+            Root GameObject returned by :meth:`Acquire`
+
+        Raises
+        ------
+        PyUnityException
+            If the GameObject was not acquired from this pool
+
+        """
+        if gameObject not in self._active:
+            raise PyUnityException(
+                f"GameObject {gameObject.name!r} was not acquired from this pool")
+        instance = self._active.pop(gameObject)
+        self.released += 1
+        if not instance.alive():
+            return
+
+        full = self.capacity is not None and len(self._inactive) >= self.capacity
+        if full or not instance.matches():
+            self._destroy(instance)
+            return
+
+        instance.disable()
+        if instance.root.transform.parent is not None:
+            instance.root.transform.ReparentTo(None, Space.Self)
+        self._inactive.append(instance)
+
+    def Clear(self):
+        """Destroy all released instances."""
+        for instance in self._inactive:
+            if instance.alive():
+                self._destroy(instance)
+        self._inactive.clear()
+
+    def _destroy(self, instance):
+        instance.root.scene.Destroy(instance.root)
+        self.destroyed += 1
+
 class ProjectSavingContext:
     def __init__(self, asset, gameObject, project, filename=""):
         if not isinstance(asset, Asset):
@@ -16,7 +16,7 @@ from .errors import PyUnityException
 from .events import Event
 from .files import Texture2D, convert
 from .input import Input, KeyState, MouseCode
-from .meshes import RGB, Color, MeshRenderer
+from .meshes import RGB, Color
 from .render import Camera, Light, Screen
 from .resources import resolver
 from .values import (ABCMeta, SavableStruct, StructEntry, Vector2,
@@ -388,11 +388,15 @@ class RenderTarget(GuiRenderComponent):
         gl.glDepthMask(gl.GL_TRUE)
         self.source.Resize(*self.size)
 
-        renderers = self.scene.FindComponents(MeshRenderer)
+        renderers = self.scene.GetRenderers()
         lights = self.scene.FindComponents(Light)
         self.source.renderPass = True
+        visible = self.source.Cull(
+            renderers, self.source.getProjMat() * self.source.getViewMat())
         self.source.RenderDepth(renderers, lights)
-        self.source.RenderScene(renderers, lights)
+        visible = self.source.SelectLODs(visible)
+        self.source.RenderScene(visible, lights)
+        self.source.lodMeshes.clear()
         self.source.RenderSkybox()
 
         if self.canvas and self.source.canvas is not None:
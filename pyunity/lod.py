@@ -0,0 +1,360 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Levels of detail, to draw simpler meshes for objects
+that cover a small part of the screen.
+
+Example
+-------
+>>> renderer = gameObject.AddComponent(MeshRenderer)
+>>> renderer.mesh = Mesh.sphere(1, detail=64)
+>>> lodGroup = gameObject.AddComponent(LODGroup)
+>>> lodGroup.Generate(renderer.mesh, [0.5, 0.2, 0.05, 0.01])
+
+"""
+
+__all__ = ["LODGroup", "LODLevel", "SimplifyMesh"]
+
+from .core import ShowInInspector, SingleComponent
+from .errors import PyUnityException
+from .meshes import Mesh
+from .values import Vector3
+import heapq
+import math
+
+def planeQuadric(normal, point, weight):
+    a, b, c = normal
+    d = -(a * point[0] + b * point[1] + c * point[2])
+    return [weight * value for value in (
+        a * a, a * b, a * c, a * d, b * b, b * c, b * d, c * c, c * d, d * d)]
+
+def quadricError(q, x, y, z):
+    return (q[0] * x * x + 2 * q[1] * x * y + 2 * q[2] * x * z + 2 * q[3] * x +
+            q[4] * y * y + 2 * q[5] * y * z + 2 * q[6] * y +
+            q[7] * z * z + 2 * q[8] * z + q[9])
+
+def addQuadric(q, other):
+    for i in range(10):
+        q[i] += other[i]
+
+def cross(u, v):
+    return (u[1] * v[2] - u[2] * v[1],
+            u[2] * v[0] - u[0] * v[2],
+            u[0] * v[1] - u[1] * v[0])
+
+def subtract(u, v):
+    return (u[0] - v[0], u[1] - v[1], u[2] - v[2])
+
+def faceNormal(a, b, c):
+    return cross(subtract(b, a), subtract(c, a))
+
+def SimplifyMesh(mesh, ratio):
+    """
+    Builds a simplified copy of a mesh by repeatedly
+    collapsing the edge whose removal changes the shape
+    of the mesh the least, measured with quadric error
+    metrics.
+
+    Vertices are never welded, so seams where a mesh has
+    separate vertices for different normals or texture
+    coordinates are kept, and open edges are kept in
+    place.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        Mesh to simplify
+    ratio : float
+        Fraction of the triangles to keep, between 0 and 1
+
+    Returns
+    -------
+    Mesh
+        The simplified mesh
+
+    Raises
+    ------
+    PyUnityException
+        If ratio is not between 0 and 1
+
+    """
+    if not 0 < ratio <= 1:
+        raise PyUnityException("Ratio must be between 0 and 1")
+
+    positions = [tuple(vert) for vert in mesh.verts]
+    normals = [tuple(normal) for normal in mesh.normals]
+    texcoords = [tuple(texcoord) for texcoord in mesh.texcoords]
+    faces = [list(triangle) for triangle in mesh.triangles]
+    vertexFaces = [set() for _ in positions]
+    quadrics = [[0] * 10 for _ in positions]
+    edgeFaces = {}
+
+    for i, face in enumerate(faces):
+        for vertex in face:
+            vertexFaces[vertex].add(i)
+        for j in range(3):
+            edge = tuple(sorted((face[j], face[j - 1])))
+            edgeFaces.setdefault(edge, []).append(i)
+        normal = faceNormal(*(positions[vertex] for vertex in face))
+        length = math.sqrt(normal[0] ** 2 + normal[1] ** 2 + normal[2] ** 2)
+        if length == 0:
+            continue
+        # Weighted by area
+        quadric = planeQuadric(
+            [n / length for n in normal], positions[face[0]], length / 2)
+        for vertex in face:
+            addQuadric(quadrics[vertex], quadric)
+
+    for (a, b), adjacent in edgeFaces.items():
+        if len(adjacent) != 1:
+            continue
+        # Open edge, keep it in place with a plane along it
+        face = faces[adjacent[0]]
+        edge = subtract(positions[b], positions[a])
+        normal = cross(edge, faceNormal(*(positions[vertex] for vertex in face)))
+        length = math.sqrt(normal[0] ** 2 + normal[1] ** 2 + normal[2] ** 2)
+        if length == 0:
+            continue
+        weight = 100 * (edge[0] ** 2 + edge[1] ** 2 + edge[2] ** 2)
+        quadric = planeQuadric(
+            [n / length for n in normal], positions[a], weight)
+        addQuadric(quadrics[a], quadric)
+        addQuadric(quadrics[b], quadric)
+
+    versions = [0] * len(positions)
+    heap = []
+
+    def push(a, b):
+        quadric = [x + y for x, y in zip(quadrics[a], quadrics[b])]
+        midpoint = tuple((x + y) / 2 for x, y in zip(positions[a], positions[b]))
+        options = [(quadricError(quadric, *point), choice, point) for choice, point in
+                   enumerate((positions[a], positions[b], midpoint))]
+        error, choice, point = min(options)
+        heapq.heappush(heap, (error, a, b, versions[a], versions[b], choice, point))
+
+    for a, b in edgeFaces:
+        push(a, b)
+
+    def rejected(a, b, point):
+        kept = False
+        for i in vertexFaces[a] | vertexFaces[b]:
+            face = faces[i]
+            if a in face and b in face:
+                continue
+            kept = True
+            before = [positions[vertex] for vertex in face]
+            after = [point if vertex in (a, b) else positions[vertex] for vertex in face]
+            old = faceNormal(*before)
+            new = faceNormal(*after)
+            if old[0] * new[0] + old[1] * new[1] + old[2] * new[2] <= 0:
+                return True
+        # Collapsing the last faces around a vertex removes a part of the mesh
+        return not kept
+
+    remaining = len(faces)
+    target = max(1, int(len(faces) * ratio))
+    while remaining > target and heap:
+        _, a, b, versionA, versionB, choice, point = heapq.heappop(heap)
+        if versions[a] != versionA or versions[b] != versionB:
+            continue
+        if rejected(a, b, point):
+            continue
+
+        # Collapse b into a
+        for i in vertexFaces[b]:
+            face = faces[i]
+            if a in face:
+                for vertex in face:
+                    if vertex != b:
+                        vertexFaces[vertex].discard(i)
+                faces[i] = None
+                remaining -= 1
+            else:
+                face[face.index(b)] = a
+                vertexFaces[a].add(i)
+        vertexFaces[b] = set()
+        versions[b] = -1
+
+        positions[a] = point
+        if choice == 1:
+            normals[a] = normals[b]
+            texcoords[a] = texcoords[b]
+        elif choice == 2:
+            normals[a] = tuple(x + y for x, y in zip(normals[a], normals[b]))
+            texcoords[a] = tuple((x + y) / 2 for x, y in zip(texcoords[a], texcoords[b]))
+        addQuadric(quadrics[a], quadrics[b])
+        versions[a] += 1
+
+        neighbours = set()
+        for i in vertexFaces[a]:
+            neighbours.update(faces[i])
+        neighbours.discard(a)
+        for vertex in neighbours:
+            push(a, vertex)
+
+    indices = {}
+    triangles = []
+    for face in faces:
+        if face is not None:
+            triangles.append([indices.setdefault(vertex, len(indices)) for vertex in face])
+    verts = [Vector3(*positions[vertex]) for vertex in indices]
+    newNormals = [Vector3(*normals[vertex]).normalized() for vertex in indices]
+    newTexcoords = [list(texcoords[vertex]) for vertex in indices]
+    return Mesh(verts, triangles, newNormals, newTexcoords)
+
+class LODLevel:
+    """
+    One level of an :class:`LODGroup`.
+
+    Attributes
+    ----------
+    mesh : Mesh
+        Mesh drawn at this level
+    screenSize : float
+        Smallest fraction of the height of the screen
+        covered by the bounding sphere of the renderer
+        for which this level is used
+
+    """
+
+    def __init__(self, mesh, screenSize):
+        self.mesh = mesh
+        self.screenSize = screenSize
+
+    def __deepcopy__(self, memo):
+        return LODLevel(self.mesh, self.screenSize)
+
+    def __repr__(self):
+        return f"<LODLevel screenSize={self.screenSize}>"
+
+class LODGroup(SingleComponent):
+    """
+    Component that picks the mesh that the MeshRenderer on
+    its GameObject is drawn with each frame, from the size
+    of the renderer on the screen. The ``mesh`` of the
+    renderer is not changed, and shadows are drawn with it.
+    Below the smallest screen size of the levels, the
+    renderer is not drawn.
+
+    Attributes
+    ----------
+    levels : List[LODLevel]
+        Levels from the most to the least detailed.
+        Not saved, similar to :attr:`Camera.customProjMat`.
+    current : int
+        Index of the level that was last selected. Equal
+        to the number of levels if the renderer was not
+        drawn.
+    hysteresis : float
+        Fraction by which the screen size must go past a
+        level's screen size before the level is changed,
+        to stop the mesh from switching back and forth
+        near a threshold. Defaults to 0.1.
+
+    """
+
+    hysteresis = ShowInInspector(float, 0.1)
+
+    def __init__(self):
+        super(LODGroup, self).__init__()
+        self.levels = []
+        self.current = 0
+
+    def AddLevel(self, mesh, screenSize):
+        """
+        Adds a level that is less detailed than all of
+        the current levels.
+
+        Parameters
+        ----------
+        mesh : Mesh
+            Mesh to draw at this level
+        screenSize : float
+            Smallest screen size this level is used for
+
+        Returns
+        -------
+        LODLevel
+            The new level
+
+        Raises
+        ------
+        PyUnityException
+            If the screen size is not smaller than that
+            of the previous level
+
+        """
+        if self.levels and screenSize >= self.levels[-1].screenSize:
+            raise PyUnityException(
+                "Screen size must be smaller than that of the previous level")
+        level = LODLevel(mesh, screenSize)
+        self.levels.append(level)
+        return level
+
+    def Generate(self, mesh, screenSizes, ratio=0.5):
+        """
+        Replaces the levels with a level for each screen
+        size. The first level uses the mesh, and each
+        following level is simplified from the previous
+        one with :func:`SimplifyMesh`.
+
+        Parameters
+        ----------
+        mesh : Mesh
+            The most detailed mesh
+        screenSizes : List[float]
+            Screen sizes of the levels, from largest to
+            smallest
+        ratio : float, optional
+            Fraction of the triangles of the previous
+            level kept in each level. Defaults to 0.5.
+
+        Returns
+        -------
+        List[LODLevel]
+            The new levels
+
+        """
+        self.levels = []
+        self.current = 0
+        for i, screenSize in enumerate(screenSizes):
+            if i != 0:
+                mesh = SimplifyMesh(mesh, ratio)
+            self.AddLevel(mesh, screenSize)
+        return self.levels
+
+    def getLevel(self, screenSize):
+        for i, level in enumerate(self.levels):
+            if screenSize >= level.screenSize:
+                return i
+        return len(self.levels)
+
+    def Select(self, screenSize):
+        """
+        Updates :attr:`current` for the size of the
+        renderer on the screen.
+
+        Parameters
+        ----------
+        screenSize : float
+            Fraction of the height of the screen covered
+            by the bounding sphere of the renderer
+
+        Returns
+        -------
+        int
+            Index of the level to draw, or the number of
+            levels if nothing should be drawn
+
+        """
+        coarser = self.getLevel(screenSize / (1 - self.hysteresis))
+        finer = self.getLevel(screenSize / (1 + self.hysteresis))
+        current = min(self.current, len(self.levels))
+        if coarser > current:
+            current = coarser
+        elif finer < current:
+            current = finer
+        self.current = current
+        return current
@@ -4,17 +4,22 @@
 
 """Module for meshes created at runtime and their various attributes."""
 
-__all__ = ["Mesh", "MeshRenderer", "Color", "RGB", "HSV", "Material"]
+__all__ = ["Mesh", "MeshRenderer", "Color", "RGB", "HSV", "Material",
+           "StaticBatch"]
 
-from .core import ShowInInspector, SingleComponent
+from .core import GameObject, ShowInInspector, SingleComponent, addFields
+from .errors import PyUnityException
 from .files import Asset, convert
 from .values import Mathf, Vector3
+import glm
 import OpenGL.GL as gl
 from ctypes import c_uint, c_float, c_void_p
 from pathlib import Path
 import os
+import copy
 import colorsys
 import itertools
+import threading
 
 floatSize = gl.sizeof(c_float)
 
@@ -70,8 +75,11 @@ class Mesh(Asset):
             self.texcoords = [[0, 0] for _ in range(len(self.verts))]
 
         self.compiled = False
+        self.buffers = None
+        self.instanceBuffer = None
         if ("PYUNITY_GL_CONTEXT" in os.environ and
-                os.environ["PYUNITY_INTERACTIVE"] == "1"):
+                os.environ["PYUNITY_INTERACTIVE"] == "1" and
+                threading.current_thread() is threading.main_thread()):
             self.compile()
 
         self.min = Vector3(
@@ -85,23 +93,39 @@ class Mesh(Asset):
             max(v.z for v in verts),
         )
 
+    def prepare(self):
+        """
+        Builds the vertex and index data that is uploaded
+        by :meth:`compile`. This does not need an OpenGL
+        context, and so can be done on any thread.
+
+        """
+        data = list(itertools.chain(*[[*item[0], *item[1], *item[2]]
+                                      for item in zip(self.verts, self.normals, self.texcoords)]))
+        indices = list(itertools.chain(*self.triangles))
+        self.buffers = (convert(c_float, data), len(data),
+                        convert(c_uint, indices), len(indices))
+
     def compile(self, force=False):
         if not self.compiled or force:
-            data = list(itertools.chain(*[[*item[0], *item[1], *item[2]]
-                                          for item in zip(self.verts, self.normals, self.texcoords)]))
-            indices = list(itertools.chain(*self.triangles))
+            if self.buffers is None or force:
+                self.prepare()
+            data, dataLength, indices, indicesLength = self.buffers
+            self.buffers = None
 
             self.vbo = gl.glGenBuffers(1)
             gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
-            gl.glBufferData(gl.GL_ARRAY_BUFFER, len(data) * floatSize,
-                            convert(c_float, data), gl.GL_STATIC_DRAW)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER, dataLength * floatSize,
+                            data, gl.GL_STATIC_DRAW)
             self.ibo = gl.glGenBuffers(1)
             gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, self.ibo)
-            gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, len(indices) * gl.sizeof(c_uint),
-                            convert(c_uint, indices), gl.GL_STATIC_DRAW)
+            gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, indicesLength * gl.sizeof(c_uint),
+                            indices, gl.GL_STATIC_DRAW)
 
             self.vao = gl.glGenVertexArrays(1)
             gl.glBindVertexArray(self.vao)
+            # Recorded by the VAO, so binding it is enough to draw
+            gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, self.ibo)
             gl.glVertexAttribPointer(
                 0, 3, gl.GL_FLOAT, gl.GL_FALSE, 8 * floatSize, None)
             gl.glEnableVertexAttribArray(0)
@@ -112,15 +136,63 @@ class Mesh(Asset):
                 2, 2, gl.GL_FLOAT, gl.GL_FALSE, 8 * floatSize, c_void_p(6 * floatSize))
             gl.glEnableVertexAttribArray(2)
 
+            self.instanceBuffer = None
             self.compiled = True
 
-    def draw(self):
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+    def bind(self):
+        """Binds the vertex array of the mesh."""
         gl.glBindVertexArray(self.vao)
-        gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+
+    def draw(self, bind=True):
+        """
+        Draws the mesh.
+
+        Parameters
+        ----------
+        bind : bool, optional
+            If False, the vertex array of the mesh must
+            already be bound. Defaults to True.
+
+        """
+        if bind:
+            self.bind()
         gl.glDrawElements(gl.GL_TRIANGLES, len(
             self.triangles) * 3, gl.GL_UNSIGNED_INT, None)
 
+    def drawInstanced(self, buffer, count):
+        """
+        Draw many copies of the mesh in one call.
+
+        Parameters
+        ----------
+        buffer : int
+            Vertex buffer holding, for each copy, its model
+            matrix, normal matrix and color as 28 floats
+        count : int
+            Number of copies
+
+        """
+        self.bind()
+        if self.instanceBuffer != buffer:
+            # Attribute locations 3 to 10 read from the instance
+            # buffer once per instance
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, buffer)
+            stride = 28 * floatSize
+            for i in range(4):
+                gl.glVertexAttribPointer(3 + i, 4, gl.GL_FLOAT, gl.GL_FALSE,
+                                         stride, c_void_p(4 * i * floatSize))
+            for i in range(3):
+                gl.glVertexAttribPointer(7 + i, 3, gl.GL_FLOAT, gl.GL_FALSE,
+                                         stride, c_void_p((16 + 3 * i) * floatSize))
+            gl.glVertexAttribPointer(10, 3, gl.GL_FLOAT, gl.GL_FALSE,
+                                     stride, c_void_p(25 * floatSize))
+            for location in range(3, 11):
+                gl.glEnableVertexAttribArray(location)
+                gl.glVertexAttribDivisor(location, 1)
+            self.instanceBuffer = buffer
+        gl.glDrawElementsInstanced(gl.GL_TRIANGLES, len(self.triangles) * 3,
+                                   gl.GL_UNSIGNED_INT, None, count)
+
     def copy(self):
         """
         Create a copy of the current Mesh.
@@ -426,6 +498,11 @@ class Material(Asset):
         self.color = color
         self.texture = texture
 
+    @property
+    def transparent(self):
+        """Whether the texture has any transparent pixels"""
+        return self.texture is not None and self.texture.transparent
+
     def GetAssetFile(self, gameObject):
         return Path("Materials") / (gameObject.name + ".mat")
 
@@ -557,6 +634,7 @@ class HSV(Color):
         h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
         return HSV(int(h * 360), int(s * 100), int(v * 100))
 
+@addFields(mesh=ShowInInspector(Mesh, None))
 class MeshRenderer(SingleComponent):
     """
     Component to render a mesh at the position of a transform.
@@ -564,16 +642,41 @@ class MeshRenderer(SingleComponent):
     Attributes
     ----------
     mesh : Mesh
-        Mesh that the MeshRenderer will render.
+        Mesh that the MeshRenderer will render. Setting it
+        puts the renderer back in the octree of its scene.
     mat : Material
         Material to use for the mesh
+    staticBatch : StaticBatch or None
+        Batch that draws the mesh instead of this
+        renderer, see :meth:`StaticBatch.Combine`
+    worldBounds : tuple or None
+        Bounding sphere cached by :meth:`Camera.getBounds`
+    isStatic : bool
+        Whether the renderer is not expected to move,
+        which is True for the renderers of StaticBatches.
+        Static renderers are drawn into a separate layer
+        of each shadow map, see :meth:`Camera.RenderShadowMap`.
 
     """
 
     DefaultMaterial = Material(RGB(200, 200, 200))
     DefaultMaterial.default = True
-    mesh = ShowInInspector(Mesh, None)
     mat = ShowInInspector(Material, DefaultMaterial, "material")
+    staticBatch = None
+    worldBounds = None
+    boundsKey = None
+    isStatic = False
+
+    @property
+    def mesh(self):
+        return self._mesh
+
+    @mesh.setter
+    def mesh(self, value):
+        self._mesh = value
+        scene = self.gameObject.scene
+        if scene is not None and scene.octree is not None:
+            scene.octree.Invalidate(self)
 
     def Render(self):
         """Render the mesh that the MeshRenderer has."""
@@ -583,3 +686,150 @@ class MeshRenderer(SingleComponent):
         if os.environ["PYUNITY_INTERACTIVE"] == "1":
             self.mesh.compile()
             self.mesh.draw()
+
+class StaticBatch:
+    """
+    Meshes of MeshRenderers that never move, transformed
+    to world space once and merged into one mesh per
+    material. The merged mesh is drawn with one draw call
+    and without computing any model matrices.
+
+    Use :meth:`Combine` to create batches. Batched
+    GameObjects must not be moved, and changes to their
+    meshes and materials are not shown until the batch is
+    removed and created again. Destroying a batched
+    GameObject removes its batch.
+
+    Attributes
+    ----------
+    scene : Scene
+        Scene that the batch is drawn in
+    material : Material
+        Material shared by the batched renderers
+    renderers : List[MeshRenderer]
+        Renderers drawn by the batch
+    mesh : Mesh
+        The merged mesh
+    renderer : MeshRenderer
+        Renderer that draws the merged mesh. Its
+        GameObject is not part of any scene.
+    maxVertices : int
+        Maximum number of vertices in one batch. More
+        renderers are split into several batches.
+
+    """
+
+    maxVertices = 1 << 20
+
+    def __init__(self, scene, material, renderers):
+        from .render import Camera
+        verts = []
+        normals = []
+        texcoords = []
+        triangles = []
+        for renderer in renderers:
+            mesh = renderer.mesh
+            model = Camera.getMatrix(renderer.transform)
+            normModel = Camera.getNormalMatrix(renderer.transform)
+            offset = len(verts)
+            for vert in mesh.verts:
+                verts.append(Vector3(*glm.vec3(model * glm.vec4(*vert, 1))))
+            for normal in mesh.normals:
+                normals.append(Vector3(*glm.normalize(normModel * glm.vec3(*normal))))
+            texcoords.extend(mesh.texcoords)
+            triangles.extend([i + offset for i in triangle] for triangle in mesh.triangles)
+
+        self.scene = scene
+        self.material = material
+        self.renderers = renderers
+        self.mesh = Mesh(verts, triangles, normals, texcoords)
+        self.renderer = GameObject("Static Batch").AddComponent(MeshRenderer)
+        self.renderer.mesh = self.mesh
+        self.renderer.mat = material
+        self.renderer.isStatic = True
+        for renderer in renderers:
+            renderer.staticBatch = self
+        scene.staticBatches.append(self)
+        if scene.octree is not None:
+            for renderer in renderers:
+                scene.octree.Sync(renderer.gameObject)
+            scene.octree.Add(self.renderer)
+
+    def __deepcopy__(self, memo):
+        batch = StaticBatch.__new__(StaticBatch)
+        memo[id(self)] = batch
+        batch.__dict__.update(self.__dict__)
+        batch.scene = memo.get(id(self.scene), self.scene)
+        batch.renderers = [copy.deepcopy(renderer, memo) for renderer in self.renderers]
+        return batch
+
+    @staticmethod
+    def Combine(gameObjects):
+        """
+        Batches the MeshRenderers of GameObjects and all
+        of their descendants, grouped by material.
+        Renderers without a mesh or that are already
+        batched are skipped.
+
+        Parameters
+        ----------
+        gameObjects : GameObject or List[GameObject]
+            GameObjects to batch
+
+        Returns
+        -------
+        List[StaticBatch]
+            The new batches
+
+        Raises
+        ------
+        PyUnityException
+            If a GameObject is not part of a scene
+
+        """
+        if isinstance(gameObjects, GameObject):
+            gameObjects = [gameObjects]
+        groups = {}
+        for gameObject in gameObjects:
+            if gameObject.scene is None:
+                raise PyUnityException(
+                    f"GameObject {gameObject.name!r} is not part of a scene")
+            for transform in gameObject.transform.GetDescendants():
+                for renderer in transform.gameObject.GetComponents(MeshRenderer):
+                    if renderer.mesh is None or renderer.staticBatch is not None:
+                        continue
+                    group = groups.setdefault((gameObject.scene, renderer.mat), [])
+                    if renderer not in group:
+                        group.append(renderer)
+
+        batches = []
+        for (scene, material), renderers in groups.items():
+            chunk = []
+            count = 0
+            for renderer in renderers:
+                size = len(renderer.mesh.verts)
+                if chunk and count + size > StaticBatch.maxVertices:
+                    batches.append(StaticBatch(scene, material, chunk))
+                    chunk = []
+                    count = 0
+                chunk.append(renderer)
+                count += size
+            if chunk:
+                batches.append(StaticBatch(scene, material, chunk))
+        return batches
+
+    def Remove(self):
+        """
+        Stops drawing the batch, so that its renderers are
+        drawn individually again.
+
+        """
+        for renderer in self.renderers:
+            if renderer.staticBatch is self:
+                renderer.staticBatch = None
+        if self in self.scene.staticBatches:
+            self.scene.staticBatches.remove(self)
+        if self.scene.octree is not None:
+            self.scene.octree.Remove(self.renderer)
+            for renderer in self.renderers:
+                self.scene.octree.Sync(renderer.gameObject)
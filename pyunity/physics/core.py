@@ -11,6 +11,7 @@ physics engine.
 __all__ = ["PhysicMaterial", "Collider", "SphereCollider", "Manifold",
            "BoxCollider", "Rigidbody", "Infinity"]
 
+from .. import profiler as Profiler
 from ..core import Component, ShowInInspector, addFields
 from ..errors import PyUnityException
 from ..values import ABCMeta, IgnoredMixin, Quaternion, Vector3, abstractmethod
@@ -760,6 +761,7 @@ class CollManager(IgnoredMixin):
         else:
             return 0
 
+    @Profiler.Profile("CollManager.Step")
     def Step(self, dt):
         """
         Steps through the simulation at a
@@ -0,0 +1,255 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Opt-in profiler that records how long each phase
+of a frame and each Behaviour method takes.
+
+This will be imported as ``pyunity.Profiler``.
+
+Phases such as ``updateScripts``, ``updateFixed``,
+``CollManager.Step``, ``Scene.Render``, the shadow pass,
+the 2D pass and the window refresh are recorded under
+the ``phase`` category. Every call of a Behaviour method
+run by the scene is recorded under the ``behaviour``
+category, named like ``Rotator.Update``. For coroutine
+methods only the creation of the task is timed, and it
+is counted as a task.
+
+Example
+-------
+>>> Profiler.Enable()
+>>> SceneManager.LoadScene(scene)
+>>> Profiler.LogSummary()
+>>> Profiler.ExportTrace("trace.json")
+
+The trace can be opened in ``chrome://tracing`` or
+https://ui.perfetto.dev.
+
+"""
+
+__all__ = ["Disable", "Enable", "ExportTrace", "LogSummary", "Profile",
+           "Record", "Reset", "Section", "Summary"]
+
+from . import logger as Logger
+import os
+import json
+import time
+import functools
+import threading
+import collections
+
+enabled = False
+events = collections.deque(maxlen=100000)
+stats = {}
+threadNames = {}
+origin = time.perf_counter()
+lock = threading.Lock()
+
+def Enable(capacity=100000):
+    """
+    Start recording.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of trace events to keep. Older
+        events are dropped, but are still counted in
+        :func:`Summary`. Defaults to 100000.
+
+    """
+    global enabled, events
+    with lock:
+        if events.maxlen != capacity:
+            events = collections.deque(events, maxlen=capacity)
+    enabled = True
+
+def Disable():
+    """Stop recording. Recorded data is kept."""
+    global enabled
+    enabled = False
+
+def Reset():
+    """Remove all recorded data."""
+    global origin
+    with lock:
+        events.clear()
+        stats.clear()
+        threadNames.clear()
+        origin = time.perf_counter()
+
+def Record(name, category, start, end, task=False):
+    """
+    Record a timed section.
+
+    Parameters
+    ----------
+    name : str
+        Name of the section
+    category : str
+        Category of the section, such as ``phase`` or
+        ``behaviour``
+    start : float
+        Start time from :func:`time.perf_counter`
+    end : float
+        End time from :func:`time.perf_counter`
+    task : bool, optional
+        Whether the section created an asyncio task
+
+    """
+    duration = end - start
+    thread = threading.current_thread()
+    with lock:
+        events.append((name, category, start, duration, thread.ident, task))
+        threadNames[thread.ident] = thread.name
+        entry = stats.get((category, name))
+        if entry is None:
+            entry = stats[category, name] = [0, 0, 0, 0]
+        entry[0] += 1
+        entry[1] += duration
+        if duration > entry[2]:
+            entry[2] = duration
+        if task:
+            entry[3] += 1
+
+class _Section:
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exctype, value, tb):
+        Record(self.name, self.category, self.start, time.perf_counter())
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exctype, value, tb):
+        pass
+
+_nullSection = _NullSection()
+
+def Section(name, category="phase"):
+    """
+    Context manager that records the time taken by its
+    body. Does nothing if the profiler is disabled.
+
+    """
+    if not enabled:
+        return _nullSection
+    return _Section(name, category)
+
+def Profile(name, category="phase"):
+    """
+    Decorator that records the time taken by every call
+    of a function while the profiler is enabled.
+
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def inner(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                Record(name, category, start, time.perf_counter())
+        return inner
+    return decorator
+
+def Summary(category=None):
+    """
+    Get the totals of every recorded section so far.
+    Safe to call while the scene is running.
+
+    Parameters
+    ----------
+    category : str, optional
+        Only include sections of this category
+
+    Returns
+    -------
+    dict
+        Maps the name of each section to a dict with
+        its ``count``, ``total``, ``mean`` and ``max``
+        times in seconds and its number of ``tasks``.
+        Sorted by total time, longest first.
+
+    """
+    with lock:
+        items = list(stats.items())
+    result = {}
+    items.sort(key=lambda item: item[1][1], reverse=True)
+    for (cat, name), (count, total, longest, tasks) in items:
+        if category is not None and cat != category:
+            continue
+        result[name] = {"category": cat, "count": count, "total": total,
+                        "mean": total / count, "max": longest, "tasks": tasks}
+    return result
+
+def LogSummary(category=None, limit=20):
+    """
+    Log the sections with the longest total time.
+
+    Parameters
+    ----------
+    category : str, optional
+        Only include sections of this category
+    limit : int, optional
+        Number of sections to log, by default 20
+
+    """
+    summary = Summary(category)
+    Logger.LogLine(Logger.OUTPUT, "Profiler summary:")
+    for name, entry in list(summary.items())[:limit]:
+        Logger.LogLine(
+            Logger.OUTPUT,
+            f"{name}: {entry['count']} calls, "
+            f"total {entry['total'] * 1000:.2f}ms, "
+            f"mean {entry['mean'] * 1000:.3f}ms, "
+            f"max {entry['max'] * 1000:.3f}ms, "
+            f"{entry['tasks']} tasks")
+
+def ExportTrace(path=None):
+    """
+    Export the recorded sections in the Chrome trace
+    event format, which can be opened by Perfetto.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        File to write the trace to
+
+    Returns
+    -------
+    dict
+        The trace
+
+    """
+    with lock:
+        recorded = list(events)
+        names = dict(threadNames)
+        start = origin
+    pid = os.getpid()
+    traceEvents = []
+    for tid, name in names.items():
+        traceEvents.append({"name": "thread_name", "ph": "M", "pid": pid,
+                            "tid": tid, "args": {"name": name}})
+    for name, category, begin, duration, tid, task in recorded:
+        event = {"name": name, "cat": category, "ph": "X", "pid": pid,
+                 "tid": tid, "ts": (begin - start) * 1e6, "dur": duration * 1e6}
+        if task:
+            event["args"] = {"task": True}
+        traceEvents.append(event)
+
+    trace = {"traceEvents": traceEvents, "displayTimeUnit": "ms"}
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump(trace, f)
+    return trace
@@ -10,9 +10,11 @@ Classes to aid in rendering in a Scene.
 __all__ = ["Camera", "Screen", "Shader", "Light", "LightType"]
 
 from . import Logger, config
+from . import profiler as Profiler
 from .core import ShowInInspector, SingleComponent, addFields
 from .errors import PyUnityException
 from .files import Skybox, convert
+from .lod import LODGroup
 from .meshes import RGB, Color, floatSize
 from .resources import resolver
 from .values import ImmutableStruct, Quaternion, Vector2, Vector3
@@ -22,9 +24,16 @@ from ctypes import c_float
 from pathlib import Path
 import os
 import enum
+import struct
+import math
 import hashlib
 import collections.abc
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 def fillScreen(scale=1):
     gl.glClear(gl.GL_COLOR_BUFFER_BIT)
     gl.glLoadIdentity()
@@ -40,6 +49,31 @@ def fillScreen(scale=1):
     gl.glEnd()
 
 class Shader:
+    """
+    Class to compile and use a GLSL program.
+
+    Uniform locations are read once when the program is
+    linked, and each setter skips the ``glUniform*`` call
+    when the uniform already holds the value.
+
+    Attributes
+    ----------
+    uniforms : dict
+        Last value set for each uniform, by name
+    locations : dict
+        Location of each active uniform, by its name as
+        bytes. Elements of array uniforms are included.
+    issued : int
+        Number of uniform uploads issued
+    skipped : int
+        Number of uniform uploads skipped because the
+        value had not changed
+    variants : dict
+        Copies of this shader compiled with an extra
+        ``#define``, by the name of the define
+
+    """
+
     VERSION = "1.10" # Must be 4 long
     def __init__(self, vertex, frag, name):
         self.vertex = vertex
@@ -47,6 +81,12 @@ class Shader:
         self.compiled = False
         self.name = name
         self.uniforms = {}
+        self.locations = {}
+        self.names = {}
+        self.values = {}
+        self.issued = 0
+        self.skipped = 0
+        self.variants = {}
         shaders[name] = self
 
     def __deepcopy__(self, memo=None):
@@ -109,6 +149,7 @@ class Shader:
             return
 
         self.compiled = True
+        self.reflect()
         Logger.LogLine(Logger.INFO, "Loaded shader", repr(self.name),
                        "hash", file.name.rsplit(".", 1)[0])
 
@@ -167,6 +208,7 @@ class Shader:
         gl.glDeleteShader(vertexShader)
         gl.glDeleteShader(fragShader)
         self.compiled = True
+        self.reflect()
 
         Logger.LogLine(Logger.INFO, "Compiled shader", repr(self.name))
 
@@ -192,6 +234,102 @@ class Shader:
             Logger.INFO, "Saved shader", repr(self.name),
             "hash", digest)
 
+    def reflect(self):
+        """
+        Reads the locations of all active uniforms of the
+        linked program, forgets the uploaded values and
+        binds the uniform blocks of the program to their
+        :class:`UniformBuffer`.
+
+        """
+        self.locations.clear()
+        self.values.clear()
+        for name, buffer in uniformBuffers.items():
+            index = gl.glGetUniformBlockIndex(self.program, name)
+            if index != gl.GL_INVALID_INDEX:
+                gl.glUniformBlockBinding(self.program, index, buffer.binding)
+        count = gl.glGetProgramiv(self.program, gl.GL_ACTIVE_UNIFORMS)
+        for i in range(count):
+            name, size, _ = gl.glGetActiveUniform(self.program, i)
+            name = bytes(name)
+            self.locations[name] = gl.glGetUniformLocation(self.program, name)
+            if name.endswith(b"[0]"):
+                # Only the first element of arrays is listed
+                base = name[:-3]
+                self.locations[base] = self.locations[name]
+                for j in range(1, size):
+                    element = base + b"[%d]" % j
+                    self.locations[element] = gl.glGetUniformLocation(
+                        self.program, element)
+
+    def getLocation(self, var):
+        """
+        Gets the location of a uniform variable.
+
+        Parameters
+        ----------
+        var : bytes
+            Variable name
+
+        Returns
+        -------
+        int
+            Location of the uniform, or -1 if it is
+            not active
+
+        """
+        location = self.locations.get(var)
+        if location is None:
+            location = gl.glGetUniformLocation(self.program, var)
+            self.locations[var] = location
+        return location
+
+    def changed(self, var, val, key):
+        name = self.names.get(var)
+        if name is None:
+            name = self.names[var] = var.decode()
+        self.uniforms[name] = val
+        if self.values.get(var) == key:
+            self.skipped += 1
+            return False
+        self.values[var] = key
+        self.issued += 1
+        return True
+
+    def resetCounters(self):
+        """Sets :attr:`issued` and :attr:`skipped` back to 0."""
+        self.issued = 0
+        self.skipped = 0
+
+    @property
+    def supportsInstancing(self):
+        """Whether the shader has an ``INSTANCED`` variant"""
+        return "INSTANCED" in self.vertex
+
+    def GetVariant(self, define):
+        """
+        Gets a copy of this shader that is compiled with
+        ``#define`` set to ``define``. The copy is
+        registered as ``"<name>:<define>"``.
+
+        Parameters
+        ----------
+        define : str
+            Name of the preprocessor define
+
+        Returns
+        -------
+        Shader
+            The variant of this shader
+
+        """
+        if define not in self.variants:
+            vertex, frag = (
+                source.replace("\n", f"\n#define {define}\n", 1)
+                for source in (self.vertex, self.frag))
+            self.variants[define] = Shader(vertex, frag, f"{self.name}:{define}")
+        return self.variants[define]
+
     @staticmethod
     def fromFolder(path, name):
         """
@@ -228,9 +366,8 @@ class Shader:
             Value of uniform variable
 
         """
-        self.uniforms[var.decode()] = val
-        location = gl.glGetUniformLocation(self.program, var)
-        gl.glUniform3f(location, *val)
+        if self.changed(var, val, tuple(val)):
+            gl.glUniform3f(self.getLocation(var), *val)
 
     def setMat3(self, var, val):
         """
@@ -244,9 +381,8 @@ class Shader:
             Value of uniform variable
 
         """
-        self.uniforms[var.decode()] = val
-        location = gl.glGetUniformLocation(self.program, var)
-        gl.glUniformMatrix3fv(location, 1, gl.GL_FALSE, glm.value_ptr(val))
+        if self.changed(var, val, val.to_bytes()):
+            gl.glUniformMatrix3fv(self.getLocation(var), 1, gl.GL_FALSE, glm.value_ptr(val))
 
     def setMat4(self, var, val):
         """
@@ -260,9 +396,8 @@ class Shader:
             Value of uniform variable
 
         """
-        self.uniforms[var.decode()] = val
-        location = gl.glGetUniformLocation(self.program, var)
-        gl.glUniformMatrix4fv(location, 1, gl.GL_FALSE, glm.value_ptr(val))
+        if self.changed(var, val, val.to_bytes()):
+            gl.glUniformMatrix4fv(self.getLocation(var), 1, gl.GL_FALSE, glm.value_ptr(val))
 
     def setInt(self, var, val):
         """
@@ -276,9 +411,8 @@ class Shader:
             Value of uniform variable
 
         """
-        self.uniforms[var.decode()] = val
-        location = gl.glGetUniformLocation(self.program, var)
-        gl.glUniform1i(location, val)
+        if self.changed(var, val, val):
+            gl.glUniform1i(self.getLocation(var), val)
 
     def setFloat(self, var, val):
         """
@@ -292,9 +426,8 @@ class Shader:
             Value of uniform variable
 
         """
-        self.uniforms[var.decode()] = val
-        location = gl.glGetUniformLocation(self.program, var)
-        gl.glUniform1f(location, val)
+        if self.changed(var, val, val):
+            gl.glUniform1f(self.getLocation(var), val)
 
     def use(self):
         """Compile shader if it isn't compiled, and load it into OpenGL."""
@@ -303,12 +436,392 @@ class Shader:
                 self.compile()
             gl.glUseProgram(self.program)
 
+class UniformBuffer:
+    """
+    Buffer backing a ``std140`` uniform block, which is
+    shared by every shader that declares the block.
+    Uploads are skipped when the data has not changed.
+
+    Parameters
+    ----------
+    name : bytes
+        Name of the uniform block
+    binding : int
+        Binding point of the buffer
+    size : int
+        Size of the block in bytes
+
+    Attributes
+    ----------
+    uploads : int
+        Number of times the buffer has been updated
+
+    """
+
+    def __init__(self, name, binding, size):
+        self.name = name
+        self.binding = binding
+        self.size = size
+        self.buffer = None
+        self.data = None
+        self.uploads = 0
+        uniformBuffers[name] = self
+
+    def setup(self):
+        """Creates the buffer if needed."""
+        if self.buffer is not None:
+            return
+        self.buffer = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_UNIFORM_BUFFER, self.buffer)
+        gl.glBufferData(gl.GL_UNIFORM_BUFFER, self.size, None, gl.GL_DYNAMIC_DRAW)
+        gl.glBindBufferBase(gl.GL_UNIFORM_BUFFER, self.binding, self.buffer)
+        self.data = None
+
+    def Update(self, data):
+        """
+        Uploads the start of the block.
+
+        Parameters
+        ----------
+        data : bytes
+            Contents of the block, laid out with ``std140``
+
+        Returns
+        -------
+        bool
+            Whether the data was uploaded
+
+        """
+        if data == self.data:
+            return False
+        self.setup()
+        gl.glBindBuffer(gl.GL_UNIFORM_BUFFER, self.buffer)
+        gl.glBufferSubData(gl.GL_UNIFORM_BUFFER, 0, len(data), data)
+        self.data = data
+        self.uploads += 1
+        return True
+
+    def reset(self):
+        self.buffer = None
+        self.data = None
+
+class InstanceBuffer:
+    """
+    Vertex buffer holding per-instance data for
+    :meth:`Mesh.drawInstanced`. Its storage is replaced on
+    every update, so that a draw call that still reads the
+    previous data does not stall the upload.
+
+    Attributes
+    ----------
+    uploads : int
+        Number of times the buffer has been updated
+
+    """
+
+    def __init__(self):
+        self.buffer = None
+        self.uploads = 0
+
+    def Update(self, data):
+        """
+        Replaces the contents of the buffer.
+
+        Parameters
+        ----------
+        data : bytes
+            Instance data
+
+        Returns
+        -------
+        int
+            The OpenGL buffer
+
+        """
+        if self.buffer is None:
+            self.buffer = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.buffer)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, len(data), data, gl.GL_STREAM_DRAW)
+        self.uploads += 1
+        return self.buffer
+
+    def reset(self):
+        self.buffer = None
+
+class RenderQueue:
+    """
+    Orders the draws of a pass so that OpenGL state changes
+    as little as possible. Opaque draws are grouped by
+    shader, texture and mesh, and drawn from front to back
+    within each group. Transparent draws are drawn last,
+    from back to front. Binding a shader, texture or mesh
+    that is already bound is skipped.
+
+    Attributes
+    ----------
+    drawCalls : int
+        Number of draw calls issued
+    shaderChanges : int
+        Number of shaders bound
+    textureChanges : int
+        Number of textures bound
+    meshChanges : int
+        Number of vertex arrays bound
+
+    """
+
+    def __init__(self):
+        self.draws = []
+        self.position = glm.vec3()
+        self.shader = None
+        self.texture = None
+        self.mesh = None
+        self.drawCalls = 0
+        self.shaderChanges = 0
+        self.textureChanges = 0
+        self.meshChanges = 0
+
+    @property
+    def stateChanges(self):
+        """Total number of shaders, textures and meshes bound"""
+        return self.shaderChanges + self.textureChanges + self.meshChanges
+
+    def resetCounters(self):
+        """Sets all counters back to 0."""
+        self.drawCalls = 0
+        self.shaderChanges = 0
+        self.textureChanges = 0
+        self.meshChanges = 0
+
+    def Begin(self, position):
+        """
+        Starts a pass. The bound state is forgotten, since
+        it may have been changed outside of the queue.
+
+        Parameters
+        ----------
+        position : glm.vec3
+            Position that draws are sorted by distance from,
+            in OpenGL coordinates
+
+        """
+        self.draws.clear()
+        self.position = position
+        self.shader = None
+        self.texture = None
+        self.mesh = None
+
+    def Add(self, shader, renderers, distance, texture=None,
+            transparent=False, instanced=False, mesh=None):
+        """
+        Adds a draw to the pass.
+
+        Parameters
+        ----------
+        shader : Shader
+            Shader to draw with
+        renderers : List[MeshRenderer]
+            Renderers drawn together, which share a mesh
+        distance : float
+            Squared distance of the draw from :attr:`position`
+        texture : Texture2D, optional
+            Texture used by the draw
+        transparent : bool, optional
+            Whether the draw is blended with what is behind it
+        instanced : bool, optional
+            Whether the renderers are drawn with one
+            instanced draw call
+        mesh : Mesh, optional
+            Mesh that the renderers are drawn with.
+            Defaults to the mesh of the first renderer.
+
+        """
+        if mesh is None:
+            mesh = renderers[0].mesh
+        if transparent:
+            key = (1, -distance)
+        else:
+            key = (0, id(shader), id(texture), id(mesh), distance)
+        self.draws.append((key, shader, renderers, instanced))
+
+    def Sort(self):
+        """
+        Sorts the draws of the pass.
+
+        Returns
+        -------
+        list
+            Tuples of the sort key, shader, renderers and
+            whether the renderers are instanced
+
+        """
+        self.draws.sort(key=lambda draw: draw[0])
+        return self.draws
+
+    def End(self):
+        """Forgets the draws of the pass."""
+        self.draws.clear()
+
+    def UseShader(self, shader):
+        """
+        Binds a shader if it is not already bound.
+
+        Returns
+        -------
+        bool
+            Whether the shader was bound
+
+        """
+        if shader is self.shader:
+            return False
+        shader.use()
+        self.shader = shader
+        self.shaderChanges += 1
+        return True
+
+    def UseTexture(self, texture):
+        """Binds a texture if it is not already bound."""
+        if texture is None or texture is self.texture:
+            return
+        if os.environ["PYUNITY_INTERACTIVE"] == "1":
+            texture.use()
+        self.texture = texture
+        self.textureChanges += 1
+
+    def DrawMesh(self, mesh):
+        """Draws a mesh, binding it if it is not already bound."""
+        if os.environ["PYUNITY_INTERACTIVE"] == "1":
+            mesh.compile()
+            if mesh is not self.mesh:
+                mesh.bind()
+            mesh.draw(bind=False)
+        if mesh is not self.mesh:
+            self.mesh = mesh
+            self.meshChanges += 1
+        self.drawCalls += 1
+
+    def DrawInstanced(self, mesh, data, count):
+        """
+        Draws copies of a mesh with one draw call.
+
+        Parameters
+        ----------
+        mesh : Mesh
+            Mesh to draw
+        data : bytes
+            Instance data, see :meth:`Mesh.drawInstanced`
+        count : int
+            Number of copies
+
+        """
+        if os.environ["PYUNITY_INTERACTIVE"] == "1":
+            mesh.compile()
+            mesh.drawInstanced(instanceBuffer.Update(data), count)
+        if mesh is not self.mesh:
+            self.mesh = mesh
+            self.meshChanges += 1
+        self.drawCalls += 1
+
+class Frustum:
+    """
+    The six clipping planes of a projection, used to
+    skip renderers that cannot be seen. Renderers are
+    tested by their bounding spheres, see
+    :meth:`Camera.getBounds`. Spheres that only touch
+    the corner of a frustum may be kept even though they
+    are not visible.
+
+    Parameters
+    ----------
+    matrix : glm.mat4
+        Projection matrix multiplied by the view matrix
+
+    Attributes
+    ----------
+    planes : list
+        Left, right, bottom, top, near and far planes as
+        ``(a, b, c, d)`` tuples, where a point is inside
+        the plane if ``ax + by + cz + d >= 0``
+
+    """
+
+    def __init__(self, matrix):
+        rows = [glm.row(matrix, i) for i in range(4)]
+        self.planes = []
+        for row in rows[:3]:
+            for plane in (rows[3] + row, rows[3] - row):
+                length = glm.length(glm.vec3(plane))
+                self.planes.append(tuple(plane / length))
+
+    def ContainsSphere(self, sphere):
+        """
+        Checks if a sphere is at least partly inside
+        the frustum.
+
+        Parameters
+        ----------
+        sphere : tuple
+            Center and radius of the sphere as
+            ``(x, y, z, radius)``
+
+        Returns
+        -------
+        bool
+            If the sphere is inside
+
+        """
+        x, y, z, radius = sphere
+        for a, b, c, d in self.planes:
+            if a * x + b * y + c * z + d < -radius:
+                return False
+        return True
+
+    def CullSpheres(self, spheres):
+        """
+        Checks many spheres at once. NumPy is used if it
+        is installed.
+
+        Parameters
+        ----------
+        spheres : list
+            Spheres as ``(x, y, z, radius)`` tuples
+
+        Returns
+        -------
+        list
+            Whether each sphere is inside the frustum
+
+        """
+        if numpy is None or len(spheres) < 16:
+            return [self.ContainsSphere(sphere) for sphere in spheres]
+        spheres = numpy.array(spheres, dtype=numpy.float32)
+        planes = numpy.array(self.planes, dtype=numpy.float32)
+        distances = spheres[:, :3] @ planes[:, :3].T + planes[:, 3]
+        return (distances >= -spheres[:, 3:]).all(axis=1).tolist()
+
+NR_LIGHTS = 32
+NR_SHADOW_MAPS = 8
+NR_CASCADES = 4
+LIGHT_SIZE = 112
+CASCADES_SIZE = NR_CASCADES * 68 + 32
+
+uniformBuffers = {}
+cameraBuffer = UniformBuffer(b"Camera", 0, 160)
+lightBuffer = UniformBuffer(b"Lights", 1, NR_LIGHTS * LIGHT_SIZE)
+cascadeBuffer = UniformBuffer(b"Cascades", 2, CASCADES_SIZE)
+shadowMapNames = [b"shadowMaps[%d]" % i for i in range(NR_SHADOW_MAPS)]
+cascadeMapNames = [b"cascadeMaps[%d]" % i for i in range(NR_CASCADES)]
+identityBytes = glm.mat4(1).to_bytes()
+instanceBuffer = InstanceBuffer()
+
 shaders = {}
 skyboxes = {}
 Shader.fromFolder(resolver.getPath("shaders/standard/"), "Standard")
 Shader.fromFolder(resolver.getPath("shaders/skybox/"), "Skybox")
 Shader.fromFolder(resolver.getPath("shaders/gui/"), "GUI")
 Shader.fromFolder(resolver.getPath("shaders/depth/"), "Depth")
+shaders["Standard"].GetVariant("INSTANCED")
+shaders["Depth"].GetVariant("INSTANCED")
 skyboxes["Water"] = Skybox(resolver.getPath("shaders/skybox/textures/"))
 
 def compileShaders():
@@ -322,11 +835,111 @@ def compileSkyboxes():
 def resetShaders():
     for shader in shaders.values():
         shader.compiled = False
+        shader.locations.clear()
+        shader.values.clear()
+    for buffer in uniformBuffers.values():
+        buffer.reset()
+    instanceBuffer.reset()
+
+def uniformCounters():
+    """
+    Gets the number of uniform uploads issued and
+    skipped by all shaders since the counters were
+    last reset.
+
+    Returns
+    -------
+    tuple
+        Issued and skipped uploads
+
+    """
+    issued = sum(shader.issued for shader in shaders.values())
+    skipped = sum(shader.skipped for shader in shaders.values())
+    return issued, skipped
+
+def resetUniformCounters():
+    for shader in shaders.values():
+        shader.resetCounters()
+
 
 def resetSkyboxes():
     for skybox in skyboxes.values():
         skybox.compiled = False
 
+class ShadowCache:
+    """
+    What was drawn into the shadow map of a light, so
+    that the map is only drawn again when it would look
+    different. Clones of a light start with an empty
+    cache.
+
+    Attributes
+    ----------
+    key : tuple or None
+        Light space matrix and casters of the shadow map
+    staticKey : tuple or None
+        Light space matrix and casters of the static
+        layer of the shadow map
+
+    """
+
+    def __init__(self):
+        self.key = None
+        self.staticKey = None
+
+    def __deepcopy__(self, memo):
+        return ShadowCache()
+
+class ShadowCascade:
+    """
+    Part of the view of a camera with its own shadow map
+    for cascaded shadows, see :meth:`Camera.SetCascades`.
+
+    Parameters
+    ----------
+    near : float
+        Distance from the camera where the cascade starts
+    far : float
+        Distance from the camera where the cascade ends
+    size : int
+        Resolution of the shadow map
+    interval : int
+        Number of frames between updates of the shadow map
+
+    Attributes
+    ----------
+    matrix : glm.mat4 or None
+        Light space matrix the shadow map was last drawn
+        with
+    age : int
+        Number of frames since the matrix was updated
+    shadowCache : ShadowCache
+        State of the shadow map
+
+    """
+
+    def __init__(self, near, far, size, interval=1):
+        self.near = near
+        self.far = far
+        self.size = size
+        self.interval = interval
+        self.matrix = None
+        self.age = 0
+        self.shadowCache = ShadowCache()
+
+    def __deepcopy__(self, memo):
+        return ShadowCascade(self.near, self.far, self.size, self.interval)
+
+    def __repr__(self):
+        return (f"<ShadowCascade near={self.near:.2f} far={self.far:.2f} "
+                f"size={self.size}>")
+
+    def setupBuffers(self):
+        self.depthFBO, self.depthMap = Light.genDepthMap(self.size)
+
+    def setupStaticBuffers(self, depthMapSize):
+        self.staticFBO, self.staticMap = Light.genDepthMap(depthMapSize)
+
 class LightType(enum.IntEnum):
     Point = 0
     Directional = 1
@@ -345,6 +958,8 @@ class Light(SingleComponent):
     type : LightType
         Type of light (currently only Point and
         Directional are supported)
+    shadowCache : ShadowCache
+        State of the shadow map of the light
 
     """
 
@@ -356,11 +971,19 @@ class Light(SingleComponent):
         super(Light, self).__init__()
         self.near = 0.03
         self.far = 20
+        self.shadowCache = ShadowCache()
 
     def setupBuffers(self, depthMapSize):
-        self.depthFBO = gl.glGenFramebuffers(1)
-        self.depthMap = gl.glGenTextures(1)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self.depthMap)
+        self.depthFBO, self.depthMap = self.genDepthMap(depthMapSize)
+
+    def setupStaticBuffers(self, depthMapSize):
+        self.staticFBO, self.staticMap = self.genDepthMap(depthMapSize)
+
+    @staticmethod
+    def genDepthMap(depthMapSize):
+        depthFBO = gl.glGenFramebuffers(1)
+        depthMap = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, depthMap)
         gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_DEPTH_COMPONENT,
                         depthMapSize, depthMapSize, 0, gl.GL_DEPTH_COMPONENT,
                         gl.GL_FLOAT, None)
@@ -375,12 +998,13 @@ class Light(SingleComponent):
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_COMPARE_MODE,
                            gl.GL_COMPARE_REF_TO_TEXTURE)
 
-        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, self.depthFBO)
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, depthFBO)
         gl.glFramebufferTexture2D(gl.GL_FRAMEBUFFER, gl.GL_DEPTH_ATTACHMENT,
-                                  gl.GL_TEXTURE_2D, self.depthMap, 0)
+                                  gl.GL_TEXTURE_2D, depthMap, 0)
         gl.glDrawBuffer(gl.GL_NONE)
         gl.glReadBuffer(gl.GL_NONE)
         gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, 0)
+        return depthFBO, depthMap
 
 @addFields(
     fov=ShowInInspector(int),
@@ -410,11 +1034,49 @@ class Camera(SingleComponent):
         Unavailable from the Editor and also not saved.
     shadows : bool
         Whether to render depthmaps and use them. Defaults to True.
+        Only the first :data:`NR_SHADOW_MAPS` lights cast shadows,
+        and only the first :data:`NR_LIGHTS` lights are used.
     canvas : Canvas
         Target canvas to render. Defaults to None.
     depthMapSize : int
         Depth map texture size. Do not modify after scene has started.
         Defaults to 1024.
+    instancing : bool
+        Whether renderers sharing a mesh and material are
+        drawn together with one instanced draw call, if
+        the shader supports it. Defaults to True.
+    minInstances : int
+        Number of renderers sharing a mesh and material
+        needed to draw them with instancing. Defaults to 2.
+    renderQueue : RenderQueue
+        Queue that orders the draws of each pass. Its
+        counters keep adding up until they are reset.
+    culling : bool
+        Whether renderers outside of the view, or outside
+        of the shadow map of a light, are skipped.
+        Defaults to True.
+    culled : int
+        Number of renderers skipped in the last frame
+    shadowCulled : int
+        Number of renderers skipped in the shadow passes
+        of the last frame, added up over all lights.
+        Renderers hidden by their :class:`LODGroup` are
+        counted in :attr:`culled`.
+    cascades : List[ShadowCascade]
+        Cascades used for the shadows of the first
+        directional light instead of its own shadow map.
+        Empty unless set with :meth:`SetCascades`.
+        Not saved.
+    shadowCaching : bool
+        Whether the shadow map of a light is kept until
+        the light or a renderer that casts a shadow in it
+        moves or changes mesh. Defaults to True.
+    shadowsCached : int
+        Number of shadow maps that were reused in the
+        last frame
+    lodMeshes : dict
+        Meshes chosen by :meth:`SelectLODs` for the
+        renderers drawn in the current frame. Not saved.
 
     """
 
@@ -427,6 +1089,10 @@ class Camera(SingleComponent):
     ortho = ShowInInspector(bool, False, "Orthographic")
     shadows = ShowInInspector(bool, False)
     depthMapSize = ShowInInspector(int, 1024)
+    instancing = ShowInInspector(bool, True)
+    culling = ShowInInspector(bool, True)
+    shadowCaching = ShowInInspector(bool, True)
+    minInstances = 2
 
     def __init__(self):
         super(Camera, self).__init__()
@@ -441,6 +1107,12 @@ class Camera(SingleComponent):
 
         self.viewMat = glm.lookAt([0, 0, 0], [0, 0, -1], [0, 1, 0])
         self.renderPass = False
+        self.renderQueue = RenderQueue()
+        self.culled = 0
+        self.shadowCulled = 0
+        self.shadowsCached = 0
+        self.cascades = []
+        self.lodMeshes = {}
 
     def setupBuffers(self):
         """Creates 2D quad VBO and VAO for GUI."""
@@ -515,7 +1187,8 @@ class Camera(SingleComponent):
         if self.scene.mainCamera is self:
             Screen._edit(width, height)
 
-    def getMatrix(self, transform):
+    @staticmethod
+    def getMatrix(transform):
         """Generates model matrix from transform."""
         if not transform.hasChanged and transform.modelMatrix is not None:
             return transform.modelMatrix
@@ -528,9 +1201,160 @@ class Camera(SingleComponent):
         rotated = position * glm.mat4_cast(glm.angleAxis(angle, list(axis)))
         scaled = glm.scale(rotated, list(transform.scale))
         transform.modelMatrix = scaled
+        transform.normalMatrix = None
         transform.hasChanged = False
         return scaled
 
+    @staticmethod
+    def getNormalMatrix(transform):
+        """Generates normal matrix from transform."""
+        model = Camera.getMatrix(transform)
+        if transform.normalMatrix is None:
+            transform.normalMatrix = glm.transpose(glm.inverse(glm.mat3(model)))
+        return transform.normalMatrix
+
+    @staticmethod
+    def getBounds(renderer):
+        """
+        Gets the bounding sphere of a renderer in world
+        space, which is cached until its transform or mesh
+        changes.
+
+        Parameters
+        ----------
+        renderer : MeshRenderer
+            Renderer to get bounds of
+
+        Returns
+        -------
+        tuple
+            Center and radius of the sphere as
+            ``(x, y, z, radius)``
+
+        """
+        model = Camera.getMatrix(renderer.transform)
+        mesh = renderer.mesh
+        key = renderer.boundsKey
+        if key is not None and key[0] is model and key[1] == id(mesh):
+            return renderer.worldBounds
+        center = glm.vec3(model * glm.vec4(*((mesh.min + mesh.max) / 2), 1))
+        scale = max(glm.length(glm.vec3(model[i])) for i in range(3))
+        radius = ((mesh.max - mesh.min) / 2).length * scale
+        renderer.worldBounds = (*center, radius)
+        renderer.boundsKey = (model, id(mesh))
+        return renderer.worldBounds
+
+    def Cull(self, renderers, matrix):
+        """
+        Gets the renderers that are inside a frustum. If
+        the scene of the camera has an octree, the
+        renderers are taken from :meth:`Scene.Cull`
+        instead, so ``renderers`` should be the renderers
+        from :meth:`Scene.GetRenderers`.
+
+        Parameters
+        ----------
+        renderers : List[MeshRenderer]
+            Renderers to test
+        matrix : glm.mat4
+            Projection matrix multiplied by the view matrix
+
+        Returns
+        -------
+        List[MeshRenderer]
+            Renderers that may be visible
+
+        """
+        if self.culling and self.scene is not None and self.scene.octree is not None:
+            return self.scene.Cull(Frustum(matrix))
+        renderers = [renderer for renderer in renderers if renderer.mesh is not None]
+        if not self.culling:
+            return renderers
+        frustum = Frustum(matrix)
+        spheres = [self.getBounds(renderer) for renderer in renderers]
+        inside = frustum.CullSpheres(spheres)
+        return [renderer for renderer, visible in zip(renderers, inside) if visible]
+
+    def getScreenSize(self, renderer):
+        """
+        Fraction of the height of the screen covered by
+        the bounding sphere of a renderer.
+
+        Parameters
+        ----------
+        renderer : MeshRenderer
+            Renderer to measure
+
+        Returns
+        -------
+        float
+            Size of the renderer on the screen, which is
+            infinite if the camera is inside the sphere
+
+        """
+        x, y, z, radius = self.getBounds(renderer)
+        proj = self.getProjMat()
+        if proj[2][3] == 0:
+            # Orthographic
+            return radius * proj[1][1]
+        position = self.transform.position
+        distance = math.sqrt((x - position.x) ** 2 + (y - position.y) ** 2 +
+                             (z + position.z) ** 2)
+        if distance <= radius:
+            return math.inf
+        return radius * proj[1][1] / distance
+
+    def SelectLODs(self, renderers):
+        """
+        Chooses the meshes that renderers with an
+        :class:`LODGroup` are drawn with, which is the
+        level for their size on the screen. The meshes are
+        kept in :attr:`lodMeshes` and the ``mesh`` of the
+        renderers is not changed.
+
+        Parameters
+        ----------
+        renderers : List[MeshRenderer]
+            Visible renderers
+
+        Returns
+        -------
+        List[MeshRenderer]
+            Renderers that should be drawn
+
+        """
+        self.lodMeshes.clear()
+        selected = []
+        for renderer in renderers:
+            lodGroup = renderer.gameObject.GetComponent(LODGroup)
+            if lodGroup is None or not lodGroup.levels:
+                selected.append(renderer)
+                continue
+            index = lodGroup.Select(self.getScreenSize(renderer))
+            if index == len(lodGroup.levels):
+                continue
+            self.lodMeshes[renderer] = lodGroup.levels[index].mesh
+            selected.append(renderer)
+        return selected
+
+    def getMesh(self, renderer):
+        """
+        Gets the mesh that a renderer is drawn with,
+        which is the level chosen by :meth:`SelectLODs`
+        or the mesh of the renderer.
+
+        """
+        return self.lodMeshes.get(renderer, renderer.mesh)
+
+    def getDistance(self, transform):
+        """
+        Squared distance of a transform from the position
+        of the current :attr:`renderQueue` pass.
+
+        """
+        model = self.getMatrix(transform)
+        return glm.distance2(glm.vec3(model[3]), self.renderQueue.position)
+
     def get2DMatrix(self, rectTransform):
         """Generates model matrix from RectTransform."""
         rect = rectTransform.GetRect(self.size) + rectTransform.offset
@@ -572,53 +1396,400 @@ class Camera(SingleComponent):
         """Sets current shader from name."""
         self.shader = shaders[name]
 
+    def getProjMat(self):
+        """Gets the projection matrix that is in use."""
+        if self.customProjMat is not None:
+            return self.customProjMat
+        if self.ortho:
+            return self.orthoMat
+        return self.projMat
+
+    def UpdateCameraBuffer(self, lights):
+        """
+        Uploads the projection and view matrices and the
+        position of the camera to the ``Camera`` block.
+
+        """
+        position = self.transform.position * Vector3(1, 1, -1)
+        data = (self.getProjMat().to_bytes() + self.getViewMat().to_bytes() +
+                struct.pack("3fii12x", *position, min(len(lights), NR_LIGHTS),
+                            int(self.shadows)))
+        cameraBuffer.Update(data)
+
+    def UpdateLightBuffer(self, lights):
+        """
+        Uploads the first :data:`NR_LIGHTS` lights to the
+        ``Lights`` block.
+
+        """
+        data = []
+        for i, light in enumerate(lights[:NR_LIGHTS]):
+            if self.shadows and i < NR_SHADOW_MAPS:
+                matrix = light.lightSpaceMatrix.to_bytes()
+            else:
+                matrix = identityBytes
+            data.append(struct.pack(
+                "3ff3fi3f4x", *(light.transform.position * Vector3(1, 1, -1)),
+                light.intensity * 10, *(light.color.toRGB() / 255), int(light.type),
+                *(light.transform.forward * Vector3(1, 1, -1))))
+            data.append(matrix)
+        lightBuffer.Update(b"".join(data))
+
     def SetupShader(self, lights):
         self.shader.use()
-        if self.customProjMat is not None:
-            self.shader.setMat4(b"projection", self.customProjMat)
-        elif self.ortho:
-            self.shader.setMat4(b"projection", self.orthoMat)
-        else:
-            self.shader.setMat4(b"projection", self.projMat)
-        self.shader.setInt(b"useShadowMap", int(self.shadows))
-        self.shader.setMat4(b"view", self.getViewMat())
-        self.shader.setVec3(b"viewPos", list(
-            self.transform.position * Vector3(1, 1, -1)))
-
-        self.shader.setInt(b"numLights", len(lights))
-        for i, light in enumerate(lights):
-            lightName = f"lights[{i}].".encode()
-            self.shader.setVec3(lightName + b"pos",
-                                light.transform.position * Vector3(1, 1, -1))
-            self.shader.setFloat(lightName + b"strength", light.intensity * 10)
-            self.shader.setVec3(lightName + b"color",
-                                light.color.toRGB() / 255)
-            self.shader.setInt(lightName + b"type", int(light.type))
-            direction = light.transform.forward
-            self.shader.setVec3(lightName + b"dir",
-                                direction * Vector3(1, 1, -1))
-            if self.shadows:
+        self.UpdateCameraBuffer(lights)
+        if self.shadows:
+            for i, light in enumerate(lights[:NR_SHADOW_MAPS]):
                 gl.glActiveTexture(gl.GL_TEXTURE1 + i)
                 gl.glBindTexture(gl.GL_TEXTURE_2D, light.depthMap)
-                self.shader.setInt(f"shadowMaps[{i}]".encode(), i + 1)
-                location = f"lightSpaceMatrices[{i}]".encode()
-                self.shader.setMat4(location, light.lightSpaceMatrix)
-
-    def SetupDepthShader(self, light):
-        self.depthShader.use()
+            if self.getCascadeLight(lights) != -1:
+                for i, cascade in enumerate(self.cascades):
+                    gl.glActiveTexture(gl.GL_TEXTURE1 + NR_SHADOW_MAPS + i)
+                    gl.glBindTexture(gl.GL_TEXTURE_2D, cascade.depthMap)
+            self.SetShadowSamplers(self.shader)
+
+    def SetShadowSamplers(self, shader):
+        for i, name in enumerate(shadowMapNames):
+            shader.setInt(name, i + 1)
+        for i, name in enumerate(cascadeMapNames):
+            shader.setInt(name, i + 1 + NR_SHADOW_MAPS)
+
+    def getLightSpaceMatrix(self, light):
         proj = glm.ortho(-10, 10, -10, 10, light.near, light.far)
         pos = light.transform.position * Vector3(1, 1, -1)
         look = pos + light.transform.forward * Vector3(1, 1, -1)
         up = light.transform.up * Vector3(1, 1, -1)
         view = glm.lookAt(list(pos), list(look), list(up))
-        light.lightSpaceMatrix = proj * view
+        return proj * view
+
+    def getShadowKey(self, matrix, size, casters):
+        """
+        Gets what a shadow map depends on. Model matrices
+        are only recreated when a Transform changes, so
+        moved casters are found by identity without
+        comparing the matrices.
 
-        location = b"lightSpaceMatrix"
-        self.depthShader.setMat4(location, light.lightSpaceMatrix)
+        Parameters
+        ----------
+        matrix : glm.mat4
+            Light space matrix of the shadow map
+        size : int
+            Resolution of the shadow map
+        casters : List[MeshRenderer]
+            Renderers drawn into the shadow map
+
+        Returns
+        -------
+        tuple
+            Key that is equal for shadow maps that
+            look the same
+
+        """
+        return (matrix, size,
+                [(renderer, self.getMatrix(renderer.transform), renderer.mesh)
+                 for renderer in casters])
+
+    def getCascadeLight(self, lights):
+        """
+        Gets the index of the light that casts cascaded
+        shadows, which is the first directional light.
+
+        Parameters
+        ----------
+        lights : List[Light]
+            Lights of the scene
+
+        Returns
+        -------
+        int
+            Index of the light, or -1 if there are no
+            cascades or no directional lights
+
+        """
+        if not self.shadows or not self.cascades:
+            return -1
+        for i, light in enumerate(lights[:NR_LIGHTS]):
+            if light.type == LightType.Directional:
+                return i
+        return -1
+
+    def SetCascades(self, count=4, distance=None, sizes=None, intervals=None, blend=0.75):
+        """
+        Splits the view of the camera into cascades, which
+        each have a shadow map fitted to their part of the
+        view for the first directional light. Cascades near
+        the camera cover a smaller area, and so have
+        sharper shadows for the same resolution. Set
+        :attr:`cascades` to an empty list to stop using
+        cascades.
+
+        Parameters
+        ----------
+        count : int, optional
+            Number of cascades, at most :data:`NR_CASCADES`.
+            Defaults to 4.
+        distance : float, optional
+            Distance from the camera at which shadows end.
+            Defaults to :attr:`far`.
+        sizes : List[int], optional
+            Resolution of the shadow map of each cascade.
+            Defaults to :attr:`depthMapSize` for all
+            cascades.
+        intervals : List[int], optional
+            Number of frames between updates of each
+            cascade. Defaults to 1 for all cascades.
+        blend : float, optional
+            How far the splits are moved from even spacing
+            towards logarithmic spacing, between 0 and 1.
+            Defaults to 0.75.
+
+        Returns
+        -------
+        List[ShadowCascade]
+            The new cascades
+
+        Raises
+        ------
+        PyUnityException
+            If there are too many cascades, or a list of
+            sizes or intervals has the wrong length
+
+        """
+        if not 1 <= count <= NR_CASCADES:
+            raise PyUnityException(
+                f"Number of cascades must be between 1 and {NR_CASCADES}")
+        if distance is None:
+            distance = self.far
+        if sizes is None:
+            sizes = [self.depthMapSize] * count
+        if intervals is None:
+            intervals = [1] * count
+        if len(sizes) != count or len(intervals) != count:
+            raise PyUnityException(
+                f"Expected a size and an interval for each of the {count} cascades")
+
+        self.cascades = []
+        near = self.near
+        for i in range(count):
+            fraction = (i + 1) / count
+            even = self.near + (distance - self.near) * fraction
+            logarithmic = self.near * (distance / self.near) ** fraction
+            far = blend * logarithmic + (1 - blend) * even
+            self.cascades.append(ShadowCascade(near, far, sizes[i], intervals[i]))
+            near = far
+        return self.cascades
+
+    def getCascadeMatrix(self, light, near, far, size):
+        """
+        Fits a light space matrix around the part of the
+        view of the camera between two distances. The
+        matrix covers a sphere around that part, so that
+        its size does not change as the camera turns, and
+        is moved in whole texels, so that shadows do not
+        flicker as the camera moves.
+
+        Parameters
+        ----------
+        light : Light
+            Directional light casting the shadows
+        near : float
+            Distance from the camera where the part starts
+        far : float
+            Distance from the camera where the part ends
+        size : int
+            Resolution of the shadow map
+
+        Returns
+        -------
+        glm.mat4
+            The light space matrix
+
+        """
+        inverse = glm.inverse(self.getProjMat() * self.getViewMat())
+        corners = []
+        for x in (-1, 1):
+            for y in (-1, 1):
+                start = inverse * glm.vec4(x, y, -1, 1)
+                end = inverse * glm.vec4(x, y, 1, 1)
+                start = glm.vec3(start) / start.w
+                end = glm.vec3(end) / end.w
+                for distance in (near, far):
+                    t = (distance - self.near) / (self.far - self.near)
+                    corners.append(start + (end - start) * t)
+        center = sum(corners, glm.vec3()) / len(corners)
+        radius = max(glm.length(corner - center) for corner in corners)
+        radius = math.ceil(radius * 16) / 16
+
+        direction = glm.vec3(*(light.transform.forward * Vector3(1, 1, -1)))
+        up = glm.vec3(*(light.transform.up * Vector3(1, 1, -1)))
+        rotation = glm.lookAt(glm.vec3(), direction, up)
+        texel = radius * 2 / size
+        lightCenter = glm.vec3(rotation * glm.vec4(center, 1))
+        lightCenter.x = math.floor(lightCenter.x / texel) * texel
+        lightCenter.y = math.floor(lightCenter.y / texel) * texel
+        center = glm.vec3(glm.inverse(rotation) * glm.vec4(lightCenter, 1))
+
+        # Casters up to light.far outside of the sphere still cast shadows
+        eye = center - direction * (radius + light.far)
+        view = glm.lookAt(eye, center, up)
+        proj = glm.ortho(-radius, radius, -radius, radius, 0, radius * 2 + light.far)
+        return proj * view
+
+    def UpdateCascadeBuffer(self, index):
+        """
+        Uploads the cascades to the ``Cascades`` block.
+
+        Parameters
+        ----------
+        index : int
+            Index of the light that casts cascaded shadows,
+            or -1 if no light does
+
+        """
+        cascades = self.cascades if index != -1 else []
+        matrices = [cascade.matrix.to_bytes() for cascade in cascades]
+        matrices.extend([identityBytes] * (NR_CASCADES - len(cascades)))
+        splits = [cascade.far for cascade in cascades]
+        splits.extend([0] * (NR_CASCADES - len(cascades)))
+        # Width of a texel of each map in depth units, for the bias.
+        # The rows of an orthographic light space matrix are scaled by
+        # 1 / radius and 2 / depth range.
+        biases = [glm.length(glm.vec3(glm.row(cascade.matrix, 2))) /
+                  (glm.length(glm.vec3(glm.row(cascade.matrix, 0))) * cascade.size)
+                  for cascade in cascades]
+        biases.extend([0] * (NR_CASCADES - len(cascades)))
+        data = b"".join(matrices) + struct.pack(
+            "%dfii8x" % (NR_CASCADES * 2), *splits, *biases, index, len(cascades))
+        cascadeBuffer.Update(data)
+
+    def SetupDepthShader(self, index, cascade=-1):
+        if self.depthShader.supportsInstancing:
+            variant = self.depthShader.GetVariant("INSTANCED")
+            variant.use()
+            variant.setInt(b"lightIndex", index)
+            variant.setInt(b"cascadeIndex", cascade)
+        self.depthShader.use()
+        self.depthShader.setInt(b"lightIndex", index)
+        self.depthShader.setInt(b"cascadeIndex", cascade)
+
+    def GroupInstances(self, renderers, shader, material=True):
+        """
+        Splits renderers into those drawn one at a time and
+        groups drawn with instancing.
+
+        Parameters
+        ----------
+        renderers : List[MeshRenderer]
+            Renderers to split
+        shader : Shader
+            Shader that the renderers will be drawn with
+        material : bool, optional
+            If True, renderers are grouped by mesh and
+            material, otherwise only by mesh. Defaults to
+            True.
+
+        Returns
+        -------
+        tuple
+            List of single renderers and list of groups
+
+        """
+        if not self.instancing or not shader.supportsInstancing:
+            return renderers, []
+        groups = {}
+        single = []
+        for renderer in renderers:
+            mesh = self.getMesh(renderer)
+            if mesh is None:
+                continue
+            if material and renderer.mat.transparent:
+                # Must be sorted individually
+                single.append(renderer)
+                continue
+            key = (mesh, renderer.mat) if material else mesh
+            groups.setdefault(key, []).append(renderer)
+        instanced = []
+        for group in groups.values():
+            if len(group) >= self.minInstances:
+                instanced.append(group)
+            else:
+                single.extend(group)
+        return single, instanced
+
+    def DrawInstanced(self, group, color=True):
+        """
+        Draws renderers that share a mesh with one draw
+        call. The shader in use must be an ``INSTANCED``
+        variant.
+
+        Parameters
+        ----------
+        group : List[MeshRenderer]
+            Renderers to draw
+        color : bool, optional
+            Whether to include the color of the material
+            in the instance data. Defaults to True.
+
+        """
+        data = []
+        for renderer in group:
+            data.append(self.getMatrix(renderer.transform).to_bytes())
+            data.append(self.getNormalMatrix(renderer.transform).to_bytes())
+            if color:
+                data.append(struct.pack("3f", *(renderer.mat.color.toRGB() / 255)))
+            else:
+                data.append(bytes(12))
+        self.renderQueue.DrawInstanced(self.getMesh(group[0]), b"".join(data), len(group))
+
+    def QueueDraws(self, renderers, shader, material=True):
+        """
+        Starts a pass of :attr:`renderQueue` and adds the
+        renderers to it.
+
+        Parameters
+        ----------
+        renderers : List[MeshRenderer]
+            Renderers to draw
+        shader : Shader
+            Shader to draw with
+        material : bool, optional
+            Whether the textures and transparency of the
+            materials matter. Defaults to True.
+
+        Returns
+        -------
+        list
+            Sorted draws, see :meth:`RenderQueue.Sort`
+
+        """
+        queue = self.renderQueue
+        queue.Begin(glm.vec3(*(self.transform.position * Vector3(1, 1, -1))))
+        single, instanced = self.GroupInstances(renderers, shader, material)
+        for renderer in single:
+            mesh = self.getMesh(renderer)
+            if mesh is None:
+                continue
+            if material:
+                queue.Add(shader, [renderer], self.getDistance(renderer.transform),
+                          renderer.mat.texture, renderer.mat.transparent, mesh=mesh)
+            else:
+                queue.Add(shader, [renderer], self.getDistance(renderer.transform), mesh=mesh)
+        if instanced:
+            variant = shader.GetVariant("INSTANCED")
+            for group in instanced:
+                distance = min(self.getDistance(renderer.transform)
+                               for renderer in group)
+                texture = group[0].mat.texture if material else None
+                queue.Add(variant, group, distance, texture, instanced=True,
+                          mesh=self.getMesh(group[0]))
+        return queue.Sort()
 
     def Draw(self, renderers):
         """
         Draw specific renderers, taking into account light positions.
+        The draws are ordered by :attr:`renderQueue`, and
+        renderers that share a mesh and material are drawn
+        with instancing, see :attr:`instancing`.
 
         Parameters
         ----------
@@ -626,38 +1797,58 @@ class Camera(SingleComponent):
             Which meshes to render
 
         """
-        self.shader.use()
-        for renderer in renderers:
-            model = self.getMatrix(renderer.transform)
-            normModel = glm.transpose(glm.inverse(glm.mat3(model)))
-            self.shader.setMat4(b"model", model)
-            self.shader.setMat3(b"normModel", normModel)
-            self.shader.setVec3(b"objectColor", renderer.mat.color.toRGB() / 255)
-            if renderer.mat.texture is not None:
-                self.shader.setInt(b"textured", 1)
-                renderer.mat.texture.use()
-            renderer.Render()
+        queue = self.renderQueue
+        for _, shader, group, instanced in self.QueueDraws(renderers, self.shader):
+            if queue.UseShader(shader) and instanced and self.shadows:
+                self.SetShadowSamplers(shader)
+            texture = group[0].mat.texture
+            shader.setInt(b"textured", int(texture is not None))
+            queue.UseTexture(texture)
+            if instanced:
+                self.DrawInstanced(group)
+                continue
+            renderer = group[0]
+            shader.setMat4(b"model", self.getMatrix(renderer.transform))
+            shader.setMat3(b"normModel", self.getNormalMatrix(renderer.transform))
+            shader.setVec3(b"objectColor", renderer.mat.color.toRGB() / 255)
+            queue.DrawMesh(self.getMesh(renderer))
+        queue.End()
 
     def DrawDepth(self, renderers):
-        self.depthShader.use()
-        for renderer in renderers:
-            model = self.getMatrix(renderer.transform)
-            self.depthShader.setMat4(b"model", model)
-            renderer.Render()
+        queue = self.renderQueue
+        draws = self.QueueDraws(renderers, self.depthShader, material=False)
+        for _, shader, group, instanced in draws:
+            queue.UseShader(shader)
+            if instanced:
+                self.DrawInstanced(group, color=False)
+                continue
+            shader.setMat4(b"model", self.getMatrix(group[0].transform))
+            queue.DrawMesh(self.getMesh(group[0]))
+        queue.End()
 
+    @Profiler.Profile("shadowPass")
     def RenderDepth(self, renderers, lights):
         previousFBO = gl.glGetIntegerv(gl.GL_DRAW_FRAMEBUFFER_BINDING)
         previousViewport = gl.glGetIntegerv(gl.GL_VIEWPORT)
+        if self.shadows:
+            for light in lights[:NR_SHADOW_MAPS]:
+                light.lightSpaceMatrix = self.getLightSpaceMatrix(light)
+        self.UpdateLightBuffer(lights)
+        self.shadowCulled = 0
+        self.shadowsCached = 0
+        cascadeLight = self.getCascadeLight(lights)
         if self.shadows:
             gl.glDisable(gl.GL_CULL_FACE)
-            for light in lights:
+            for i, light in enumerate(lights[:NR_SHADOW_MAPS]):
                 if not hasattr(light, "depthFBO"):
                     light.setupBuffers(self.depthMapSize)
-                gl.glViewport(0, 0, self.depthMapSize, self.depthMapSize)
-                gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, light.depthFBO)
-                self.SetupDepthShader(light)
-                gl.glClear(gl.GL_DEPTH_BUFFER_BIT)
-                self.DrawDepth(renderers)
+                if i == cascadeLight:
+                    # Shadowed by the cascades instead
+                    continue
+                casters = self.Cull(renderers, light.lightSpaceMatrix)
+                self.shadowCulled += len(renderers) - len(casters)
+                self.RenderShadowMap(i, light, casters)
+            self.RenderCascades(renderers, lights)
             gl.glEnable(gl.GL_CULL_FACE)
 
             # from PIL import Image
@@ -665,10 +1856,114 @@ class Camera(SingleComponent):
             #     gl.GL_DEPTH_COMPONENT, gl.GL_UNSIGNED_BYTE, outputType=int)
             # im = Image.fromarray(data, "L")
             # im.rotate(180).save("test.png")
+        else:
+            self.UpdateCascadeBuffer(-1)
 
         gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, previousFBO)
         gl.glViewport(*previousViewport)
 
+    def RenderShadowMap(self, index, light, casters, cascade=None):
+        """
+        Draws the shadow map of a light, unless it would
+        look the same as the last time it was drawn.
+        Static casters, see :attr:`MeshRenderer.isStatic`,
+        are kept in a separate layer that is copied into
+        the shadow map before the other casters are drawn,
+        so that moving casters do not need the static
+        casters to be drawn again.
+
+        Parameters
+        ----------
+        index : int
+            Index of the light in the ``Lights`` block
+        light : Light
+            Light to draw the shadow map of
+        casters : List[MeshRenderer]
+            Renderers that cast shadows in the map
+        cascade : ShadowCascade, optional
+            If given, the shadow map of this cascade is
+            drawn instead of that of the light
+
+        """
+        if cascade is None:
+            target = light
+            matrix = light.lightSpaceMatrix
+            size = self.depthMapSize
+            cascadeIndex = -1
+        else:
+            target = cascade
+            matrix = cascade.matrix
+            size = cascade.size
+            cascadeIndex = self.cascades.index(cascade)
+
+        static = [renderer for renderer in casters if renderer.isStatic]
+        dynamic = [renderer for renderer in casters if not renderer.isStatic]
+        cache = target.shadowCache
+        staticKey = self.getShadowKey(matrix, size, static)
+        key = (staticKey, self.getShadowKey(matrix, size, dynamic))
+        if self.shadowCaching and key == cache.key:
+            self.shadowsCached += 1
+            return
+        cache.key = key
+
+        gl.glViewport(0, 0, size, size)
+        self.SetupDepthShader(index, cascadeIndex)
+        if not static or not dynamic:
+            gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, target.depthFBO)
+            gl.glClear(gl.GL_DEPTH_BUFFER_BIT)
+            self.DrawDepth(casters)
+            return
+
+        if not hasattr(target, "staticFBO"):
+            target.setupStaticBuffers(size)
+        if staticKey != cache.staticKey or not self.shadowCaching:
+            cache.staticKey = staticKey
+            gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, target.staticFBO)
+            gl.glClear(gl.GL_DEPTH_BUFFER_BIT)
+            self.DrawDepth(static)
+        gl.glBindFramebuffer(gl.GL_READ_FRAMEBUFFER, target.staticFBO)
+        gl.glBindFramebuffer(gl.GL_DRAW_FRAMEBUFFER, target.depthFBO)
+        gl.glBlitFramebuffer(0, 0, size, size, 0, 0, size, size,
+                             gl.GL_DEPTH_BUFFER_BIT, gl.GL_NEAREST)
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, target.depthFBO)
+        self.DrawDepth(dynamic)
+
+    def RenderCascades(self, renderers, lights):
+        """
+        Updates the cascades that are due, see
+        :meth:`SetCascades`, and draws their shadow maps.
+
+        Parameters
+        ----------
+        renderers : List[MeshRenderer]
+            Renderers that may cast shadows
+        lights : List[Light]
+            Lights of the scene
+
+        """
+        index = self.getCascadeLight(lights)
+        if index != -1:
+            light = lights[index]
+            for cascade in self.cascades:
+                cascade.age += 1
+                if cascade.matrix is not None and cascade.age < cascade.interval:
+                    continue
+                cascade.age = 0
+                cascade.matrix = self.getCascadeMatrix(
+                    light, cascade.near, cascade.far, cascade.size)
+        self.UpdateCascadeBuffer(index)
+        if index == -1:
+            return
+
+        for cascade in self.cascades:
+            if cascade.age != 0:
+                continue
+            casters = self.Cull(renderers, cascade.matrix)
+            self.shadowCulled += len(renderers) - len(casters)
+            if not hasattr(cascade, "depthFBO"):
+                cascade.setupBuffers()
+            self.RenderShadowMap(index, light, casters, cascade)
+
     def RenderScene(self, renderers, lights):
         gl.glClearColor(*(self.clearColor.toRGB() / 255), 1)
         gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
@@ -676,8 +1971,13 @@ class Camera(SingleComponent):
         self.Draw(renderers)
 
     def Render(self, renderers, lights):
+        visible = self.Cull(renderers, self.getProjMat() * self.getViewMat())
+        # Shadows are drawn with the meshes of the renderers
         self.RenderDepth(renderers, lights)
-        self.RenderScene(renderers, lights)
+        visible = self.SelectLODs(visible)
+        self.culled = len(renderers) - len(visible)
+        self.RenderScene(visible, lights)
+        self.lodMeshes.clear()
         self.RenderSkybox()
         self.Render2D()
 
@@ -685,12 +1985,12 @@ class Camera(SingleComponent):
         if self.skyboxEnabled:
             gl.glDepthFunc(gl.GL_LEQUAL)
             self.skyboxShader.use()
-            self.skyboxShader.setMat4(b"view", glm.mat4(glm.mat3(self.getViewMat())))
-            self.skyboxShader.setMat4(b"projection", self.projMat)
+            self.skyboxShader.setMat4(b"skyProj", self.projMat)
             self.skybox.use()
             gl.glDrawArrays(gl.GL_TRIANGLES, 0, 36)
             gl.glDepthFunc(gl.GL_LESS)
 
+    @Profiler.Profile("render2D")
     def Render2D(self):
         """
         Draw all Image2D and Text components in the Camera's
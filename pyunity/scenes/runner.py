@@ -5,11 +5,12 @@
 __all__ = ["ChangeScene", "Runner", "WindowRunner", "NonInteractiveRunner"]
 
 from .. import Logger, config, render
+from .. import profiler as Profiler
 from ..errors import PyUnityException
 from ..events import (EventLoopManager, WaitForFixedUpdate, WaitForRender,
                       WaitForUpdate)
+from .streaming import SceneStreamer
 import os
-import copy
 
 class ChangeScene(Exception):
     pass
@@ -19,16 +20,21 @@ class Runner:
         self.scene = None
         self.next = None
         self.opened = False
+        self.streamer = SceneStreamer(self)
 
-    def setScene(self, scene):
+    def setScene(self, scene, clone=True):
         if self.opened:
             raise PyUnityException("Cannot set scene after opening runner")
-        self.scene = copy.deepcopy(scene)
+        if clone:
+            scene = scene.Clone()
+        self.scene = scene
 
-    def setNext(self, scene):
+    def setNext(self, scene, clone=True):
         if self.scene is None:
             raise PyUnityException("Cannot set next before first scene")
-        self.next = copy.deepcopy(scene)
+        if clone:
+            scene = scene.Clone()
+        self.next = scene
         raise ChangeScene
 
     def open(self):
@@ -68,6 +74,7 @@ class Runner:
         if self.next is None:
             raise
         self.eventLoopManager.quit()
+        self.streamer.Clear()
         self.scene.cleanUp()
         self.scene = self.next
         self.next = None
@@ -75,6 +82,8 @@ class Runner:
 
     def quit(self):
         self.eventLoopManager.quit()
+        EventLoopManager.shutdownPools()
+        self.streamer.Clear()
         self.scene.cleanUp()
 
         self.scene = None
@@ -108,10 +117,12 @@ class WindowRunner(Runner):
     def load(self, managerClass=EventLoopManager):
         super(WindowRunner, self).load(managerClass)
         self.eventLoopManager.schedule(
-            self.scene.updateScripts, self.window.updateFunc,
+            self.streamer.Integrate, self.scene.updateScripts,
+            self.eventLoopManager.jobs.run, self.window.updateFunc,
             ups=config.fps, waitFor=WaitForUpdate)
         self.eventLoopManager.schedule(
-            self.window.refresh, self.scene.Render,
+            Profiler.Profile("refresh")(self.window.refresh),
+            self.streamer.Upload, self.scene.Render,
             main=True, waitFor=WaitForRender)
         if self.scene.mainCamera is not None:
             self.window.setResize(self.scene.mainCamera.Resize)
@@ -132,13 +143,127 @@ class WindowRunner(Runner):
         Logger.LogLine(Logger.INFO, "Reset skyboxes")
 
 class NonInteractiveRunner(Runner):
+    def __init__(self):
+        super(NonInteractiveRunner, self).__init__()
+        self.loop = None
+        self.accumulator = 0
+        self.ticks = 0
+
     def load(self, managerClass=EventLoopManager):
+        if self.loop is not None:
+            # The scene changed while fast-forwarding
+            self.startFastForward()
+            return
         super(NonInteractiveRunner, self).load(managerClass)
         self.eventLoopManager.schedule(
-            self.scene.updateScripts,
+            self.streamer.Integrate, self.scene.updateScripts,
+            self.eventLoopManager.jobs.run,
             ups=config.fps, waitFor=WaitForUpdate)
         self.scene.startLoop()
 
+    def fastForward(self, ticks=None, until=None, dt=None, fixedDt=0.02, jobSlices=16):
+        """
+        Step the scene with a fixed simulated timestep as
+        fast as possible. Everything is run on the calling
+        thread in a single event loop, so the results are
+        deterministic. Use this instead of :meth:`load`
+        and :meth:`start`.
+
+        Parameters
+        ----------
+        ticks : int, optional
+            Number of updates to run
+        until : Callable[[Scene], bool], optional
+            Called with the current scene after every update.
+            Stepping stops when it returns True.
+        dt : float, optional
+            Simulated time between updates. Defaults to
+            ``1 / config.fps``, or ``1 / 60`` if uncapped.
+        fixedDt : float, optional
+            Simulated time between fixed updates, by
+            default 0.02
+        jobSlices : int, optional
+            Number of job slices run after each update, in
+            place of the time budget of :attr:`config.jobBudget`.
+            Defaults to 16.
+
+        Returns
+        -------
+        int
+            Number of updates run
+
+        Raises
+        ------
+        PyUnityException
+            If neither ``ticks`` nor ``until`` is provided,
+            or if the runner has not been opened
+
+        Notes
+        -----
+        Calling this again continues the same simulation,
+        until :meth:`quit` is called. Fixed updates run
+        before each update whenever enough simulated time
+        has accumulated. :class:`WaitForSeconds` follows the
+        simulated time, while :class:`WaitForSecondsRealtime`
+        still uses the wall clock.
+
+        """
+        if ticks is None and until is None:
+            raise PyUnityException("Either ticks or until must be provided")
+        if not self.opened:
+            raise PyUnityException("Cannot fast-forward before opening runner")
+        if dt is None:
+            dt = 1 / config.fps if config.fps else 1 / 60
+        if self.loop is None:
+            self.startFastForward()
+
+        count = 0
+        while ticks is None or count < ticks:
+            try:
+                self.tick(dt, fixedDt, jobSlices)
+            except ChangeScene:
+                self.changeScene()
+            count += 1
+            if until is not None and until(self.scene):
+                break
+        return count
+
+    def startFastForward(self):
+        if self.loop is not None:
+            self.loop.close()
+        Logger.LogLine(Logger.DEBUG, "Starting scene in fast-forward mode")
+        self.eventLoopManager = EventLoopManager()
+        self.eventLoopManager.begin(WaitForUpdate, WaitForFixedUpdate)
+
+        self.loop = self.scene.startScripts()
+        self.eventLoopManager.mainLoop = self.loop
+        self.accumulator = 0
+        self.ticks = 0
+        self.scene.startLoop()
+        self.eventLoopManager.step(None)
+        if self.eventLoopManager.gcPolicy is not None:
+            self.eventLoopManager.gcPolicy.Start()
+
+    def tick(self, dt, fixedDt, jobSlices):
+        self.accumulator += dt
+        while self.accumulator >= fixedDt:
+            self.accumulator -= fixedDt
+            self.eventLoopManager.step(
+                WaitForFixedUpdate, lambda loop: self.scene.updateFixed(loop, fixedDt))
+
+        self.eventLoopManager.step(
+            WaitForUpdate, self.streamer.Integrate,
+            lambda loop: self.scene.updateScripts(loop, dt))
+        self.eventLoopManager.jobs.run(slices=jobSlices)
+        self.eventLoopManager.idle(0)
+        self.ticks += 1
+
+    def quit(self):
+        super(NonInteractiveRunner, self).quit()
+        if self.loop is not None:
+            self.loop.close()
+            self.loop = None
+
 def newRunner():
     if os.environ["PYUNITY_INTERACTIVE"] == "1":
         return WindowRunner()
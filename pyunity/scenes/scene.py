@@ -15,18 +15,21 @@ the :class:`SceneManager` submodule.
 __all__ = ["Scene"]
 
 from .. import Logger, config
+from .. import profiler as Profiler
 from ..audio import AudioListener, AudioSource
 from ..core import Component, GameObject, Tag
 from ..errors import ComponentException, GameObjectException, PyUnityException
-from ..events import EventLoop
-from ..files import Asset, Behaviour
+from ..events import EventLoop, EventLoopManager
+from ..files import Asset, Behaviour, ClonePlan
 from ..meshes import MeshRenderer
 from ..physics.core import CollManager
-from ..render import Camera, Light, Screen
-from ..values import Mathf, Vector3
+from ..render import Camera, Frustum, Light
+from ..spatial import Octree
+from ..values import Vector3
 from pathlib import Path
 import os
 import sys
+import copy
 import time
 import inspect
 
@@ -36,11 +39,25 @@ if os.environ["PYUNITY_INTERACTIVE"] == "1":
 disallowedChars = set(":*/\"\\?<>|")
 
 def createTask(loop, coro, *args):
+    if Profiler.enabled:
+        return profileTask(loop, coro, *args)
     if inspect.iscoroutinefunction(coro):
         loop.create_task(coro(*args))
     else:
         coro(*args)
 
+def profileTask(loop, coro, *args):
+    name = type(coro.__self__).__name__ + "." + coro.__name__
+    task = inspect.iscoroutinefunction(coro)
+    start = time.perf_counter()
+    try:
+        if task:
+            loop.create_task(coro(*args))
+        else:
+            coro(*args)
+    finally:
+        Profiler.Record(name, "behaviour", start, time.perf_counter(), task)
+
 class Scene(Asset):
     """
     Class to hold all of the GameObjects, and to run the whole
@@ -69,6 +86,8 @@ class Scene(Asset):
         light.AddComponent(Light)
         light.scene = self
         self.gameObjects = [self.mainCamera.gameObject, light]
+        self.staticBatches = []
+        self.octree = None
 
     def GetAssetFile(self, gameObject):
         return Path("Scenes") / (self.name + ".scene")
@@ -96,8 +115,36 @@ class Scene(Asset):
         cls.name = name
         cls.gameObjects = []
         cls.mainCamera = None
+        cls.staticBatches = []
+        cls.octree = None
         return cls
 
+    def Clone(self):
+        """
+        Create a copy of the scene using a :class:`ClonePlan`.
+        Every attribute of the GameObjects and Components is
+        copied, but Assets such as Meshes, Materials and
+        Textures are shared with the original scene.
+
+        Returns
+        -------
+        Scene
+            The copied scene
+
+        """
+        plan = ClonePlan(self.gameObjects, savedOnly=False)
+        scene = Scene.__new__(Scene)
+        memo = {id(self): scene}
+        gameObjects = plan.Execute(memo)
+
+        for k, v in self.__dict__.items():
+            if k != "gameObjects":
+                scene.__dict__[k] = copy.deepcopy(v, memo)
+        scene.gameObjects = gameObjects
+        for gameObject in gameObjects:
+            gameObject.scene = scene
+        return scene
+
     @property
     def rootGameObjects(self):
         """All GameObjects which have no parent"""
@@ -118,6 +165,8 @@ class Scene(Asset):
                                    (gameObject.name, gameObject.scene.name))
         gameObject.scene = self
         self.gameObjects.append(gameObject)
+        if self.octree is not None:
+            self.octree.Sync(gameObject)
 
     def AddMultiple(self, *args):
         """
@@ -156,11 +205,16 @@ class Scene(Asset):
         for gameObject in pending:
             for component in gameObject.GetComponents(Behaviour):
                 component.OnDestroy()
+            for renderer in gameObject.GetComponents(MeshRenderer):
+                if renderer.staticBatch is not None:
+                    renderer.staticBatch.Remove()
 
         for gameObject in pending:
             if gameObject in self.gameObjects:
                 gameObject.scene = None
                 self.gameObjects.remove(gameObject)
+                if self.octree is not None:
+                    self.octree.Sync(gameObject)
                 if self.mainCamera is not None and gameObject is self.mainCamera.gameObject:
                     Logger.LogLine(Logger.WARN,
                                    f"Removing Main Camera from scene {self.name!r}")
@@ -318,6 +372,40 @@ class Scene(Asset):
             components.extend(query)
         return components
 
+    def EnableOctree(self, center=None, halfSize=1024, maxDepth=8):
+        """
+        Creates an :class:`Octree` containing the
+        MeshRenderers of the scene, which is kept up to
+        date as GameObjects are added, removed and moved.
+        The main camera uses it for culling.
+
+        Parameters
+        ----------
+        center : Vector3, optional
+            Center of the root cell. Defaults to the origin.
+        halfSize : float, optional
+            Half of the width of the root cell. Defaults
+            to 1024.
+        maxDepth : int, optional
+            Maximum depth of a cell. Defaults to 8.
+
+        Returns
+        -------
+        Octree
+            The new octree
+
+        """
+        self.octree = Octree(center, halfSize, maxDepth)
+        for gameObject in self.gameObjects:
+            self.octree.Sync(gameObject)
+        for batch in self.staticBatches:
+            self.octree.Add(batch.renderer)
+        return self.octree
+
+    def DisableOctree(self):
+        """Removes the octree of the scene."""
+        self.octree = None
+
     def insideFrustum(self, renderer):
         """
         Check if the renderer's mesh can be
@@ -334,46 +422,11 @@ class Scene(Asset):
             If the mesh can be seen
 
         """
-        mesh = renderer.mesh
-        if mesh is None:
+        if renderer.mesh is None:
             return False
-        pos = self.mainCamera.transform.position * Vector3(1, 1, -1)
-        directionX = self.mainCamera.transform.right * Vector3(1, 1, -1)
-        directionY = self.mainCamera.transform.up * Vector3(1, 1, -1)
-        directionZ = self.mainCamera.transform.forward * Vector3(1, 1, -1)
-        if renderer.transform.parent is not None:
-            parent = renderer.transform.parent.position
-        else:
-            parent = Vector3.zero()
-        rpmin = renderer.transform.rotation.RotateVector(
-            mesh.min - renderer.transform.localPosition)
-        rpmax = renderer.transform.rotation.RotateVector(
-            mesh.max - renderer.transform.localPosition)
-        rpmin += parent - pos
-        rpmax += parent - pos
-
-        minZ = rpmin.dot(directionZ)
-        maxZ = rpmax.dot(directionZ)
-        if minZ > self.mainCamera.near or maxZ < self.mainCamera.far:
-            return True
-
-        minY = rpmin.dot(directionY)
-        maxY = rpmax.dot(directionY)
-        hmin = minZ * 2 * \
-            Mathf.Tan(self.mainCamera.fov / Screen.size.x *
-                      Screen.size.y / 2 * Mathf.DEG_TO_RAD)
-        hmax = maxZ * 2 * \
-            Mathf.Tan(self.mainCamera.fov / Screen.size.x *
-                      Screen.size.y / 2 * Mathf.DEG_TO_RAD)
-        if minY > -hmin / 2 or maxY < hmax / 2:
-            return True
-
-        minX = rpmin.dot(directionX)
-        maxX = rpmax.dot(directionX)
-        wmin, wmax = hmin * \
-            Screen.size.x / Screen.size.y, hmax * \
-            Screen.size.x / Screen.size.y
-        return minX > -wmin / 2 or maxX < wmax / 2
+        camera = self.mainCamera
+        frustum = Frustum(camera.getProjMat() * camera.getViewMat())
+        return frustum.ContainsSphere(Camera.getBounds(renderer))
 
     def startOpenGL(self):
         self.mainCamera.Resize(*config.size)
@@ -456,11 +509,26 @@ class Scene(Asset):
         self.startScripts()
         self.startOpenGL()
 
-    def updateScripts(self, loop):
-        """Updates all scripts in the scene."""
+    @Profiler.Profile("updateScripts")
+    def updateScripts(self, loop, dt=None):
+        """
+        Updates all scripts in the scene.
+
+        Parameters
+        ----------
+        loop : EventLoop
+            Event loop to run the scripts in
+        dt : float, optional
+            Simulated time since the last update. If None,
+            the time elapsed since the last update is used.
+
+        """
         from ..input import Input
-        dt = max(time.perf_counter() - self.lastFrame, sys.float_info.epsilon)
-        self.lastFrame = time.perf_counter()
+        if dt is None:
+            dt = max(time.perf_counter() - self.lastFrame, sys.float_info.epsilon)
+            self.lastFrame = time.perf_counter()
+        if EventLoopManager.current is not None:
+            EventLoopManager.current.timers.Tick(dt)
         if os.environ["PYUNITY_INTERACTIVE"] == "1":
             Input.UpdateAxes(dt)
             if self.mainCamera is not None and self.mainCamera.canvas is not None:
@@ -487,9 +555,25 @@ class Scene(Asset):
                 if component.enabled:
                     createTask(loop, component.LateUpdate, dt)
 
-    def updateFixed(self, loop):
-        dt = max(time.perf_counter() - self.lastFixedFrame, sys.float_info.epsilon)
-        self.lastFixedFrame = time.perf_counter()
+    @Profiler.Profile("updateFixed")
+    def updateFixed(self, loop, dt=None):
+        """
+        Steps the physics and runs
+        :meth:`Behaviour.FixedUpdate` of all scripts.
+
+        Parameters
+        ----------
+        loop : EventLoop
+            Event loop to run the scripts in
+        dt : float, optional
+            Simulated time since the last fixed update. If
+            None, the time elapsed since the last fixed
+            update is used.
+
+        """
+        if dt is None:
+            dt = max(time.perf_counter() - self.lastFixedFrame, sys.float_info.epsilon)
+            self.lastFixedFrame = time.perf_counter()
         if self.physics:
             self.collManager.Step(dt)
             for gameObject in self.gameObjects:
@@ -499,6 +583,56 @@ class Scene(Asset):
                     if component.enabled:
                         createTask(loop, component.FixedUpdate, dt)
 
+    def GetRenderers(self):
+        """
+        Gets the renderers that cameras draw, which are
+        the MeshRenderers that are not in a
+        :class:`StaticBatch` and the renderers of the
+        StaticBatches.
+
+        Returns
+        -------
+        List[MeshRenderer]
+            The renderers. If the scene has an octree, it
+            is updated and the renderers with a mesh are
+            taken from it.
+
+        """
+        if self.octree is not None:
+            self.octree.Update()
+            return list(self.octree)
+        renderers = [renderer for renderer in self.FindComponents(MeshRenderer)
+                     if renderer.staticBatch is None]
+        renderers.extend(batch.renderer for batch in self.staticBatches)
+        return renderers
+
+    def Cull(self, frustum):
+        """
+        Gets the renderers from :meth:`GetRenderers` that
+        are inside a frustum. If the scene has an octree,
+        only the cells inside the frustum are tested.
+
+        Parameters
+        ----------
+        frustum : Frustum
+            Frustum to test against
+
+        Returns
+        -------
+        List[MeshRenderer]
+            Renderers that may be inside the frustum
+
+        """
+        if self.octree is not None:
+            self.octree.Update()
+            return self.octree.QueryFrustum(frustum)
+        renderers = [renderer for renderer in self.GetRenderers()
+                     if renderer.mesh is not None]
+        spheres = [Camera.getBounds(renderer) for renderer in renderers]
+        inside = frustum.CullSpheres(spheres)
+        return [renderer for renderer, visible in zip(renderers, inside) if visible]
+
+    @Profiler.Profile("Scene.Render")
     def Render(self, loop=None):
         """
         Call the appropriate rendering functions
@@ -522,7 +656,7 @@ class Scene(Asset):
             for component in behaviours:
                 createTask(loop, component.OnPreRender)
 
-        renderers = self.FindComponents(MeshRenderer)
+        renderers = self.GetRenderers()
         lights = self.FindComponents(Light)
         self.mainCamera.renderPass = True
         self.mainCamera.Render(renderers, lights)
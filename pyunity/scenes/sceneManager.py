@@ -10,7 +10,8 @@ of Scenes.
 
 __all__ = ["RemoveScene", "GetSceneByName", "LoadSceneByIndex", "AddBareScene",
            "LoadSceneByName", "CurrentScene", "AddScene", "LoadScene",
-           "RemoveAllScenes", "GetSceneByIndex", "KeyboardInterruptKill"]
+           "RemoveAllScenes", "GetSceneByIndex", "KeyboardInterruptKill",
+           "LoadSceneAdditive", "LoadSceneAsync", "UnloadScene", "LoadedScenes"]
 
 from .. import logger as Logger
 from .. import settings
@@ -163,7 +164,7 @@ def RemoveAllScenes():
         scenesByName.pop(scene.name)
     scenesByIndex.clear()
 
-def LoadSceneByName(name):
+def LoadSceneByName(name, clone=True):
     """
     Loads a scene by its name.
 
@@ -171,6 +172,11 @@ def LoadSceneByName(name):
     ----------
     name : str
         Name of the scene
+    clone : bool, optional
+        If True, a copy of the scene is run so that the
+        original can be loaded again. Pass False if the
+        scene will not be reused, to skip copying it.
+        Defaults to True.
 
     Raises
     ------
@@ -184,9 +190,9 @@ def LoadSceneByName(name):
         raise TypeError(f"Expected str, got {type(name).__name__}")
     if name not in scenesByName:
         raise PyUnityException(f"There is no scene named {name!r}")
-    __loadScene(scenesByName[name])
+    __loadScene(scenesByName[name], clone)
 
-def LoadSceneByIndex(index):
+def LoadSceneByIndex(index, clone=True):
     """
     Loads a scene by its index of when it was added
     to the SceneManager.
@@ -195,6 +201,11 @@ def LoadSceneByIndex(index):
     ----------
     index : int
         Index of the scene
+    clone : bool, optional
+        If True, a copy of the scene is run so that the
+        original can be loaded again. Pass False if the
+        scene will not be reused, to skip copying it.
+        Defaults to True.
 
     Raises
     ------
@@ -208,9 +219,9 @@ def LoadSceneByIndex(index):
         raise TypeError(f"Expected int, got {type(index).__name__}")
     if index >= len(scenesByIndex):
         raise PyUnityException(f"There is no scene at index {index}")
-    __loadScene(scenesByIndex[index])
+    __loadScene(scenesByIndex[index], clone)
 
-def LoadScene(scene):
+def LoadScene(scene, clone=True):
     """
     Load a scene by a reference.
 
@@ -218,6 +229,11 @@ def LoadScene(scene):
     ----------
     scene : Scene
         Scene to be loaded
+    clone : bool, optional
+        If True, a copy of the scene is run so that the
+        original can be loaded again. Pass False if the
+        scene will not be reused, to skip copying it.
+        Defaults to True.
 
     Raises
     ------
@@ -235,15 +251,15 @@ def LoadScene(scene):
     if scene not in scenesByIndex:
         raise PyUnityException(
             "The provided scene is not part of the SceneManager")
-    __loadScene(scene)
+    __loadScene(scene, clone)
 
 def stopWindow():
     Logger.LogLine(Logger.INFO, "Stopping main loop")
     runner.quit()
 
-def __loadScene(scene):
+def __loadScene(scene, clone=True):
     if not runner.opened:
-        runner.setScene(scene)
+        runner.setScene(scene, clone)
         try:
             runner.open()
         except PyUnityExit:
@@ -262,7 +278,7 @@ def __loadScene(scene):
             raise
         runner.setup()
     else:
-        runner.setNext(scene)
+        runner.setNext(scene, clone)
     runner.load()
 
     try:
@@ -278,3 +294,135 @@ def __loadScene(scene):
 def CurrentScene():
     """Gets the current scene being run"""
     return runner.scene
+
+def __checkRunning(source):
+    if isinstance(source, Scene):
+        if source not in scenesByIndex:
+            raise PyUnityException(
+                "The provided scene is not part of the SceneManager")
+    elif not callable(source):
+        raise TypeError(f"Expected Scene or callable, got {type(source).__name__}")
+    if not runner.opened:
+        raise PyUnityException("Cannot load a scene before a scene is running")
+
+def LoadSceneAdditive(scene, clone=True):
+    """
+    Add the GameObjects of a scene to the running
+    scene. The scene is copied on the calling thread,
+    and its GameObjects are added and started at the
+    beginning of the next update.
+
+    Parameters
+    ----------
+    scene : Scene
+        Scene to be loaded
+    clone : bool, optional
+        If True, a copy of the scene is loaded so that the
+        original can be loaded again. Defaults to True.
+
+    Returns
+    -------
+    SceneLoadOperation
+        Handle to the loaded scene, which can be passed
+        to :func:`UnloadScene`
+
+    Raises
+    ------
+    TypeError
+        When the scene is not of type :class:`Scene`
+    PyUnityException
+        When the scene is not part of the SceneManager,
+        or no scene is running
+
+    Notes
+    -----
+    The Main Camera and the directional lights of the
+    loaded scene are not added to the running scene.
+    GameObjects created by the scripts of the loaded
+    scene are not removed by :func:`UnloadScene`.
+
+    """
+    if not isinstance(scene, Scene):
+        raise TypeError(f"Expected Scene, got {type(scene).__name__}")
+    __checkRunning(scene)
+    return runner.streamer.Load(scene, clone, additive=True, background=False)
+
+def LoadSceneAsync(scene, clone=True, additive=False):
+    """
+    Load a scene in the background. The scene is copied,
+    or built, on a worker thread and its meshes and
+    textures are uploaded over several frames, so that
+    the running scene does not stall. Awaiting the
+    returned operation in a coroutine waits until the
+    scene has started.
+
+    Parameters
+    ----------
+    scene : Scene or Callable[[], Scene]
+        Scene to be loaded, or a function that builds it
+        on the worker thread, for example by calling
+        :func:`Loader.LoadScene`
+    clone : bool, optional
+        If True and ``scene`` is a Scene, a copy of the
+        scene is loaded. Defaults to True.
+    additive : bool, optional
+        If True, the GameObjects of the scene are added to
+        the running scene like :func:`LoadSceneAdditive`.
+        Otherwise, the scene replaces the running scene once
+        it has loaded. Defaults to False.
+
+    Returns
+    -------
+    SceneLoadOperation
+        Handle to the scene being loaded
+
+    Raises
+    ------
+    TypeError
+        When the scene is not a Scene or a callable
+    PyUnityException
+        When the scene is not part of the SceneManager,
+        or no scene is running
+
+    Example
+    -------
+    >>> class Streamer(Behaviour):
+    ...     async def Start(self):
+    ...         operation = SceneManager.LoadSceneAsync(
+    ...             lambda: Loader.LoadScene(path, project), additive=True)
+    ...         chunk = await operation
+
+    """
+    __checkRunning(scene)
+    return runner.streamer.Load(scene, clone, additive, background=True)
+
+def UnloadScene(operation):
+    """
+    Remove the GameObjects of a scene that was loaded
+    additively from the running scene at the beginning
+    of the next update. If the scene is still loading,
+    loading is cancelled.
+
+    Parameters
+    ----------
+    operation : SceneLoadOperation
+        Operation returned by :func:`LoadSceneAdditive`
+        or :func:`LoadSceneAsync`
+
+    Raises
+    ------
+    PyUnityException
+        If the scene was not loaded additively
+
+    """
+    runner.streamer.Unload(operation)
+
+def LoadedScenes():
+    """
+    Gets the running scene followed by the scenes that
+    have been loaded additively into it.
+
+    """
+    if runner.scene is None:
+        return []
+    return [runner.scene] + [operation.scene for operation in runner.streamer.loaded]
@@ -0,0 +1,174 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Module to capture and restore the runtime state
+of a Scene in memory.
+
+"""
+
+__all__ = ["SceneSnapshot"]
+
+from ..core import Component, GameObject
+from ..files import Asset, Behaviour, Skybox
+import pickle
+import io
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file, snapshot):
+        super(_SnapshotPickler, self).__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.snapshot = snapshot
+
+    def persistent_id(self, obj):
+        if isinstance(obj, (GameObject, Component)):
+            index = self.snapshot._indices.get(id(obj))
+            if index is not None:
+                return index
+        elif not isinstance(obj, (Asset, Skybox)):
+            return None
+        # Shared by reference, not copied
+        key = id(obj)
+        if key not in self.snapshot._externalIndices:
+            self.snapshot._externalIndices[key] = len(self.snapshot._externals)
+            self.snapshot._externals.append(obj)
+        return -1 - self.snapshot._externalIndices[key]
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, snapshot):
+        super(_SnapshotUnpickler, self).__init__(file)
+        self.snapshot = snapshot
+
+    def persistent_load(self, pid):
+        if pid < 0:
+            return self.snapshot._externals[-1 - pid]
+        return self.snapshot._objects[pid]
+
+class SceneSnapshot:
+    """
+    Binary snapshot of the runtime state of a Scene,
+    kept in memory. The GameObjects of the scene, their
+    names, tags and enabled flags, their components
+    and the saved attributes of every component are
+    captured, which includes Transforms and Rigidbody
+    state.
+
+    Parameters
+    ----------
+    scene : Scene
+        Scene to capture
+
+    Attributes
+    ----------
+    scene : Scene
+        The captured scene
+    data : bytes
+        Pickled state of the scene
+
+    Notes
+    -----
+    Unlike :func:`Loader.SaveScene`, no project or files
+    are needed. References to GameObjects and Components
+    in the scene are stored as indices and restored to
+    the same objects. Assets, Skyboxes and objects outside
+    the scene are kept by reference and not copied.
+    Two snapshots of scenes with the same state have
+    the same ``data``, which can be used to check that
+    a simulation is deterministic.
+
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self._objects = []
+        self._indices = {}
+        self._externals = []
+        self._externalIndices = {}
+
+        self.gameObjects = list(scene.gameObjects)
+        self.components = []
+        for gameObject in self.gameObjects:
+            self._add(gameObject)
+            self.components.append(list(gameObject.components))
+            for component in gameObject.components:
+                self._add(component)
+
+        state = []
+        for gameObject in self.gameObjects:
+            componentState = []
+            for component in gameObject.components:
+                attrs = tuple(getattr(component, name) for name in component._saved)
+                componentState.append((component.enabled, attrs))
+            children = tuple(gameObject.transform.children)
+            state.append((gameObject.name, gameObject.tag, gameObject.enabled,
+                          children, componentState))
+
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, self).dump((scene.mainCamera, state))
+        self.data = buffer.getvalue()
+        # Only needed while pickling
+        self._externalIndices = None
+
+    def _add(self, obj):
+        self._indices[id(obj)] = len(self._objects)
+        self._objects.append(obj)
+
+    def __len__(self):
+        return len(self.data)
+
+    def Restore(self):
+        """
+        Restore the scene to the captured state in place.
+        GameObjects and Components are kept and their
+        state is overwritten. GameObjects added since the
+        snapshot are removed from the scene, and destroyed
+        GameObjects and removed Components are added back.
+        StaticBatches that contain a renderer that is no
+        longer in the scene are removed, and the octree of
+        the scene is updated to match.
+
+        """
+        scene = self.scene
+        mainCamera, state = _SnapshotUnpickler(io.BytesIO(self.data), self).load()
+
+        captured = set(self.gameObjects)
+        removed = [gameObject for gameObject in scene.gameObjects
+                   if gameObject not in captured]
+        structureChanged = len(scene.gameObjects) != len(self.gameObjects) or bool(removed)
+        for gameObject in removed:
+            for component in gameObject.GetComponents(Behaviour):
+                component.OnDestroy()
+            gameObject.scene = None
+
+        scene.gameObjects = list(self.gameObjects)
+        scene.mainCamera = mainCamera
+        for gameObject, components, goState in zip(
+                self.gameObjects, self.components, state):
+            name, tag, enabled, children, componentState = goState
+            gameObject.scene = scene
+            gameObject.name = name
+            gameObject.tag = tag
+            gameObject.enabled = enabled
+            if gameObject.components != components:
+                structureChanged = True
+                gameObject.components[:] = components
+                gameObject._componentCache.clear()
+            gameObject.transform.children = list(children)
+
+            for component, (componentEnabled, attrs) in zip(components, componentState):
+                component.enabled = componentEnabled
+                for name, value in zip(component._saved, attrs):
+                    setattr(component, name, value)
+
+        if structureChanged:
+            for batch in list(scene.staticBatches):
+                for renderer in batch.renderers:
+                    gameObject = renderer.gameObject
+                    if gameObject.scene is not scene or renderer not in gameObject.components:
+                        batch.Remove()
+                        break
+            if scene.octree is not None:
+                for gameObject in removed + self.gameObjects:
+                    scene.octree.Sync(gameObject)
+            if getattr(scene, "physics", False):
+                scene.collManager.AddPhysicsInfo(scene)
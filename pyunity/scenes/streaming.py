@@ -0,0 +1,397 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Module to load scenes in the background and to run
+several scenes at once.
+
+"""
+
+__all__ = ["SceneLoadOperation", "SceneStreamer"]
+
+from .. import Logger
+from ..audio import AudioSource
+from ..errors import PyUnityException
+from ..events import EventLoopManager
+from ..files import Behaviour
+from ..meshes import Mesh, MeshRenderer
+from ..render import Light, LightType
+from .scene import Scene, createTask
+import collections
+import threading
+import asyncio
+import time
+import os
+
+class SceneLoadOperation:
+    """
+    Handle to a scene being loaded by the
+    :class:`SceneStreamer`. Awaiting it waits until the
+    scene is running and returns the loaded scene.
+
+    Attributes
+    ----------
+    scene : Scene or None
+        The loaded scene, once it has been built
+    additive : bool
+        Whether the scene is added to the running scene
+        or replaces it
+    state : str
+        One of ``loading``, ``uploading``, ``waiting``,
+        ``loaded``, ``unloaded``, ``cancelled`` or ``failed``
+    done : bool
+        Whether the scene is running, or loading has
+        failed or been cancelled
+    exception : Exception or None
+        Exception raised while building the scene, if any
+
+    """
+
+    def __init__(self, source, clone, additive):
+        self.source = source
+        self.clone = clone
+        self.additive = additive
+        self.scene = None
+        self.state = "loading"
+        self.done = False
+        self.exception = None
+        self.assets = []
+        self.uploaded = 0
+        self.waiters = []
+        self.lock = threading.Lock()
+
+    @property
+    def progress(self):
+        """Fraction of the loading that has been done, from 0 to 1"""
+        if self.state == "loading":
+            return 0
+        if self.state == "uploading":
+            total = self.uploaded + len(self.assets)
+            return 0.5 + 0.4 * self.uploaded / total if total else 0.9
+        if self.state == "waiting":
+            return 0.9
+        return 1
+
+    def build(self):
+        if isinstance(self.source, Scene):
+            if self.clone:
+                return self.source.Clone()
+            return self.source
+        scene = self.source()
+        if not isinstance(scene, Scene):
+            raise PyUnityException(
+                f"Expected Scene, got {type(scene).__name__}")
+        return scene
+
+    def finish(self, state, exception=None):
+        with self.lock:
+            self.state = state
+            self.exception = exception
+            self.done = True
+            waiters, self.waiters = self.waiters, []
+        if exception is not None and not waiters:
+            with EventLoopManager.exceptionLock:
+                EventLoopManager.exceptions.append(exception)
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(SceneLoadOperation._resolve, future)
+
+    @staticmethod
+    def _resolve(future):
+        if not future.done():
+            future.set_result(None)
+
+    def __await__(self):
+        with self.lock:
+            if not self.done:
+                loop = asyncio.get_running_loop()
+                future = loop.create_future()
+                self.waiters.append((loop, future))
+            else:
+                future = None
+        if future is not None:
+            yield from future.__await__()
+        if self.exception is not None:
+            raise self.exception
+        return self.scene
+
+class SceneStreamer:
+    """
+    Loads scenes for a :class:`Runner` in stages, so that
+    no single frame does all of the work:
+
+    1. The scene is cloned, or built by a factory, on the
+       shared thread pool of the :class:`EventLoopManager`.
+       The vertex data of its meshes is also prepared
+       there.
+    2. The meshes and textures are uploaded to OpenGL on
+       the main thread before rendering, within
+       :attr:`uploadBudget` seconds per frame. This is
+       skipped when there is no OpenGL context.
+    3. At the start of an update, the GameObjects are
+       added to the running scene and their scripts are
+       started, or the running scene is replaced. At most
+       one scene is added per update.
+
+    The Main Camera and the directional lights of an
+    additive scene, along with their descendants, are
+    not added, since the running scene already has them.
+
+    Attributes
+    ----------
+    uploadBudget : float
+        Time in seconds that uploads may take each frame.
+        At least one mesh or texture is uploaded every
+        frame while a scene is waiting.
+    loaded : list
+        Operations of the additive scenes that are
+        currently running
+
+    """
+
+    uploadBudget = 0.004
+
+    def __init__(self, runner):
+        self.runner = runner
+        self.lock = threading.Lock()
+        self.uploading = collections.deque()
+        self.ready = collections.deque()
+        self.unloading = collections.deque()
+        self.loading = []
+        self.loaded = []
+
+    @property
+    def gl(self):
+        return ("PYUNITY_GL_CONTEXT" in os.environ and
+                os.environ["PYUNITY_INTERACTIVE"] == "1")
+
+    def Load(self, source, clone=True, additive=True, background=True):
+        """
+        Starts loading a scene.
+
+        Parameters
+        ----------
+        source : Scene or Callable[[], Scene]
+            Scene to load, or a function that builds the
+            scene, for example by calling
+            :func:`Loader.LoadScene`
+        clone : bool, optional
+            If True and ``source`` is a Scene, a copy of
+            it is loaded. Defaults to True.
+        additive : bool, optional
+            If True, the GameObjects of the scene are added
+            to the running scene, except for its Main Camera
+            and directional lights. Otherwise, the scene
+            replaces the running scene. Defaults to True.
+        background : bool, optional
+            If True, the scene is built on a worker thread.
+            Otherwise, it is built on the calling thread.
+            Defaults to True.
+
+        Returns
+        -------
+        SceneLoadOperation
+            Handle to the scene being loaded
+
+        """
+        operation = SceneLoadOperation(source, clone, additive)
+        with self.lock:
+            self.loading.append(operation)
+        if background:
+            EventLoopManager.getThreadPool().submit(self.build, operation)
+        else:
+            self.build(operation)
+        return operation
+
+    def build(self, operation):
+        try:
+            scene = operation.build()
+            assets = []
+            if self.gl:
+                for renderer in scene.FindComponents(MeshRenderer):
+                    mesh = renderer.mesh
+                    if mesh is not None and not mesh.compiled and mesh not in assets:
+                        mesh.prepare()
+                        assets.append(mesh)
+                    texture = renderer.mat.texture if renderer.mat is not None else None
+                    if texture is not None and not texture.loaded and texture not in assets:
+                        assets.append(texture)
+        except Exception as e:
+            with self.lock:
+                if operation in self.loading:
+                    self.loading.remove(operation)
+            operation.finish("failed", e)
+            return
+
+        with self.lock:
+            if operation in self.loading:
+                self.loading.remove(operation)
+            if operation.done:
+                return
+            operation.scene = scene
+            operation.assets = assets
+            if assets:
+                operation.state = "uploading"
+                self.uploading.append(operation)
+            else:
+                operation.state = "waiting"
+                self.ready.append(operation)
+        Logger.LogLine(Logger.DEBUG, f"Built scene {scene.name!r}")
+
+    def Upload(self):
+        """
+        Uploads the meshes and textures of loaded scenes.
+        Must be called on the thread with the OpenGL
+        context.
+
+        """
+        start = time.perf_counter()
+        first = True
+        while self.uploading:
+            if not first and time.perf_counter() - start >= self.uploadBudget:
+                break
+            first = False
+            operation = self.uploading[0]
+            if operation.assets:
+                asset = operation.assets.pop()
+                if isinstance(asset, Mesh):
+                    asset.compile()
+                else:
+                    asset.load()
+                operation.uploaded += 1
+                continue
+            with self.lock:
+                self.uploading.popleft()
+                if not operation.done:
+                    operation.state = "waiting"
+                    self.ready.append(operation)
+
+    def Integrate(self, loop):
+        """
+        Removes unloaded scenes and adds at most one loaded
+        scene to the running scene. Called at the start of
+        every update.
+
+        Parameters
+        ----------
+        loop : EventLoop
+            Event loop to start the scripts in
+
+        """
+        with self.lock:
+            unloading = list(self.unloading)
+            self.unloading.clear()
+            operation = self.ready.popleft() if self.ready else None
+
+        scene = self.runner.scene
+        for unloaded in unloading:
+            self.remove(scene, unloaded)
+
+        if operation is None or operation.done:
+            if unloading and scene.physics:
+                scene.collManager.AddPhysicsInfo(scene)
+            return
+
+        if not operation.additive:
+            operation.finish("loaded")
+            self.runner.setNext(operation.scene, clone=False)
+            return
+
+        loaded = operation.scene
+        gameObjects = self.getAdded(loaded)
+        for gameObject in gameObjects:
+            gameObject.scene = scene
+            scene.gameObjects.append(gameObject)
+            if scene.octree is not None:
+                scene.octree.Sync(gameObject)
+        for gameObject in gameObjects:
+            if not gameObject.enabled:
+                continue
+            for component in gameObject.components:
+                if not component.enabled:
+                    continue
+                if isinstance(component, Behaviour):
+                    component.Awake()
+                    createTask(loop, component.Start)
+                elif isinstance(component, AudioSource):
+                    if component.playOnStart:
+                        component.Play()
+        if scene.physics:
+            scene.collManager.AddPhysicsInfo(scene)
+
+        self.loaded.append(operation)
+        operation.finish("loaded")
+        Logger.LogLine(Logger.DEBUG,
+                       f"Added scene {loaded.name!r} to {scene.name!r}")
+
+    def getAdded(self, loaded):
+        skipped = set()
+        for gameObject in loaded.gameObjects:
+            light = gameObject.GetComponent(Light)
+            if ((loaded.mainCamera is not None and gameObject is loaded.mainCamera.gameObject) or
+                    (light is not None and light.type == LightType.Directional)):
+                skipped.update(transform.gameObject for transform in
+                               gameObject.transform.GetDescendants())
+        return [gameObject for gameObject in loaded.gameObjects
+                if gameObject not in skipped]
+
+    def remove(self, scene, operation):
+        for gameObject in operation.scene.gameObjects:
+            if gameObject.scene is scene and gameObject.transform.parent is None:
+                scene.Destroy(gameObject)
+        operation.state = "unloaded"
+        Logger.LogLine(Logger.DEBUG,
+                       f"Removed scene {operation.scene.name!r} from {scene.name!r}")
+
+    def Unload(self, operation):
+        """
+        Removes the GameObjects of an additive scene from
+        the running scene at the start of the next update.
+        Loading is cancelled if it has not finished.
+
+        Parameters
+        ----------
+        operation : SceneLoadOperation
+            Operation that loaded the scene
+
+        Raises
+        ------
+        PyUnityException
+            If the scene was not loaded additively
+
+        """
+        if not operation.additive:
+            raise PyUnityException("Only additive scenes can be unloaded")
+        with self.lock:
+            if operation in self.loaded:
+                self.loaded.remove(operation)
+                self.unloading.append(operation)
+                return
+        self.cancel(operation)
+
+    def cancel(self, operation):
+        with self.lock:
+            if operation in self.uploading:
+                self.uploading.remove(operation)
+            if operation in self.ready:
+                self.ready.remove(operation)
+        if not operation.done:
+            operation.finish("cancelled")
+
+    def Clear(self):
+        """
+        Cancels all scenes that are still loading and
+        forgets the additive scenes. Called when the running
+        scene stops.
+
+        """
+        with self.lock:
+            pending = self.loading + list(self.uploading) + list(self.ready)
+            self.loading.clear()
+            self.uploading.clear()
+            self.ready.clear()
+            self.unloading.clear()
+            self.loaded.clear()
+        for operation in pending:
+            if not operation.done:
+                operation.finish("cancelled")
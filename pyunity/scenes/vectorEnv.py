@@ -0,0 +1,296 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Module to run many copies of a headless scene
+in parallel, one worker process per copy.
+
+"""
+
+__all__ = ["VectorEnv"]
+
+from .. import Logger
+from ..errors import PyUnityException
+from . import sceneManager as SceneManager
+from .runner import NonInteractiveRunner
+from multiprocessing import sharedctypes
+import multiprocessing
+import traceback
+import os
+
+def _asView(array, shape):
+    return memoryview(array).cast("B").cast(array._type_._type_, shape)
+
+class _Worker:
+    def __init__(self, index, sceneFactory, observe, act, reward, done,
+                 arrays, sizes, dt, fixedDt):
+        self.index = index
+        self.sceneFactory = sceneFactory
+        self.observe = observe
+        self.act = act
+        self.reward = reward
+        self.done = done
+        self.observations, self.actions, self.rewards, self.dones = arrays
+        self.observationSize, self.actionSize = sizes
+        self.dt = dt
+        self.fixedDt = fixedDt
+        self.runner = None
+
+    def run(self, conn):
+        os.environ["PYUNITY_INTERACTIVE"] = "0"
+        while True:
+            command, arg = conn.recv()
+            if command == "close":
+                self.stop()
+                conn.send(("ok", None))
+                break
+            try:
+                if command == "reset":
+                    self.reset()
+                elif command == "step":
+                    self.step(arg)
+                conn.send(("ok", None))
+            except Exception:
+                conn.send(("error", traceback.format_exc()))
+        conn.close()
+
+    def stop(self):
+        if self.runner is not None and self.runner.opened:
+            self.runner.quit()
+        self.runner = None
+
+    def reset(self):
+        self.stop()
+        SceneManager.RemoveAllScenes()
+        scene = self.sceneFactory(self.index)
+        self.runner = NonInteractiveRunner()
+        self.runner.setScene(scene, clone=False)
+        self.runner.open()
+        SceneManager.runner = self.runner
+        # Runs Start on all scripts
+        self.runner.fastForward(ticks=0)
+        self.writeObservation()
+
+    def writeObservation(self):
+        start = self.index * self.observationSize
+        values = self.observe(self.runner.scene)
+        if len(values) != self.observationSize:
+            raise PyUnityException(
+                f"Expected {self.observationSize} observation values, "
+                f"got {len(values)}")
+        self.observations[start:start + self.observationSize] = list(values)
+
+    def step(self, ticks):
+        start = self.index * self.actionSize
+        action = self.actions[start:start + self.actionSize]
+        self.act(self.runner.scene, action)
+        self.runner.fastForward(ticks=ticks, dt=self.dt, fixedDt=self.fixedDt)
+
+        if self.reward is not None:
+            self.rewards[self.index] = self.reward(self.runner.scene)
+        done = self.done is not None and bool(self.done(self.runner.scene))
+        self.dones[self.index] = done
+        if done:
+            self.reset()
+        else:
+            self.writeObservation()
+
+def _runWorker(conn, worker):
+    worker.run(conn)
+
+class VectorEnv:
+    """
+    Runs ``numEnvs`` independent copies of a scene, each
+    in its own worker process with its own
+    :class:`NonInteractiveRunner`. Every copy is stepped
+    with :meth:`NonInteractiveRunner.fastForward` on a fixed
+    timestep. Observations, actions, rewards and done
+    flags are exchanged through shared memory, so only
+    a short command is sent to each worker per step.
+
+    Parameters
+    ----------
+    sceneFactory : Callable[[int], Scene]
+        Called in the worker with the index of the copy
+        to build its scene. The SceneManager of the
+        worker is emptied beforehand, so the scene can be
+        made with :func:`SceneManager.AddScene`.
+    numEnvs : int
+        Number of copies to run
+    observationSize : int
+        Number of floats in each observation
+    actionSize : int
+        Number of floats in each action
+    observe : Callable[[Scene], Sequence[float]]
+        Returns the observation of a scene
+    act : Callable[[Scene, List[float]], None]
+        Applies an action to a scene before it is stepped
+    reward : Callable[[Scene], float], optional
+        Returns the reward of a scene after it is stepped
+    done : Callable[[Scene], bool], optional
+        Returns whether the episode of a scene has ended.
+        Finished copies are rebuilt with ``sceneFactory``.
+    dt : float, optional
+        Simulated time between updates
+    fixedDt : float, optional
+        Simulated time between fixed updates, by
+        default 0.02
+    ticksPerStep : int, optional
+        Number of updates run per call to :meth:`step`,
+        by default 1
+    context : str, optional
+        Start method of the worker processes, see
+        :func:`multiprocessing.get_context`
+
+    Attributes
+    ----------
+    observations : memoryview
+        Latest observations, of shape
+        ``(numEnvs, observationSize)``
+    rewards : memoryview
+        Latest rewards, of shape ``(numEnvs,)``
+    dones : memoryview
+        Latest done flags, of shape ``(numEnvs,)``
+
+    Notes
+    -----
+    All callables are sent to the worker processes, so
+    they must be picklable (e.g. module-level functions)
+    when the ``spawn`` or ``forkserver`` start methods
+    are used. The returned views share memory with the
+    workers and are overwritten by the next call to
+    :meth:`step` or :meth:`reset`. Use ``.tolist()`` to
+    copy them, or ``numpy.asarray`` for a view.
+
+    """
+
+    def __init__(self, sceneFactory, numEnvs, observationSize, actionSize,
+                 observe, act, reward=None, done=None, dt=None, fixedDt=0.02,
+                 ticksPerStep=1, context=None):
+        if numEnvs < 1:
+            raise PyUnityException("numEnvs must be at least 1")
+        self.numEnvs = numEnvs
+        self.observationSize = observationSize
+        self.actionSize = actionSize
+        self.ticksPerStep = ticksPerStep
+
+        ctx = multiprocessing.get_context(context)
+        self._observations = sharedctypes.RawArray("d", numEnvs * observationSize)
+        self._actions = sharedctypes.RawArray("d", numEnvs * actionSize)
+        self._rewards = sharedctypes.RawArray("d", numEnvs)
+        self._dones = sharedctypes.RawArray("b", numEnvs)
+        self.observations = _asView(self._observations, [numEnvs, observationSize])
+        self.rewards = _asView(self._rewards, [numEnvs])
+        self.dones = _asView(self._dones, [numEnvs])
+
+        arrays = (self._observations, self._actions, self._rewards, self._dones)
+        self.conns = []
+        self.processes = []
+        for i in range(numEnvs):
+            worker = _Worker(i, sceneFactory, observe, act, reward, done,
+                             arrays, (observationSize, actionSize), dt, fixedDt)
+            parentConn, childConn = ctx.Pipe()
+            process = ctx.Process(target=_runWorker, args=(childConn, worker),
+                                  daemon=True)
+            process.start()
+            childConn.close()
+            self.conns.append(parentConn)
+            self.processes.append(process)
+        self.closed = False
+        Logger.LogLine(Logger.DEBUG, f"Started {numEnvs} environment workers")
+
+    def _broadcast(self, command, arg=None):
+        if self.closed:
+            raise PyUnityException("VectorEnv has been closed")
+        stopped = set()
+        for i, conn in enumerate(self.conns):
+            try:
+                conn.send((command, arg))
+            except OSError:
+                stopped.add(i)
+        errors = []
+        for i, conn in enumerate(self.conns):
+            try:
+                if i in stopped:
+                    raise EOFError
+                status, message = conn.recv()
+            except EOFError:
+                # The worker process has died
+                self.processes[i].join(1)
+                errors.append(f"Environment {i}: worker process stopped "
+                              f"with exit code {self.processes[i].exitcode}")
+                continue
+            if status == "error":
+                errors.append(f"Environment {i}:\n{message}")
+        if errors:
+            raise PyUnityException("\n".join(errors))
+
+    def reset(self):
+        """
+        Rebuilds every scene and returns the first
+        observations.
+
+        Returns
+        -------
+        memoryview
+            Observations of shape ``(numEnvs, observationSize)``
+
+        """
+        self._broadcast("reset")
+        return self.observations
+
+    def step(self, actions):
+        """
+        Applies one action to each scene and steps every
+        scene by ``ticksPerStep`` updates in parallel.
+
+        Parameters
+        ----------
+        actions : Sequence[Sequence[float]]
+            One action of ``actionSize`` floats per scene
+
+        Returns
+        -------
+        tuple
+            Views of the observations, rewards and done
+            flags. Where a scene has finished, its
+            observation is that of the rebuilt scene.
+
+        Raises
+        ------
+        PyUnityException
+            If the number of actions is wrong, or if a
+            worker raised an exception or has stopped
+
+        """
+        if len(actions) != self.numEnvs:
+            raise PyUnityException(
+                f"Expected {self.numEnvs} actions, got {len(actions)}")
+        size = self.actionSize
+        for i, action in enumerate(actions):
+            self._actions[i * size:(i + 1) * size] = list(action)
+        self._broadcast("step", self.ticksPerStep)
+        return self.observations, self.rewards, self.dones
+
+    def close(self):
+        """Stops all worker processes."""
+        if self.closed:
+            return
+        self.closed = True
+        for conn in self.conns:
+            try:
+                conn.send(("close", None))
+                conn.recv()
+            except (EOFError, OSError):
+                pass
+            conn.close()
+        for process in self.processes:
+            process.join()
+        Logger.LogLine(Logger.DEBUG, "Stopped environment workers")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exctype, value, tb):
+        self.close()
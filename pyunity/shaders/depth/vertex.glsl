@@ -1,9 +1,39 @@
 #version 330 core
+#define NR_LIGHTS 32
+#define NR_CASCADES 4
 layout (location = 0) in vec3 aPos;
 
-uniform mat4 lightSpaceMatrix;
+struct Light {
+    vec3 pos;
+    float strength;
+    vec3 color;
+    int type;
+    vec3 dir;
+    mat4 lightSpaceMatrix;
+};
+
+layout (std140) uniform Lights {
+    Light lights[NR_LIGHTS];
+};
+
+layout (std140) uniform Cascades {
+    mat4 cascadeMatrices[NR_CASCADES];
+    vec4 cascadeSplits;
+    vec4 cascadeBiases;
+    int cascadeLight;
+    int numCascades;
+};
+
+uniform int lightIndex;
+uniform int cascadeIndex = -1;
+#ifdef INSTANCED
+layout (location = 3) in mat4 model;
+#else
 uniform mat4 model;
+#endif
 
 void main() {
+    mat4 lightSpaceMatrix = (cascadeIndex == -1) ?
+        lights[lightIndex].lightSpaceMatrix : cascadeMatrices[cascadeIndex];
     gl_Position = lightSpaceMatrix * model * vec4(aPos, 1.0);
 }
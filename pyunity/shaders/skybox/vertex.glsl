@@ -3,12 +3,20 @@ layout (location = 0) in vec3 aPos;
 
 out vec3 TexCoords;
 
-uniform mat4 projection;
-uniform mat4 view;
+layout (std140) uniform Camera {
+    mat4 projection;
+    mat4 view;
+    vec3 viewPos;
+    int numLights;
+    int useShadowMap;
+};
+
+// Always perspective, even for orthographic cameras
+uniform mat4 skyProj;
 
 void main()
 {
     TexCoords = aPos;
-    vec4 pos = projection * view * vec4(aPos, 1.0);
+    vec4 pos = skyProj * mat4(mat3(view)) * vec4(aPos, 1.0);
     gl_Position = pos.xyww;
 }
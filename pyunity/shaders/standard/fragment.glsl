@@ -1,28 +1,52 @@
 #version 330 core
-#define NR_LIGHTS 8
+#define NR_LIGHTS 32
+#define NR_SHADOW_MAPS 8
+#define NR_CASCADES 4
 layout (location = 0) out vec4 FragColor;
 
 in vec2 TexCoord;
 in vec3 normal;
 in vec3 FragPos;
-in vec4 FragPosLightSpaces[NR_LIGHTS];
 
 struct Light {
     vec3 pos;
     float strength;
     vec3 color;
-    vec3 dir;
     int type;
+    vec3 dir;
+    mat4 lightSpaceMatrix;
+};
+
+layout (std140) uniform Camera {
+    mat4 projection;
+    mat4 view;
+    vec3 viewPos;
+    int numLights;
+    int useShadowMap;
+};
+
+layout (std140) uniform Lights {
+    Light lights[NR_LIGHTS];
+};
+
+layout (std140) uniform Cascades {
+    mat4 cascadeMatrices[NR_CASCADES];
+    vec4 cascadeSplits;
+    vec4 cascadeBiases;
+    int cascadeLight;
+    int numCascades;
 };
 
-uniform int numLights;
-uniform Light lights[NR_LIGHTS];
-uniform vec3 viewPos;
+#ifdef INSTANCED
+in vec3 instanceColor;
+#define objectColor instanceColor
+#else
 uniform vec3 objectColor;
+#endif
 uniform sampler2D aTexture;
-uniform sampler2DShadow shadowMaps[NR_LIGHTS];
+uniform sampler2DShadow shadowMaps[NR_SHADOW_MAPS];
+uniform sampler2DShadow cascadeMaps[NR_CASCADES];
 uniform int textured = 0;
-uniform int useShadowMap = 1;
 
 float when_eq(float x, float y) {
     return 1.0 - abs(sign(x - y));
@@ -72,16 +96,15 @@ float getAttenuation(Light light) {
     return attenuation;
 }
 
-float getShadow(int num, sampler2DShadow tex) {
+float getShadow(mat4 lightSpaceMatrix, float bias, sampler2DShadow tex) {
     // perform perspective divide
-    vec3 projCoords = FragPosLightSpaces[num].xyz / FragPosLightSpaces[num].w;
+    vec4 fragPosLightSpace = lightSpaceMatrix * vec4(FragPos, 1.0);
+    vec3 projCoords = fragPosLightSpace.xyz / fragPosLightSpace.w;
     // transform to [0,1] range
     projCoords = projCoords * 0.5 + 0.5;
 
     // get depth of current fragment from light's perspective
     float currentDepth = projCoords.z;
-    // check whether current frag pos is in shadow
-    float bias = max(0.05 * (1.0 - dot(normal, lights[num].dir)), 0.005);
 
     float shadow = 0.0;
     vec2 texelSize = 1.0 / textureSize(tex, 0);
@@ -99,15 +122,38 @@ float getShadow(int num, sampler2DShadow tex) {
     return shadow * when_le(projCoords.z, 1.0);
 }
 
+float getShadow(int num, sampler2DShadow tex) {
+    // check whether current frag pos is in shadow
+    float bias = max(0.05 * (1.0 - dot(normal, lights[num].dir)), 0.005);
+    return getShadow(lights[num].lightSpaceMatrix, bias, tex);
+}
+
+float getCascadeShadow() {
+    // pick the first cascade that reaches past the fragment
+    float depth = -(view * vec4(FragPos, 1.0)).z;
+    // a few texels, more on surfaces facing away from the light
+    float slope = 1.0 - abs(dot(normalize(normal), lights[cascadeLight].dir));
+    vec4 biases = cascadeBiases * (1.5 + 4.0 * slope);
+    if (numCascades > 0 && depth < cascadeSplits[0])
+        return getShadow(cascadeMatrices[0], biases[0], cascadeMaps[0]);
+    if (numCascades > 1 && depth < cascadeSplits[1])
+        return getShadow(cascadeMatrices[1], biases[1], cascadeMaps[1]);
+    if (numCascades > 2 && depth < cascadeSplits[2])
+        return getShadow(cascadeMatrices[2], biases[2], cascadeMaps[2]);
+    if (numCascades > 3 && depth < cascadeSplits[3])
+        return getShadow(cascadeMatrices[3], biases[3], cascadeMaps[3]);
+    return 0.0;
+}
+
 void main() {
     float ambientStrength = 0.1;
     vec3 ambient = ambientStrength * vec3(1.0, 1.0, 1.0);
     vec3 norm = normalize(normal);
 
-    float shadows[NR_LIGHTS];
+    float shadows[NR_SHADOW_MAPS];
 
     #if __VERSION__ > 400
-    for (int i = 0; i < NR_LIGHTS; i++) {
+    for (int i = 0; i < NR_SHADOW_MAPS; i++) {
         shadows[i] = (useShadowMap == 1) ? getShadow(i, shadowMaps[i]) : 0.0;
     }
     #else
@@ -120,6 +166,7 @@ void main() {
     shadows[6] = (useShadowMap == 1) ? getShadow(6, shadowMaps[6]) : 0.0;
     shadows[7] = (useShadowMap == 1) ? getShadow(7, shadowMaps[7]) : 0.0;
     #endif
+    float cascadeShadow = (useShadowMap == 1 && cascadeLight != -1) ? getCascadeShadow() : 0.0;
 
     vec3 total = vec3(0);
     for (int i = 0; i < NR_LIGHTS; i++) {
@@ -129,7 +176,8 @@ void main() {
         float strength = getDiffuse(lights[i], norm);
         strength += when_eq(lights[i].type, 0) * getSpecular(lights[i], norm);
         strength *= when_eq_val(lights[i].type, 0, getAttenuation(lights[i]), 1.0);
-        float shadow = shadows[i];
+        float shadow = (i < NR_SHADOW_MAPS) ? shadows[i] : 0.0;
+        shadow = (i == cascadeLight) ? cascadeShadow : shadow;
         // if (shadow == 0.0) discard;
         total += (1.0 - shadow) * strength * lights[i].color;
     }
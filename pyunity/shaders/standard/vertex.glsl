@@ -1,28 +1,36 @@
 #version 330 core
-#define NR_LIGHTS 8
 layout (location = 0) in vec3 aPos;
 layout (location = 1) in vec3 aNormal;
 layout (location = 2) in vec2 aTexCoord;
 
-uniform int numLights;
-uniform mat4 projection;
+layout (std140) uniform Camera {
+    mat4 projection;
+    mat4 view;
+    vec3 viewPos;
+    int numLights;
+    int useShadowMap;
+};
+
+#ifdef INSTANCED
+layout (location = 3) in mat4 model;
+layout (location = 7) in mat3 normModel;
+layout (location = 10) in vec3 aColor;
+out vec3 instanceColor;
+#else
 uniform mat3 normModel;
-uniform mat4 view;
 uniform mat4 model;
-uniform mat4 lightSpaceMatrices[NR_LIGHTS];
+#endif
 
 out vec2 TexCoord;
 out vec3 normal;
 out vec3 FragPos;
-out vec4 FragPosLightSpaces[NR_LIGHTS];
 
 void main() {
+#ifdef INSTANCED
+    instanceColor = aColor;
+#endif
     gl_Position = projection * view * model * vec4(aPos, 1.0);
     TexCoord = aTexCoord;
     normal = vec3(normModel * aNormal);
     FragPos = vec3(model * vec4(aPos, 1.0));
-
-    for (int i = 0; i < numLights; i++) {
-        FragPosLightSpaces[i] = lightSpaceMatrices[i] * vec4(FragPos, 1.0);
-    }
 }
@@ -0,0 +1,422 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Spatial index over the MeshRenderers of a scene, so that
+culling and spatial queries can skip whole regions of the
+scene at once.
+
+Example
+-------
+>>> octree = scene.EnableOctree(halfSize=2000)
+>>> octree.QuerySphere(Vector3(0, 0, 0), 10)
+>>> octree.Raycast(Vector3(0, 5, 0), Vector3.down())
+
+When a scene has an octree, its cameras use it through
+:meth:`Scene.Cull` to select the renderers drawn in the
+main pass and in each shadow pass.
+
+"""
+
+__all__ = ["Octree", "OctreeNode"]
+
+from .meshes import MeshRenderer
+from .render import Camera
+from .values import Vector3
+import math
+
+class OctreeNode:
+    """
+    Cube shaped cell of an :class:`Octree`. Renderers are
+    stored in the smallest cell that contains the center
+    of their bounding sphere and is at least as large as
+    the sphere. Each cell may hold renderers that reach
+    up to :attr:`halfSize` outside of it.
+
+    Attributes
+    ----------
+    center : tuple
+        Center of the cell in OpenGL coordinates
+    halfSize : float
+        Half of the width of the cell
+    renderers : List[MeshRenderer]
+        Renderers stored directly in this cell
+    children : list
+        Eight child cells, or None for cells that
+        have not been needed
+    count : int
+        Number of renderers in this cell and all of
+        its children
+
+    """
+
+    def __init__(self, center, halfSize, depth, parent=None, index=0):
+        self.center = center
+        self.halfSize = halfSize
+        self.depth = depth
+        self.parent = parent
+        self.index = index
+        self.renderers = []
+        self.children = [None] * 8
+        self.count = 0
+
+    def GetChild(self, index):
+        child = self.children[index]
+        if child is None:
+            offset = self.halfSize / 2
+            center = tuple(
+                c + (offset if index & (1 << i) else -offset)
+                for i, c in enumerate(self.center))
+            child = OctreeNode(center, offset, self.depth + 1, self, index)
+            self.children[index] = child
+        return child
+
+    def Contains(self, x, y, z):
+        cx, cy, cz = self.center
+        h = self.halfSize
+        return abs(x - cx) <= h and abs(y - cy) <= h and abs(z - cz) <= h
+
+class Octree:
+    """
+    Loose octree over the world space bounding spheres of
+    MeshRenderers. Moved renderers are put back in the
+    tree by :meth:`Update`, which only looks at the
+    Transforms that changed since it was last called.
+
+    Use :meth:`Scene.EnableOctree` to create an octree
+    that is kept up to date with the GameObjects of a
+    scene. Renderers outside of the root cell are kept in
+    the root cell, and are tested one by one.
+
+    Parameters
+    ----------
+    center : Vector3, optional
+        Center of the root cell. Defaults to the origin.
+    halfSize : float, optional
+        Half of the width of the root cell. Defaults
+        to 1024.
+    maxDepth : int, optional
+        Maximum depth of a cell. Defaults to 8.
+
+    Attributes
+    ----------
+    root : OctreeNode
+        The root cell
+    nodes : dict
+        Cell of each renderer in the tree
+    dirty : set
+        Transforms that changed since the last update
+    unplaced : set
+        Renderers without a mesh, which are added to the
+        tree once they have one
+
+    """
+
+    def __init__(self, center=None, halfSize=1024, maxDepth=8):
+        if center is None:
+            center = Vector3.zero()
+        self.root = OctreeNode(tuple(center * Vector3(1, 1, -1)), halfSize, 0)
+        self.maxDepth = maxDepth
+        self.nodes = {}
+        self.dirty = set()
+        self.unplaced = set()
+        self.tracked = {}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(list(self.nodes))
+
+    def __contains__(self, renderer):
+        return renderer in self.nodes or renderer in self.unplaced
+
+    def Add(self, renderer):
+        """
+        Adds a renderer to the tree. Renderers without a
+        mesh are added once they have one.
+
+        Parameters
+        ----------
+        renderer : MeshRenderer
+            Renderer to add
+
+        """
+        if renderer in self:
+            return
+        if renderer.mesh is None:
+            self.unplaced.add(renderer)
+            return
+        self.insert(renderer)
+
+    def insert(self, renderer):
+        x, y, z, radius = Camera.getBounds(renderer)
+        node = self.root
+        if node.Contains(x, y, z):
+            while node.depth < self.maxDepth and radius <= node.halfSize / 2:
+                cx, cy, cz = node.center
+                index = (x >= cx) | (y >= cy) << 1 | (z >= cz) << 2
+                node = node.GetChild(index)
+        node.renderers.append(renderer)
+        self.nodes[renderer] = node
+        while node is not None:
+            node.count += 1
+            node = node.parent
+
+    def Remove(self, renderer):
+        """
+        Removes a renderer from the tree, if it is in it.
+
+        Parameters
+        ----------
+        renderer : MeshRenderer
+            Renderer to remove
+
+        """
+        self.unplaced.discard(renderer)
+        node = self.nodes.pop(renderer, None)
+        if node is None:
+            return
+        node.renderers.remove(renderer)
+        while node is not None:
+            node.count -= 1
+            parent = node.parent
+            if node.count == 0 and parent is not None:
+                parent.children[node.index] = None
+            node = parent
+
+    def Sync(self, gameObject):
+        """
+        Adds the MeshRenderers of a GameObject that are
+        not in the tree, and removes those that are no
+        longer part of it or are in a
+        :class:`StaticBatch`.
+
+        Parameters
+        ----------
+        gameObject : GameObject
+            GameObject to check
+
+        """
+        renderers = [renderer for renderer in gameObject.GetComponents(MeshRenderer)
+                     if renderer.staticBatch is None]
+        if gameObject.scene is None:
+            renderers = []
+        for renderer in self.tracked.get(gameObject, []):
+            if renderer not in renderers:
+                self.Remove(renderer)
+        for renderer in renderers:
+            self.Add(renderer)
+        if renderers:
+            self.tracked[gameObject] = renderers
+        else:
+            self.tracked.pop(gameObject, None)
+
+    def Invalidate(self, renderer):
+        """
+        Puts a renderer back in the tree on the next
+        :meth:`Update`. Called by :class:`MeshRenderer`
+        when its mesh changes.
+
+        Parameters
+        ----------
+        renderer : MeshRenderer
+            Renderer that changed
+
+        """
+        self.dirty.add(renderer.transform)
+
+    def Update(self):
+        """
+        Moves the renderers of all Transforms that changed
+        and of all renderers whose mesh changed to their
+        new cells, and adds renderers that now have a mesh.
+
+        """
+        dirty = self.dirty
+        self.dirty = set()
+        for transform in dirty:
+            for renderer in transform.gameObject.GetComponents(MeshRenderer):
+                node = self.nodes.get(renderer)
+                if node is None:
+                    continue
+                if renderer.mesh is None:
+                    self.Remove(renderer)
+                    self.unplaced.add(renderer)
+                    continue
+                x, y, z, radius = Camera.getBounds(renderer)
+                if (node.Contains(x, y, z) and radius <= node.halfSize and
+                        (node.depth == self.maxDepth or radius > node.halfSize / 2)):
+                    continue
+                self.Remove(renderer)
+                self.insert(renderer)
+        for renderer in list(self.unplaced):
+            if renderer.mesh is not None:
+                self.unplaced.discard(renderer)
+                self.insert(renderer)
+
+    def QueryFrustum(self, frustum):
+        """
+        Gets the renderers that are inside a frustum.
+
+        Parameters
+        ----------
+        frustum : Frustum
+            Frustum to test
+
+        Returns
+        -------
+        List[MeshRenderer]
+            Renderers that may be visible
+
+        """
+        result = []
+        self.queryFrustum(self.root, frustum.planes, result, False)
+        return result
+
+    def queryFrustum(self, node, planes, result, inside):
+        if inside:
+            self.collect(node, result)
+            return
+        if node.parent is not None:
+            # Cells hold renderers reaching up to halfSize outside
+            cx, cy, cz = node.center
+            extent = node.halfSize * 2
+            inside = True
+            for a, b, c, d in planes:
+                distance = a * cx + b * cy + c * cz + d
+                radius = extent * (abs(a) + abs(b) + abs(c))
+                if distance < -radius:
+                    return
+                if distance < radius:
+                    inside = False
+            if inside:
+                self.collect(node, result)
+                return
+        for renderer in node.renderers:
+            if renderer.mesh is None:
+                continue
+            x, y, z, radius = Camera.getBounds(renderer)
+            for a, b, c, d in planes:
+                if a * x + b * y + c * z + d < -radius:
+                    break
+            else:
+                result.append(renderer)
+        for child in node.children:
+            if child is not None:
+                self.queryFrustum(child, planes, result, False)
+
+    def collect(self, node, result):
+        result.extend(renderer for renderer in node.renderers
+                      if renderer.mesh is not None)
+        for child in node.children:
+            if child is not None:
+                self.collect(child, result)
+
+    def QuerySphere(self, center, radius):
+        """
+        Gets the renderers whose bounding spheres overlap
+        a sphere, for example the range of a point light.
+
+        Parameters
+        ----------
+        center : Vector3
+            Center of the sphere in world space
+        radius : float
+            Radius of the sphere
+
+        Returns
+        -------
+        List[MeshRenderer]
+            Renderers that overlap the sphere
+
+        """
+        sphere = (*(center * Vector3(1, 1, -1)), radius)
+        result = []
+        self.querySphere(self.root, sphere, result)
+        return result
+
+    def querySphere(self, node, sphere, result):
+        x, y, z, radius = sphere
+        if node.parent is not None:
+            extent = node.halfSize * 2
+            distance = 0
+            for p, c in zip((x, y, z), node.center):
+                excess = abs(p - c) - extent
+                if excess > 0:
+                    distance += excess * excess
+            if distance > radius * radius:
+                return
+        for renderer in node.renderers:
+            if renderer.mesh is None:
+                continue
+            rx, ry, rz, rr = Camera.getBounds(renderer)
+            reach = radius + rr
+            if (rx - x) ** 2 + (ry - y) ** 2 + (rz - z) ** 2 <= reach * reach:
+                result.append(renderer)
+        for child in node.children:
+            if child is not None:
+                self.querySphere(child, sphere, result)
+
+    def Raycast(self, origin, direction, maxDistance=math.inf):
+        """
+        Gets the renderers whose bounding spheres are hit
+        by a ray, nearest first.
+
+        Parameters
+        ----------
+        origin : Vector3
+            Start of the ray in world space
+        direction : Vector3
+            Direction of the ray
+        maxDistance : float, optional
+            Length of the ray. Defaults to infinity.
+
+        Returns
+        -------
+        list
+            Tuples of the distance along the ray to the
+            bounding sphere and the renderer
+
+        """
+        origin = tuple(origin * Vector3(1, 1, -1))
+        direction = tuple(direction.normalized() * Vector3(1, 1, -1))
+        result = []
+        self.raycast(self.root, origin, direction, maxDistance, result)
+        result.sort(key=lambda hit: hit[0])
+        return result
+
+    def raycast(self, node, origin, direction, maxDistance, result):
+        if node.parent is not None:
+            extent = node.halfSize * 2
+            near = 0
+            far = maxDistance
+            for o, d, c in zip(origin, direction, node.center):
+                if d == 0:
+                    if abs(o - c) > extent:
+                        return
+                    continue
+                t1 = (c - extent - o) / d
+                t2 = (c + extent - o) / d
+                near = max(near, min(t1, t2))
+                far = min(far, max(t1, t2))
+                if near > far:
+                    return
+        ox, oy, oz = origin
+        dx, dy, dz = direction
+        for renderer in node.renderers:
+            if renderer.mesh is None:
+                continue
+            x, y, z, radius = Camera.getBounds(renderer)
+            lx, ly, lz = x - ox, y - oy, z - oz
+            along = lx * dx + ly * dy + lz * dz
+            squared = lx * lx + ly * ly + lz * lz - along * along
+            if squared > radius * radius:
+                continue
+            distance = max(along - math.sqrt(radius * radius - squared), 0)
+            if distance <= maxDistance and along + radius >= 0:
+                result.append((distance, renderer))
+        for child in node.children:
+            if child is not None:
+                self.raycast(child, origin, direction, maxDistance, result)
@@ -2,7 +2,7 @@
 ## This file is licensed under the MIT License.
 ## See https://docs.pyunity.x10.bz/en/latest/license.html
 
-__all__ = ["Clock", "IgnoredMixin", "ImmutableStruct", "IncludeInstanceMixin",
+__all__ = ["Clock", "FrameStats", "IgnoredMixin", "ImmutableStruct", "IncludeInstanceMixin",
            "IncludeMixin", "LockedLiteral", "ModuleExportControlMixin",
            "SavableStruct", "StructEntry"]
 
@@ -10,7 +10,9 @@ from .. import config
 from ..errors import PyUnityException
 from functools import partial
 import sys
+import math
 import time
+import collections
 
 class ModuleExportControlMixin:
     # Used by various helper scripts.
@@ -28,10 +30,126 @@ class IncludeInstanceMixin(ModuleExportControlMixin):
     # Used by various helper scripts.
     pass
 
+class FrameStats:
+    """
+    Rolling statistics of the most recent frame times.
+
+    Parameters
+    ----------
+    size : int, optional
+        Number of frames to keep, by default 240
+
+    """
+
+    def __init__(self, size=240):
+        self.times = collections.deque(maxlen=size)
+        self.last = None
+
+    def Record(self, frameTime):
+        """Record the duration of a frame in seconds."""
+        self.times.append(frameTime)
+
+    def Tick(self):
+        """Record the time since the last call to this method."""
+        now = time.perf_counter()
+        if self.last is not None:
+            self.times.append(now - self.last)
+        self.last = now
+
+    def Reset(self):
+        """Remove all recorded frames."""
+        self.times.clear()
+        self.last = None
+
+    def Percentile(self, percent):
+        """
+        Get a percentile of the recorded frame times.
+
+        Parameters
+        ----------
+        percent : float
+            Percentile between 0 and 100
+
+        Returns
+        -------
+        float
+            Frame time in seconds, or 0 if no frames
+            have been recorded
+
+        """
+        if not self.times:
+            return 0
+        ordered = sorted(self.times)
+        index = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+        return ordered[index]
+
+    @property
+    def count(self):
+        """Number of recorded frames"""
+        return len(self.times)
+
+    @property
+    def mean(self):
+        """Mean frame time"""
+        if not self.times:
+            return 0
+        return sum(self.times) / len(self.times)
+
+    @property
+    def max(self):
+        """Longest frame time"""
+        if not self.times:
+            return 0
+        return max(self.times)
+
+    @property
+    def p95(self):
+        """95th percentile frame time"""
+        return self.Percentile(95)
+
+    @property
+    def p99(self):
+        """99th percentile frame time"""
+        return self.Percentile(99)
+
+    def Summary(self):
+        """Returns the statistics as a dict, in seconds."""
+        return {"count": self.count, "mean": self.mean, "p95": self.p95,
+                "p99": self.p99, "max": self.max}
+
 class Clock:
+    """
+    Keeps a loop running at a fixed rate.
+
+    :meth:`Maintain` sleeps until shortly before the end
+    of the frame and then spin-waits for the remaining
+    :attr:`spinThreshold` seconds, as ``time.sleep`` often
+    oversleeps by a millisecond or more. The spin yields
+    to other threads on every check, so that several
+    clocks can spin at once. An fps of 0 runs the loop
+    unthrottled, only yielding to other threads.
+
+    Attributes
+    ----------
+    spinThreshold : float
+        Time in seconds before the end of a frame to
+        stop sleeping and start spin-waiting. Set to 0
+        to only sleep.
+    stats : FrameStats
+        Durations of the most recent frames
+    idleCallback : Callable[[float], None] or None
+        Called at the end of every frame with the time in
+        seconds left until the next frame, before sleeping
+
+    """
+
+    spinThreshold = 0.002
+
     def __init__(self):
         self._fps = 60
         self._frameDuration = 1 / self._fps
+        self.stats = FrameStats()
+        self.idleCallback = None
 
     @property
     def fps(self):
@@ -49,19 +167,40 @@ class Clock:
         if fps is not None:
             self.fps = fps
         self._start = time.perf_counter()
+        self._deadline = self._start + self._frameDuration
 
     def Maintain(self):
-        self._end = time.perf_counter()
-        elapsedMS = self._end - self._start
-        if config.vsync or self.fps == 0:
+        if self.idleCallback is not None:
+            if config.vsync or self.fps == 0:
+                self.idleCallback(0)
+            else:
+                self.idleCallback(max(self._deadline - time.perf_counter(), 0))
+        now = time.perf_counter()
+        if config.vsync:
             sleep = 0.001
+            time.sleep(sleep)
+        elif self.fps == 0:
+            # Let other threads run
+            sleep = sys.float_info.epsilon
+            time.sleep(0)
         else:
-            sleep = self._frameDuration - elapsedMS
-        if sleep <= 0:
-            self._start = time.perf_counter()
-            return sys.float_info.epsilon
-        time.sleep(sleep)
-        self._start = time.perf_counter()
+            sleep = self._deadline - now
+            if sleep <= 0:
+                # Running behind, don't try to catch up
+                self._deadline = now + self._frameDuration
+                sleep = sys.float_info.epsilon
+            else:
+                coarse = sleep - self.spinThreshold
+                if coarse > 0:
+                    time.sleep(coarse)
+                while time.perf_counter() < self._deadline:
+                    # Let other threads run
+                    time.sleep(0)
+                self._deadline += self._frameDuration
+
+        end = time.perf_counter()
+        self.stats.Record(end - self._start)
+        self._start = end
         return sleep
 
 class LockedLiteral:
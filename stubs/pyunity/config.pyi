@@ -2,6 +2,7 @@
 ## This file is licensed under the MIT License.
 ## See https://docs.pyunity.x10.bz/en/latest/license.html
 
+from .events import GCPolicy
 from typing import Type, Tuple, Union
 
 audio: bool = ...
@@ -12,3 +13,7 @@ faceCulling: bool = ...
 windowProvider: Union[Type, None] = ...
 vsync: bool = ...
 exitOnError: bool = ...
+jobBudget: float = ...
+threadPoolWorkers: Union[int, None] = ...
+processPoolWorkers: Union[int, None] = ...
+gcPolicy: Union[GCPolicy, None] = ...
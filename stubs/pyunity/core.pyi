@@ -151,6 +151,7 @@ class Transform(SingleComponent):
     parent: Union[Transform, None] = ...
     children: _List[Transform]
     modelMatrix: Union[glm.mat4, None]
+    normalMatrix: Union[glm.mat3, None]
     def __init__(self) -> None: ...
 
     @property
@@ -4,16 +4,23 @@
 
 __all__ = ["Event", "EventLoop", "EventLoopManager", "StartCoroutine",
            "WaitFor", "WaitForEventLoop", "WaitForFixedUpdate",
-           "WaitForRender", "WaitForSeconds", "WaitForUpdate"]
+           "WaitForRender", "WaitForSeconds", "WaitForUpdate", "Job",
+           "JobScheduler", "ScheduleJob", "RunInThreadPool",
+           "RunInProcessPool", "CooperativeEventLoopManager",
+           "TimerWheel", "Timers", "WaitForSecondsRealtime", "WaitForFrames",
+           "GCPolicy"]
 
 from .core import Component
+from .values import FrameStats
 from typing_extensions import ParamSpec
 from typing import (TYPE_CHECKING, Any, Dict, List, Type, Union, Generic,
                     Mapping, TypeVar, Callable, Optional, Sequence, Awaitable,
-                    Generator)
+                    Generator, Tuple)
 import signal
 import asyncio
+import itertools
 import threading
+import concurrent.futures
 
 if TYPE_CHECKING:
     _T = TypeVar("_T")
@@ -38,6 +45,9 @@ class EventLoopManager:
     exceptions: List[Exception] = ...
     exceptionLock: threading.RLock = ...
     waitingLock: threading.RLock = ...
+    poolLock: threading.Lock = ...
+    threadPool: Union[concurrent.futures.ThreadPoolExecutor, None] = ...
+    processPool: Union[concurrent.futures.ProcessPoolExecutor, None] = ...
     threads: List[threading.Thread]
     loops: List[EventLoop]
     separateLoops: List[EventLoop]
@@ -47,17 +57,88 @@ class EventLoopManager:
     mainLoop: EventLoop
     mainWaitFor: Type[WaitForEventLoop]
     running: bool
+    jobs: JobScheduler
+    timers: Timers
+    frameStats: Dict[Union[Type[WaitForEventLoop], None], FrameStats]
+    gcPolicy: Union[GCPolicy, None]
     def __init__(self) -> None: ...
     def schedule(self, *funcs: List[Callable[[EventLoop], None]], main: bool = ..., ups: Optional[float] = ..., waitFor: Optional[Type[WaitForEventLoop]] = ...) -> None: ...
     def addLoop(self, loop: EventLoop) -> None: ...
     def start(self) -> None: ...
     def setup(self) -> None: ...
+    def begin(self, *waitFors: Type[WaitForEventLoop]) -> None: ...
+    def step(self, waitFor: Optional[Type[WaitForEventLoop]],
+             *funcs: Callable[[EventLoop], None]) -> None: ...
+    def idle(self, remaining: float) -> None: ...
     @classmethod
     def handleExceptions(cls) -> None: ...
+    @classmethod
+    def getThreadPool(cls) -> concurrent.futures.ThreadPoolExecutor: ...
+    @classmethod
+    def getProcessPool(cls) -> concurrent.futures.ProcessPoolExecutor: ...
+    @classmethod
+    def shutdownPools(cls) -> None: ...
     def updateEvents(self) -> None: ...
     def update(self) -> None: ...
     def quit(self) -> None: ...
 
+class _Schedule:
+    functions: List[Callable[[EventLoop], None]]
+    period: float
+    waitFor: Union[Type[WaitForEventLoop], None]
+    loop: EventLoop
+    stats: FrameStats
+    def __init__(self, functions: List[Callable[[EventLoop], None]], ups: float, waitFor: Optional[Type[WaitForEventLoop]], loop: EventLoop) -> None: ...
+
+class CooperativeEventLoopManager(EventLoopManager):
+    queue: List[Tuple[float, int, _Schedule]]
+    counter: itertools.count
+    cooperativeLoops: List[EventLoop]
+    def __init__(self) -> None: ...
+    def schedule(self, *funcs: List[Callable[[EventLoop], None]], main: bool = ..., ups: Optional[float] = ..., waitFor: Optional[Type[WaitForEventLoop]] = ...) -> None: ...
+    def addLoop(self, loop: EventLoop) -> None: ...
+    def setup(self) -> None: ...
+    def runSchedule(self, entry: _Schedule) -> None: ...
+    def start(self) -> None: ...
+    def quit(self) -> None: ...
+
+class Job(Generic[_T]):
+    func: Callable[..., Union[_T, Generator[Any, None, _T]]]
+    args: Sequence[Any]
+    kwargs: Mapping[str, Any]
+    priority: int
+    done: bool
+    cancelled: bool
+    result: Union[_T, None]
+    exception: Union[Exception, None]
+    generator: Union[Generator[Any, None, _T], None]
+    waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+    lock: threading.Lock
+    def __init__(self, func: Callable[..., Union[_T, Generator[Any, None, _T]]], args: Sequence[Any], kwargs: Mapping[str, Any], priority: int) -> None: ...
+    def step(self) -> bool: ...
+    def finish(self, result: Union[_T, None], exception: Optional[Exception] = ...,
+               cancelled: bool = ...) -> None: ...
+    @staticmethod
+    def _resolve(future: asyncio.Future) -> None: ...
+    def Cancel(self) -> None: ...
+    def close(self) -> None: ...
+    def __await__(self) -> Generator[Any, None, _T]: ...
+
+class JobScheduler:
+    budget: Union[float, None]
+    queue: List[Tuple[int, int, Job]]
+    lock: threading.Lock
+    counter: itertools.count
+    ran: int
+    carried: int
+    def __init__(self, budget: Optional[float] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def Submit(self, func: Callable[..., Union[_T, Generator[Any, None, _T]]], *args: Any, priority: int = ..., **kwargs: Any) -> Job[_T]: ...
+    def run(self, loop: Optional[EventLoop] = ..., slices: Optional[int] = ...) -> None: ...
+    def Clear(self) -> None: ...
+
+def ScheduleJob(func: Callable[..., Union[_T, Generator[Any, None, _T]]], *args: Any, priority: int = ..., **kwargs: Any) -> Job[_T]: ...
+
 class EventLoop(asyncio.SelectorEventLoop):
     def __init__(self, selector: Optional[Any] = ...) -> None: ...
     async def shutdown(self, signal: Optional[signal.Signals] = ...) -> None: ...
@@ -67,10 +148,90 @@ def StartCoroutine(coro: Awaitable[None]) -> None: ...
 
 class WaitFor: ...
 
+class GCPolicy:
+    freeze: bool
+    disableFull: bool
+    idleCollect: bool
+    minIdle: float
+    fullIdle: float
+    pauses: FrameStats
+    idlePauses: FrameStats
+    collections: List[int]
+    totalPause: float
+    running: bool
+    threshold: Union[Tuple[int, int, int], None]
+    framePause: float
+    frameIdlePause: float
+    collectStart: Union[float, None]
+    idling: bool
+    def __init__(self, freeze: bool = ..., disableFull: bool = ..., idleCollect: bool = ..., minIdle: float = ..., fullIdle: float = ...) -> None: ...
+    def Start(self) -> None: ...
+    def Stop(self) -> None: ...
+    def Idle(self, remaining: float) -> None: ...
+    def callback(self, phase: str, info: Dict[str, int]) -> None: ...
+
+class TimerWheel:
+    bits: int
+    size: int
+    mask: int
+    levels: int
+    range: int
+    wheels: List[List[List[Tuple[int, Any]]]]
+    overflow: List[Tuple[int, int, Any]]
+    counter: itertools.count
+    current: int
+    count: int
+    def __init__(self, bits: int = ..., levels: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def Schedule(self, delay: int, item: Any) -> None: ...
+    def _insert(self, tick: int, item: Any) -> None: ...
+    def Advance(self, ticks: int) -> List[Any]: ...
+    def Clear(self) -> None: ...
+
+class Timers:
+    resolution: float = ...
+    singleThreaded: bool
+    lock: threading.Lock
+    gameTime: float
+    realStart: float
+    frame: int
+    gameWheel: TimerWheel
+    realWheel: TimerWheel
+    frameWheel: TimerWheel
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def _wait(self, wheel: TimerWheel, delay: int) -> asyncio.Future[float]: ...
+    def _ticks(self, length: float, roundUp: bool = ...) -> int: ...
+    def WaitGame(self, length: float) -> asyncio.Future[float]: ...
+    def WaitRealtime(self, length: float) -> asyncio.Future[float]: ...
+    def WaitFrames(self, frames: int) -> asyncio.Future[float]: ...
+    def Tick(self, dt: float) -> None: ...
+    @staticmethod
+    def _resolve(futures: List[asyncio.Future[float]], gameTime: float) -> None: ...
+    def Clear(self) -> None: ...
+
 class WaitForSeconds(WaitFor):
+    length: float
     def __init__(self, length: float) -> None: ...
     def __await__(self) -> Generator[Any, None, float]: ...
 
+class WaitForSecondsRealtime(WaitForSeconds):
+    def __await__(self) -> Generator[Any, None, float]: ...
+
+class WaitForFrames(WaitFor):
+    frames: int
+    def __init__(self, frames: int) -> None: ...
+    def __await__(self) -> Generator[Any, None, float]: ...
+
+class RunInThreadPool(WaitFor, Generic[_T]):
+    func: Callable[[], _T]
+    def __init__(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> None: ...
+    def getExecutor(self) -> concurrent.futures.Executor: ...
+    def __await__(self) -> Generator[Any, None, _T]: ...
+
+class RunInProcessPool(RunInThreadPool[_T]):
+    def getExecutor(self) -> concurrent.futures.ProcessPoolExecutor: ...
+
 class WaitForEventLoop(WaitFor):
     def __init__(self) -> None: ...
     def __await__(self) -> Generator[Any, None, float]: ...
@@ -8,17 +8,18 @@ Also manages project structure.
 
 """
 
-__all__ = ["Asset", "Behaviour", "File", "Prefab", "Project",
+__all__ = ["Asset", "Behaviour", "ClonePlan", "File", "Prefab", "PrefabPool", "Project",
            "ProjectSavingContext", "Scripts", "Skybox", "Texture2D"]
 
-from .core import Component, GameObject, SavesProjectID, ShowInInspector, Space
+from .core import (Component, GameObject, SavesProjectID, ShowInInspector,
+                   Space, Tag, Transform)
 from .scenes import Scene
 from .values import ABCMeta, Quaternion, Vector3, abstractmethod
 from PIL import Image
 from typing_extensions import ParamSpec
 from types import ModuleType
-from typing import (TYPE_CHECKING, Any, Dict, List, Type, Union, TypeVar,
-                    Callable, Optional)
+from typing import (TYPE_CHECKING, Any, Dict, List, Type, Tuple, Union,
+                    TypeVar, Callable, Iterable, Optional, Set)
 from pathlib import Path
 import ctypes
 
@@ -65,9 +66,12 @@ class Texture2D(Asset):
     loaded: bool
     texture: Union[int, None]
     mipmaps: bool
+    transparent: bool
     def __init__(self, pathOrImg: Union[str, Path, Image.Image]) -> None: ...
     def load(self) -> None: ...
     def setImg(self, im: Image.Image) -> None: ...
+    @staticmethod
+    def hasTransparency(img: Image.Image) -> bool: ...
     def use(self) -> None: ...
     @classmethod
     def FromOpenGL(cls, texture: int) -> Texture2D: ...
@@ -82,10 +86,29 @@ class Skybox:
     def compile(self) -> None: ...
     def use(self) -> None: ...
 
+class ClonePlan:
+    SHARE: int = ...
+    REMAP: int = ...
+    DEEPCOPY: int = ...
+    immutable: Tuple[type, ...] = ...
+    ignored: List[str] = ...
+    gameObjects: List[GameObject]
+    savedOnly: bool
+    _included: Set[int]
+    _creation: List[Tuple[GameObject, str, Tag, bool, List[Tuple[Component, Type[Component], bool]]]]
+    _attrs: List[Tuple[int, str, int, Any]]
+    _children: List[Tuple[int, List[int]]]
+    def __init__(self, gameObjects: Iterable[GameObject], savedOnly: bool = ...) -> None: ...
+    def _addAttr(self, obj: Union[GameObject, Component], name: str, value: Any) -> None: ...
+    def Execute(self, memo: Optional[Dict[int, Any]] = ...) -> List[GameObject]: ...
+    def Apply(self, instances: Dict[int, Union[GameObject, Component]]) -> None: ...
+    def _assign(self, memo: Dict[int, Any]) -> None: ...
+
 class Prefab(Asset):
     gameObjects: List[GameObject]
     assets: List[Asset]
     gameObject: GameObject
+    plan: ClonePlan
     def __init__(self, root: GameObject, prune: bool = ...) -> None: ...
     def Contains(self, obj: Union[GameObject, Component]) -> bool: ...
     def Instantiate(self,
@@ -95,6 +118,52 @@ class Prefab(Asset):
                     rotation: Optional[Quaternion] = ...,
                     scale: Optional[Vector3] = ...,
                     space: Space = ...) -> GameObject: ...
+    def _placeInstance(self,
+                       root: GameObject,
+                       parent: Optional[Union[GameObject, Transform]],
+                       position: Optional[Vector3],
+                       rotation: Optional[Quaternion],
+                       scale: Optional[Vector3],
+                       space: Space) -> None: ...
+
+class _PooledInstance:
+    plan: ClonePlan
+    root: GameObject
+    pairs: List[Tuple[GameObject, GameObject]]
+    memo: Dict[int, Union[GameObject, Component]]
+    def __init__(self, prefab: Prefab, root: GameObject) -> None: ...
+    def alive(self) -> bool: ...
+    def matches(self) -> bool: ...
+    def disable(self) -> None: ...
+    def reset(self) -> None: ...
+
+class PrefabPool:
+    prefab: Prefab
+    capacity: Optional[int]
+    created: int
+    reused: int
+    released: int
+    destroyed: int
+    _active: Dict[GameObject, _PooledInstance]
+    _inactive: List[_PooledInstance]
+    def __init__(self, prefab: Prefab, capacity: Optional[int] = ...) -> None: ...
+    @property
+    def active(self) -> int: ...
+    @property
+    def inactive(self) -> int: ...
+    def _getScene(self, scene: Optional[Scene]) -> Scene: ...
+    def _create(self, scene: Scene) -> _PooledInstance: ...
+    def Prewarm(self, count: int, scene: Optional[Scene] = ...) -> None: ...
+    def Acquire(self,
+                scene: Optional[Scene] = ...,
+                parent: Optional[GameObject] = ...,
+                position: Optional[Vector3] = ...,
+                rotation: Optional[Quaternion] = ...,
+                scale: Optional[Vector3] = ...,
+                space: Space = ...) -> GameObject: ...
+    def Release(self, gameObject: GameObject) -> None: ...
+    def Clear(self) -> None: ...
+    def _destroy(self, instance: _PooledInstance) -> None: ...
 
 class ProjectSavingContext:
     asset: Asset
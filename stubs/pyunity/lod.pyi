@@ -0,0 +1,49 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Levels of detail, to draw simpler meshes for objects
+that cover a small part of the screen.
+
+Example
+-------
+>>> renderer = gameObject.AddComponent(MeshRenderer)
+>>> renderer.mesh = Mesh.sphere(1, detail=64)
+>>> lodGroup = gameObject.AddComponent(LODGroup)
+>>> lodGroup.Generate(renderer.mesh, [0.5, 0.2, 0.05, 0.01])
+
+"""
+
+__all__ = ["LODGroup", "LODLevel", "SimplifyMesh"]
+
+from .core import SingleComponent
+from .meshes import Mesh
+from typing import Dict, List, Sequence, Tuple
+
+def planeQuadric(normal: Sequence[float], point: Sequence[float],
+                 weight: float) -> List[float]: ...
+def quadricError(q: List[float], x: float, y: float, z: float) -> float: ...
+def addQuadric(q: List[float], other: List[float]) -> None: ...
+def cross(u: Sequence[float], v: Sequence[float]) -> Tuple[float, float, float]: ...
+def subtract(u: Sequence[float], v: Sequence[float]) -> Tuple[float, float, float]: ...
+def faceNormal(a: Sequence[float], b: Sequence[float],
+               c: Sequence[float]) -> Tuple[float, float, float]: ...
+def SimplifyMesh(mesh: Mesh, ratio: float) -> Mesh: ...
+
+class LODLevel:
+    mesh: Mesh
+    screenSize: float
+    def __init__(self, mesh: Mesh, screenSize: float) -> None: ...
+    def __deepcopy__(self, memo: Dict[int, object]) -> LODLevel: ...
+
+class LODGroup(SingleComponent):
+    levels: List[LODLevel]
+    current: int
+    hysteresis: float
+    def __init__(self) -> None: ...
+    def AddLevel(self, mesh: Mesh, screenSize: float) -> LODLevel: ...
+    def Generate(self, mesh: Mesh, screenSizes: List[float],
+                 ratio: float = ...) -> List[LODLevel]: ...
+    def getLevel(self, screenSize: float) -> int: ...
+    def Select(self, screenSize: float) -> int: ...
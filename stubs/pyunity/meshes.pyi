@@ -4,12 +4,15 @@
 
 """Module for meshes created at runtime and their various attributes."""
 
-__all__ = ["Mesh", "MeshRenderer", "Color", "RGB", "HSV", "Material"]
+__all__ = ["Mesh", "MeshRenderer", "Color", "RGB", "HSV", "Material",
+           "StaticBatch"]
 
-from .core import SingleComponent
+from .core import GameObject, SingleComponent
 from .files import Asset, Texture2D
 from .values import Vector3
-from typing import Any, List, Union, Iterator, Optional
+from .scenes import Scene
+from typing import Any, Dict, List, Union, Iterator, Optional, Tuple
+from ctypes import Array, c_float, c_uint
 
 floatSize: int = ...
 
@@ -19,14 +22,19 @@ class Mesh(Asset):
     normals: List[Vector3]
     texcoords: List[float]
     compiled: bool
+    instanceBuffer: Union[int, None]
+    buffers: Union[Tuple[Array[c_float], int, Array[c_uint], int], None]
     min: Vector3
     max: Vector3
     def __init__(self, verts: List[Vector3],
                 triangles: List[List[int]],
                 normals: List[Vector3],
                 texcoords: Optional[List[List[float]]] = ...) -> None: ...
+    def prepare(self) -> None: ...
     def compile(self, force: bool = ...) -> None: ...
-    def draw(self) -> None: ...
+    def bind(self) -> None: ...
+    def draw(self, bind: bool = ...) -> None: ...
+    def drawInstanced(self, buffer: int, count: int) -> None: ...
     def copy(self) -> Mesh: ...
 
     @staticmethod
@@ -46,6 +54,8 @@ class Material(Asset):
     color: Color
     texture: Texture2D
     def __init__(self, color: Color, texture: Optional[Texture2D] = ...) -> None: ...
+    @property
+    def transparent(self) -> bool: ...
 
 class Color:
     def toString(self) -> str: ...
@@ -88,6 +98,27 @@ class HSV(Color):
 
 class MeshRenderer(SingleComponent):
     DefaultMaterial: Material = ...
-    mesh: Union[Mesh, None] = ...
     mat: Material = ...
+    staticBatch: Union[StaticBatch, None] = ...
+    worldBounds: Union[Tuple[float, float, float, float], None] = ...
+    boundsKey: Union[Tuple[Any, int], None] = ...
+    isStatic: bool = ...
+    @property
+    def mesh(self) -> Union[Mesh, None]: ...
+    @mesh.setter
+    def mesh(self, value: Union[Mesh, None]) -> None: ...
     def Render(self) -> None: ...
+
+class StaticBatch:
+    scene: Scene
+    material: Material
+    renderers: List[MeshRenderer]
+    mesh: Mesh
+    renderer: MeshRenderer
+    maxVertices: int = ...
+    def __init__(self, scene: Scene, material: Material,
+                 renderers: List[MeshRenderer]) -> None: ...
+    def __deepcopy__(self, memo: Dict[int, object]) -> StaticBatch: ...
+    @staticmethod
+    def Combine(gameObjects: Union[GameObject, List[GameObject]]) -> List[StaticBatch]: ...
+    def Remove(self) -> None: ...
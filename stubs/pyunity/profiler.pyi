@@ -0,0 +1,46 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+__all__ = ["Disable", "Enable", "ExportTrace", "LogSummary", "Profile",
+           "Record", "Reset", "Section", "Summary"]
+
+from pathlib import Path
+from types import TracebackType
+from typing import (Any, Callable, Deque, Dict, List, Optional, Tuple, Type,
+                    TypeVar, Union)
+import threading
+
+_T = TypeVar("_T", bound=Callable[..., Any])
+
+enabled: bool = ...
+events: Deque[Tuple[str, str, float, float, int, bool]] = ...
+stats: Dict[Tuple[str, str], List[Union[int, float]]] = ...
+threadNames: Dict[int, str] = ...
+origin: float = ...
+lock: threading.Lock = ...
+
+def Enable(capacity: int = ...) -> None: ...
+def Disable() -> None: ...
+def Reset() -> None: ...
+def Record(name: str, category: str, start: float, end: float, task: bool = ...) -> None: ...
+
+class _Section:
+    name: str
+    category: str
+    start: float
+    def __init__(self, name: str, category: str) -> None: ...
+    def __enter__(self) -> _Section: ...
+    def __exit__(self, exctype: Optional[Type[BaseException]], value: Optional[BaseException], tb: Optional[TracebackType]) -> None: ...
+
+class _NullSection:
+    def __enter__(self) -> _NullSection: ...
+    def __exit__(self, exctype: Optional[Type[BaseException]], value: Optional[BaseException], tb: Optional[TracebackType]) -> None: ...
+
+_nullSection: _NullSection = ...
+
+def Section(name: str, category: str = ...) -> Union[_Section, _NullSection]: ...
+def Profile(name: str, category: str = ...) -> Callable[[_T], _T]: ...
+def Summary(category: Optional[str] = ...) -> Dict[str, Dict[str, Any]]: ...
+def LogSummary(category: Optional[str] = ..., limit: int = ...) -> None: ...
+def ExportTrace(path: Optional[Union[str, Path]] = ...) -> Dict[str, Any]: ...
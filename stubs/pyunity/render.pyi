@@ -10,12 +10,12 @@ Classes to aid in rendering in a Scene.
 __all__ = ["Camera", "Screen", "Shader", "Light", "LightType"]
 
 from .core import SingleComponent, Transform
-from .files import Skybox
+from .files import Skybox, Texture2D
 from .gui import Canvas, GuiRenderComponent, RectTransform
-from .meshes import Color, MeshRenderer
+from .meshes import Color, Mesh, MeshRenderer
 from .values import ImmutableStruct, Quaternion, Vector2, Vector3
 import glm
-from typing import Dict, List, Union, Optional
+from typing import Any, Dict, List, Tuple, Union, Optional
 from pathlib import Path
 import enum
 
@@ -28,10 +28,24 @@ class Shader:
     compiled: bool
     name: str
     uniforms: Dict[str, Union[int, float, glm.vec3, glm.mat3, glm.mat4]]
+    locations: Dict[bytes, int]
+    names: Dict[bytes, str]
+    values: Dict[bytes, Any]
+    issued: int
+    skipped: int
+    variants: Dict[str, Shader]
+    program: int
     def __init__(self, vertex: str, frag: str, name: str) -> None: ...
     def __deepcopy__(self, memo: Optional[Dict[int, object]] = ...) -> Shader: ...
     def loadCache(self, file: Union[str, Path]) -> None: ...
     def compile(self) -> None: ...
+    def reflect(self) -> None: ...
+    def getLocation(self, var: bytes) -> int: ...
+    def changed(self, var: bytes, val: Any, key: Any) -> bool: ...
+    def resetCounters(self) -> None: ...
+    @property
+    def supportsInstancing(self) -> bool: ...
+    def GetVariant(self, define: str) -> Shader: ...
     @staticmethod
     def fromFolder(path: Union[str, Path], name: str) -> Shader: ...
     def setVec3(self, var: bytes, val: glm.vec3) -> None: ...
@@ -41,14 +55,104 @@ class Shader:
     def setFloat(self, var: bytes, val: float) -> None: ...
     def use(self) -> None: ...
 
+class UniformBuffer:
+    name: bytes
+    binding: int
+    size: int
+    buffer: Union[int, None]
+    data: Union[bytes, None]
+    uploads: int
+    def __init__(self, name: bytes, binding: int, size: int) -> None: ...
+    def setup(self) -> None: ...
+    def Update(self, data: bytes) -> bool: ...
+    def reset(self) -> None: ...
+
+class InstanceBuffer:
+    buffer: Union[int, None]
+    uploads: int
+    def __init__(self) -> None: ...
+    def Update(self, data: bytes) -> int: ...
+    def reset(self) -> None: ...
+
+class RenderQueue:
+    draws: List[Tuple[tuple, Shader, List[MeshRenderer], bool]]
+    position: glm.vec3
+    shader: Union[Shader, None]
+    texture: Union[Texture2D, None]
+    mesh: Union[Mesh, None]
+    drawCalls: int
+    shaderChanges: int
+    textureChanges: int
+    meshChanges: int
+    def __init__(self) -> None: ...
+    @property
+    def stateChanges(self) -> int: ...
+    def resetCounters(self) -> None: ...
+    def Begin(self, position: glm.vec3) -> None: ...
+    def Add(self, shader: Shader, renderers: List[MeshRenderer], distance: float,
+            texture: Optional[Texture2D] = ..., transparent: bool = ...,
+            instanced: bool = ..., mesh: Optional[Mesh] = ...) -> None: ...
+    def Sort(self) -> List[Tuple[tuple, Shader, List[MeshRenderer], bool]]: ...
+    def End(self) -> None: ...
+    def UseShader(self, shader: Shader) -> bool: ...
+    def UseTexture(self, texture: Optional[Texture2D]) -> None: ...
+    def DrawMesh(self, mesh: Mesh) -> None: ...
+    def DrawInstanced(self, mesh: Mesh, data: bytes, count: int) -> None: ...
+
+class Frustum:
+    planes: List[Tuple[float, float, float, float]]
+    def __init__(self, matrix: glm.mat4) -> None: ...
+    def ContainsSphere(self, sphere: Tuple[float, float, float, float]) -> bool: ...
+    def CullSpheres(self, spheres: List[Tuple[float, float, float, float]]) -> List[bool]: ...
+
+NR_LIGHTS: int = ...
+NR_SHADOW_MAPS: int = ...
+NR_CASCADES: int = ...
+LIGHT_SIZE: int = ...
+CASCADES_SIZE: int = ...
+uniformBuffers: Dict[bytes, UniformBuffer] = ...
+cameraBuffer: UniformBuffer = ...
+lightBuffer: UniformBuffer = ...
+cascadeBuffer: UniformBuffer = ...
+shadowMapNames: List[bytes] = ...
+cascadeMapNames: List[bytes] = ...
+identityBytes: bytes = ...
+instanceBuffer: InstanceBuffer = ...
+
 shaders: Dict[str, Shader] = ...
 skyboxes: Dict[str, Skybox] = ...
 
 def compileShaders() -> None: ...
 def compileSkyboxes() -> None: ...
 def resetShaders() -> None: ...
+def uniformCounters() -> Tuple[int, int]: ...
+def resetUniformCounters() -> None: ...
 def resetSkyboxes() -> None: ...
 
+class ShadowCache:
+    key: Union[Tuple[Any, ...], None]
+    staticKey: Union[Tuple[Any, ...], None]
+    def __init__(self) -> None: ...
+    def __deepcopy__(self, memo: Dict[int, object]) -> ShadowCache: ...
+
+class ShadowCascade:
+    near: float
+    far: float
+    size: int
+    interval: int
+    matrix: Union[glm.mat4, None]
+    age: int
+    shadowCache: ShadowCache
+    depthFBO: int
+    depthMap: int
+    staticFBO: int
+    staticMap: int
+    def __init__(self, near: float, far: float, size: int, interval: int = ...) -> None: ...
+    def __deepcopy__(self, memo: Dict[int, object]) -> ShadowCascade: ...
+    def __repr__(self) -> str: ...
+    def setupBuffers(self) -> None: ...
+    def setupStaticBuffers(self, depthMapSize: int) -> None: ...
+
 class LightType(enum.IntEnum):
     Point: LightType = ...
     Directional: LightType = ...
@@ -60,8 +164,16 @@ class Light(SingleComponent):
     type: LightType = ...
     near: float
     far: float
+    shadowCache: ShadowCache
+    depthFBO: int
+    depthMap: int
+    staticFBO: int
+    staticMap: int
     def __init__(self) -> None: ...
     def setupBuffers(self, depthMapSize: int) -> None: ...
+    def setupStaticBuffers(self, depthMapSize: int) -> None: ...
+    @staticmethod
+    def genDepthMap(depthMapSize: int) -> Tuple[int, int]: ...
 
 class Camera(SingleComponent):
     near: float = ...
@@ -74,6 +186,10 @@ class Camera(SingleComponent):
     shadows: bool = ...
     canvas: Union[Canvas, None] = ...
     depthMapSize: int = ...
+    instancing: bool = ...
+    culling: bool = ...
+    shadowCaching: bool = ...
+    minInstances: int = ...
     size: Vector2
     guiShader: Shader
     skyboxShader: Shader
@@ -82,6 +198,12 @@ class Camera(SingleComponent):
     orthoMat: glm.mat4
     viewMat: glm.mat4
     renderPass: bool
+    renderQueue: RenderQueue
+    culled: int
+    shadowCulled: int
+    shadowsCached: int
+    cascades: List[ShadowCascade]
+    lodMeshes: Dict[MeshRenderer, Mesh]
     guiVBO: int
     guiVAO: int
     _fov: float
@@ -98,15 +220,46 @@ class Camera(SingleComponent):
     @orthoSize.setter
     def orthoSize(self, value: float) -> None: ...
     def Resize(self, width: int, height: int) -> None: ...
-    def getMatrix(self, transform: Transform) -> glm.mat4: ...
+    @staticmethod
+    def getMatrix(transform: Transform) -> glm.mat4: ...
+    @staticmethod
+    def getNormalMatrix(transform: Transform) -> glm.mat3: ...
+    @staticmethod
+    def getBounds(renderer: MeshRenderer) -> Tuple[float, float, float, float]: ...
+    def Cull(self, renderers: List[MeshRenderer], matrix: glm.mat4) -> List[MeshRenderer]: ...
+    def getScreenSize(self, renderer: MeshRenderer) -> float: ...
+    def SelectLODs(self, renderers: List[MeshRenderer]) -> List[MeshRenderer]: ...
+    def getMesh(self, renderer: MeshRenderer) -> Union[Mesh, None]: ...
+    def getDistance(self, transform: Transform) -> float: ...
     def get2DMatrix(self, rectTransform: RectTransform) -> glm.mat4: ...
     def getViewMat(self) -> glm.mat4: ...
     def UseShader(self, name: str) -> None: ...
+    def getProjMat(self) -> glm.mat4: ...
+    def UpdateCameraBuffer(self, lights: List[Light]) -> None: ...
+    def UpdateLightBuffer(self, lights: List[Light]) -> None: ...
     def SetupShader(self, lights: List[Light]) -> None: ...
-    def SetupDepthShader(self, light: Light) -> None: ...
+    def SetShadowSamplers(self, shader: Shader) -> None: ...
+    def getLightSpaceMatrix(self, light: Light) -> glm.mat4: ...
+    def getShadowKey(self, matrix: glm.mat4, size: int,
+                     casters: List[MeshRenderer]) -> Tuple[Any, ...]: ...
+    def getCascadeLight(self, lights: List[Light]) -> int: ...
+    def SetCascades(self, count: int = ..., distance: Optional[float] = ...,
+                    sizes: Optional[List[int]] = ..., intervals: Optional[List[int]] = ...,
+                    blend: float = ...) -> List[ShadowCascade]: ...
+    def getCascadeMatrix(self, light: Light, near: float, far: float, size: int) -> glm.mat4: ...
+    def UpdateCascadeBuffer(self, index: int) -> None: ...
+    def SetupDepthShader(self, index: int, cascade: int = ...) -> None: ...
+    def GroupInstances(self, renderers: List[MeshRenderer], shader: Shader,
+                       material: bool = ...) -> Tuple[List[MeshRenderer], List[List[MeshRenderer]]]: ...
+    def DrawInstanced(self, group: List[MeshRenderer], color: bool = ...) -> None: ...
+    def QueueDraws(self, renderers: List[MeshRenderer], shader: Shader,
+                   material: bool = ...) -> List[Tuple[tuple, Shader, List[MeshRenderer], bool]]: ...
     def Draw(self, renderers: List[MeshRenderer]) -> None: ...
     def DrawDepth(self, renderers: List[MeshRenderer]) -> None: ...
     def RenderDepth(self, renderers: List[MeshRenderer], lights: List[Light]) -> None: ...
+    def RenderShadowMap(self, index: int, light: Light, casters: List[MeshRenderer],
+                        cascade: Optional[ShadowCascade] = ...) -> None: ...
+    def RenderCascades(self, renderers: List[MeshRenderer], lights: List[Light]) -> None: ...
     def RenderScene(self, renderers: List[MeshRenderer], lights: List[Light]) -> None: ...
     def Render(self, renderers: List[MeshRenderer], lights: List[Light]) -> None: ...
     def RenderSkybox(self) -> None: ...
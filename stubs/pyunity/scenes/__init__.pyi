@@ -7,7 +7,9 @@ Module to create and load Scenes.
 
 """
 
-__all__ = ["SceneManager", "Scene"]
+__all__ = ["SceneManager", "Scene", "SceneSnapshot", "VectorEnv"]
 
 from . import sceneManager as SceneManager
 from .scene import Scene
+from .snapshot import SceneSnapshot
+from .vectorEnv import VectorEnv
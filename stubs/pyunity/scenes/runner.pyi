@@ -4,10 +4,11 @@
 
 __all__ = ["ChangeScene", "Runner", "WindowRunner", "NonInteractiveRunner"]
 
-from ..events import EventLoopManager
+from ..events import EventLoop, EventLoopManager
 from ..window import ABCWindow
 from .scene import Scene
-from typing import Type, Union, NoReturn
+from .streaming import SceneStreamer
+from typing import Callable, Optional, Type, Union, NoReturn
 
 class ChangeScene(Exception): ...
 
@@ -15,10 +16,11 @@ class Runner:
     scene: Union[Scene, None]
     next: Union[Scene, None]
     opened: bool
+    streamer: SceneStreamer
     eventLoopManager: EventLoopManager
     def __init__(self) -> None: ...
-    def setScene(self, scene: Scene) -> None: ...
-    def setNext(self, scene: Scene) -> NoReturn: ...
+    def setScene(self, scene: Scene, clone: bool = ...) -> None: ...
+    def setNext(self, scene: Scene, clone: bool = ...) -> NoReturn: ...
     def open(self) -> None: ...
     def setup(self) -> None: ...
     def load(self, managerClass: Type[EventLoopManager] = ...) -> None: ...
@@ -35,6 +37,17 @@ class WindowRunner(Runner):
     def quit(self) -> None: ...
 
 class NonInteractiveRunner(Runner):
+    loop: Union[EventLoop, None]
+    accumulator: float
+    ticks: int
+    def __init__(self) -> None: ...
     def load(self, managerClass: Type[EventLoopManager] = ...) -> None: ...
+    def fastForward(self, ticks: Optional[int] = ...,
+                    until: Optional[Callable[[Scene], bool]] = ...,
+                    dt: Optional[float] = ..., fixedDt: float = ...,
+                    jobSlices: int = ...) -> int: ...
+    def startFastForward(self) -> None: ...
+    def tick(self, dt: float, fixedDt: float, jobSlices: int) -> None: ...
+    def quit(self) -> None: ...
 
 def newRunner() -> Runner: ...
@@ -17,11 +17,13 @@ __all__ = ["Scene"]
 from ..core import Component, GameObject
 from ..events import EventLoop
 from ..files import Asset
-from ..meshes import MeshRenderer
-from ..render import Camera, Light
+from ..meshes import MeshRenderer, StaticBatch
+from ..render import Camera, Frustum, Light
+from ..spatial import Octree
+from ..values import Vector3
 from typing import TYPE_CHECKING, Any, Dict
 from typing import List as _List
-from typing import Type, TypeVar, Optional, Awaitable
+from typing import Type, TypeVar, Optional, Awaitable, Union
 
 if TYPE_CHECKING:
     _CT = TypeVar("_CT", bound=Component)
@@ -29,17 +31,21 @@ if TYPE_CHECKING:
 disallowedChars: set = ...
 
 def createTask(loop: EventLoop, coro: Awaitable[None], *args: Any) -> None: ...
+def profileTask(loop: EventLoop, coro: Awaitable[None], *args: Any) -> None: ...
 
 class Scene(Asset):
     name: str
     mainCamera: Camera
     gameObjects: _List[GameObject]
+    staticBatches: _List[StaticBatch]
+    octree: Optional[Octree]
     lights: _List[Light]
     lastFrame: float
     lastFixedFrame: float
     def __init__(self, name: str) -> None: ...
     @staticmethod
     def Bare(name: str) -> Scene: ...
+    def Clone(self) -> Scene: ...
     @property
     def rootGameObjects(self) -> _List[GameObject]: ...
     def Add(self, gameObject: GameObject) -> None: ...
@@ -52,12 +58,17 @@ class Scene(Asset):
     def FindGameObjectsByTagNumber(self, num: int) -> _List[GameObject]: ...
     def FindComponent(self, component: Type[_CT]) -> _CT: ...
     def FindComponents(self, component: Type[_CT]) -> _List[_CT]: ...
+    def EnableOctree(self, center: Optional[Vector3] = ..., halfSize: float = ...,
+                     maxDepth: int = ...) -> Octree: ...
+    def DisableOctree(self) -> None: ...
     def insideFrustum(self, renderer: MeshRenderer) -> bool: ...
     def startOpenGL(self) -> None: ...
     def startScripts(self) -> None: ...
     def startLoop(self) -> None: ...
     def Start(self) -> None: ...
-    def updateScripts(self, loop: EventLoop) -> None: ...
-    def updateFixed(self, loop: EventLoop) -> None: ...
+    def updateScripts(self, loop: EventLoop, dt: Optional[float] = ...) -> None: ...
+    def updateFixed(self, loop: EventLoop, dt: Optional[float] = ...) -> None: ...
+    def GetRenderers(self) -> _List[MeshRenderer]: ...
+    def Cull(self, frustum: Frustum) -> _List[MeshRenderer]: ...
     def Render(self, loop: Optional[EventLoop] = ...) -> None: ...
     def cleanUp(self) -> None: ...
@@ -10,11 +10,13 @@ of Scenes.
 
 __all__ = ["RemoveScene", "GetSceneByName", "LoadSceneByIndex", "AddBareScene",
            "LoadSceneByName", "CurrentScene", "AddScene", "LoadScene",
-           "RemoveAllScenes", "GetSceneByIndex", "KeyboardInterruptKill"]
+           "RemoveAllScenes", "GetSceneByIndex", "KeyboardInterruptKill",
+           "LoadSceneAdditive", "LoadSceneAsync", "UnloadScene", "LoadedScenes"]
 
 from .runner import Runner
 from .scene import Scene
-from typing import Dict, List
+from .streaming import SceneLoadOperation
+from typing import Callable, Dict, List, Union
 
 scenesByIndex: List[Scene] = ...
 scenesByName: Dict[str, Scene] = ...
@@ -27,9 +29,14 @@ def GetSceneByIndex(index: int) -> Scene: ...
 def GetSceneByName(name: str) -> Scene: ...
 def RemoveScene(scene: Scene) -> None: ...
 def RemoveAllScenes() -> None: ...
-def LoadSceneByName(name: str) -> None: ...
-def LoadSceneByIndex(index: int) -> None: ...
-def LoadScene(scene: Scene) -> None: ...
+def LoadSceneByName(name: str, clone: bool = ...) -> None: ...
+def LoadSceneByIndex(index: int, clone: bool = ...) -> None: ...
+def LoadScene(scene: Scene, clone: bool = ...) -> None: ...
 def stopWindow() -> None: ...
-def __loadScene(scene: Scene) -> None: ...
+def __loadScene(scene: Scene, clone: bool = ...) -> None: ...
 def CurrentScene() -> Scene: ...
+def __checkRunning(source: Union[Scene, Callable[[], Scene]]) -> None: ...
+def LoadSceneAdditive(scene: Scene, clone: bool = ...) -> SceneLoadOperation: ...
+def LoadSceneAsync(scene: Union[Scene, Callable[[], Scene]], clone: bool = ..., additive: bool = ...) -> SceneLoadOperation: ...
+def UnloadScene(operation: SceneLoadOperation) -> None: ...
+def LoadedScenes() -> List[Scene]: ...
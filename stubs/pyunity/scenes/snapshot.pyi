@@ -0,0 +1,40 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Module to capture and restore the runtime state
+of a Scene in memory.
+
+"""
+
+__all__ = ["SceneSnapshot"]
+
+from ..core import Component, GameObject
+from .scene import Scene
+from typing import IO, Any, Dict, List, Union
+import pickle
+
+class _SnapshotPickler(pickle.Pickler):
+    snapshot: SceneSnapshot
+    def __init__(self, file: IO[bytes], snapshot: SceneSnapshot) -> None: ...
+    def persistent_id(self, obj: Any) -> Union[int, None]: ...
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    snapshot: SceneSnapshot
+    def __init__(self, file: IO[bytes], snapshot: SceneSnapshot) -> None: ...
+    def persistent_load(self, pid: int) -> Any: ...
+
+class SceneSnapshot:
+    scene: Scene
+    data: bytes
+    gameObjects: List[GameObject]
+    components: List[List[Component]]
+    _objects: List[Union[GameObject, Component]]
+    _indices: Dict[int, int]
+    _externals: List[Any]
+    _externalIndices: Union[Dict[int, int], None]
+    def __init__(self, scene: Scene) -> None: ...
+    def _add(self, obj: Union[GameObject, Component]) -> None: ...
+    def __len__(self) -> int: ...
+    def Restore(self) -> None: ...
@@ -0,0 +1,64 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Module to load scenes in the background and to run
+several scenes at once.
+
+"""
+
+__all__ = ["SceneLoadOperation", "SceneStreamer"]
+
+from ..core import GameObject
+from ..events import EventLoop
+from ..files import Texture2D
+from ..meshes import Mesh
+from .runner import Runner
+from .scene import Scene
+from typing import Any, Callable, Deque, Generator, List, Tuple, Union
+import asyncio
+import threading
+
+class SceneLoadOperation:
+    source: Union[Scene, Callable[[], Scene]]
+    clone: bool
+    additive: bool
+    scene: Union[Scene, None]
+    state: str
+    done: bool
+    exception: Union[Exception, None]
+    assets: List[Union[Mesh, Texture2D]]
+    uploaded: int
+    waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]]
+    lock: threading.Lock
+    def __init__(self, source: Union[Scene, Callable[[], Scene]], clone: bool, additive: bool) -> None: ...
+    @property
+    def progress(self) -> float: ...
+    def build(self) -> Scene: ...
+    def finish(self, state: str, exception: Union[Exception, None] = ...) -> None: ...
+    @staticmethod
+    def _resolve(future: asyncio.Future[None]) -> None: ...
+    def __await__(self) -> Generator[Any, None, Scene]: ...
+
+class SceneStreamer:
+    uploadBudget: float = ...
+    runner: Runner
+    lock: threading.Lock
+    uploading: Deque[SceneLoadOperation]
+    ready: Deque[SceneLoadOperation]
+    unloading: Deque[SceneLoadOperation]
+    loading: List[SceneLoadOperation]
+    loaded: List[SceneLoadOperation]
+    def __init__(self, runner: Runner) -> None: ...
+    @property
+    def gl(self) -> bool: ...
+    def Load(self, source: Union[Scene, Callable[[], Scene]], clone: bool = ..., additive: bool = ..., background: bool = ...) -> SceneLoadOperation: ...
+    def build(self, operation: SceneLoadOperation) -> None: ...
+    def Upload(self) -> None: ...
+    def Integrate(self, loop: EventLoop) -> None: ...
+    def getAdded(self, loaded: Scene) -> List[GameObject]: ...
+    def remove(self, scene: Scene, operation: SceneLoadOperation) -> None: ...
+    def Unload(self, operation: SceneLoadOperation) -> None: ...
+    def cancel(self, operation: SceneLoadOperation) -> None: ...
+    def Clear(self) -> None: ...
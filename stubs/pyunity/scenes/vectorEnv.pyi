@@ -0,0 +1,80 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Module to run many copies of a headless scene
+in parallel, one worker process per copy.
+
+"""
+
+__all__ = ["VectorEnv"]
+
+from .runner import NonInteractiveRunner
+from .scene import Scene
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import (Any, Callable, List, Optional, Sequence, Tuple, Type,
+                    Union)
+from types import TracebackType
+
+def _asView(array: Any, shape: Sequence[int]) -> memoryview: ...
+
+class _Worker:
+    index: int
+    sceneFactory: Callable[[int], Scene]
+    observe: Callable[[Scene], Sequence[float]]
+    act: Callable[[Scene, List[float]], None]
+    reward: Optional[Callable[[Scene], float]]
+    done: Optional[Callable[[Scene], bool]]
+    observations: Any
+    actions: Any
+    rewards: Any
+    dones: Any
+    observationSize: int
+    actionSize: int
+    dt: Optional[float]
+    fixedDt: float
+    runner: Union[NonInteractiveRunner, None]
+    def __init__(self, index: int, sceneFactory: Callable[[int], Scene],
+                 observe: Callable[[Scene], Sequence[float]],
+                 act: Callable[[Scene, List[float]], None],
+                 reward: Optional[Callable[[Scene], float]],
+                 done: Optional[Callable[[Scene], bool]],
+                 arrays: Tuple[Any, Any, Any, Any], sizes: Tuple[int, int],
+                 dt: Optional[float], fixedDt: float) -> None: ...
+    def run(self, conn: Connection) -> None: ...
+    def stop(self) -> None: ...
+    def reset(self) -> None: ...
+    def writeObservation(self) -> None: ...
+    def step(self, ticks: int) -> None: ...
+
+def _runWorker(conn: Connection, worker: _Worker) -> None: ...
+
+class VectorEnv:
+    numEnvs: int
+    observationSize: int
+    actionSize: int
+    ticksPerStep: int
+    observations: memoryview
+    rewards: memoryview
+    dones: memoryview
+    conns: List[Connection]
+    processes: List[BaseProcess]
+    closed: bool
+    def __init__(self, sceneFactory: Callable[[int], Scene], numEnvs: int,
+                 observationSize: int, actionSize: int,
+                 observe: Callable[[Scene], Sequence[float]],
+                 act: Callable[[Scene, List[float]], None],
+                 reward: Optional[Callable[[Scene], float]] = ...,
+                 done: Optional[Callable[[Scene], bool]] = ...,
+                 dt: Optional[float] = ..., fixedDt: float = ...,
+                 ticksPerStep: int = ..., context: Optional[str] = ...) -> None: ...
+    def _broadcast(self, command: str, arg: Any = ...) -> None: ...
+    def reset(self) -> memoryview: ...
+    def step(self, actions: Sequence[Sequence[float]]) -> Tuple[memoryview, memoryview, memoryview]: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> VectorEnv: ...
+    def __exit__(self, exctype: Optional[Type[BaseException]],
+                 value: Optional[BaseException],
+                 tb: Optional[TracebackType]) -> None: ...
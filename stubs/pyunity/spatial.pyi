@@ -0,0 +1,73 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+"""
+Spatial index over the MeshRenderers of a scene, so that
+culling and spatial queries can skip whole regions of the
+scene at once.
+
+Example
+-------
+>>> octree = scene.EnableOctree(halfSize=2000)
+>>> octree.QuerySphere(Vector3(0, 0, 0), 10)
+>>> octree.Raycast(Vector3(0, 5, 0), Vector3.down())
+
+When a scene has an octree, its main camera uses it to
+select the renderers drawn in the main pass and in each
+shadow pass.
+
+"""
+
+__all__ = ["Octree", "OctreeNode"]
+
+from .core import GameObject, Transform
+from .meshes import MeshRenderer
+from .render import Frustum
+from .values import Vector3
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+class OctreeNode:
+    center: Tuple[float, float, float]
+    halfSize: float
+    depth: int
+    parent: Optional[OctreeNode]
+    index: int
+    renderers: List[MeshRenderer]
+    children: List[Optional[OctreeNode]]
+    count: int
+    def __init__(self, center: Tuple[float, float, float], halfSize: float, depth: int,
+                 parent: Optional[OctreeNode] = ..., index: int = ...) -> None: ...
+    def GetChild(self, index: int) -> OctreeNode: ...
+    def Contains(self, x: float, y: float, z: float) -> bool: ...
+
+class Octree:
+    root: OctreeNode
+    maxDepth: int
+    nodes: Dict[MeshRenderer, OctreeNode]
+    dirty: Set[Transform]
+    unplaced: Set[MeshRenderer]
+    tracked: Dict[GameObject, List[MeshRenderer]]
+    def __init__(self, center: Optional[Vector3] = ..., halfSize: float = ...,
+                 maxDepth: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[MeshRenderer]: ...
+    def __contains__(self, renderer: MeshRenderer) -> bool: ...
+    def Add(self, renderer: MeshRenderer) -> None: ...
+    def insert(self, renderer: MeshRenderer) -> None: ...
+    def Remove(self, renderer: MeshRenderer) -> None: ...
+    def Sync(self, gameObject: GameObject) -> None: ...
+    def Invalidate(self, renderer: MeshRenderer) -> None: ...
+    def Update(self) -> None: ...
+    def QueryFrustum(self, frustum: Frustum) -> List[MeshRenderer]: ...
+    def queryFrustum(self, node: OctreeNode, planes: List[Tuple[float, float, float, float]],
+                     result: List[MeshRenderer], inside: bool) -> None: ...
+    def collect(self, node: OctreeNode, result: List[MeshRenderer]) -> None: ...
+    def QuerySphere(self, center: Vector3, radius: float) -> List[MeshRenderer]: ...
+    def querySphere(self, node: OctreeNode, sphere: Tuple[float, float, float, float],
+                    result: List[MeshRenderer]) -> None: ...
+    def Raycast(self, origin: Vector3, direction: Vector3,
+                maxDistance: float = ...) -> List[Tuple[float, MeshRenderer]]: ...
+    def raycast(self, node: OctreeNode, origin: Tuple[float, float, float],
+                direction: Tuple[float, float, float], maxDistance: float,
+                result: List[Tuple[float, MeshRenderer]]) -> None: ...
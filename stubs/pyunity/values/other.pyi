@@ -2,13 +2,13 @@
 ## This file is licensed under the MIT License.
 ## See https://docs.pyunity.x10.bz/en/latest/license.html
 
-__all__ = ["Clock", "IgnoredMixin", "ImmutableStruct", "IncludeInstanceMixin",
+__all__ = ["Clock", "FrameStats", "IgnoredMixin", "ImmutableStruct", "IncludeInstanceMixin",
            "IncludeMixin", "LockedLiteral", "ModuleExportControlMixin",
            "SavableStruct", "StructEntry"]
 
 from typing_extensions import ParamSpec
 from typing import (TYPE_CHECKING, Any, Dict, List, Type, Tuple, Union,
-                    Generic, Mapping, TypeVar, Callable, Optional)
+                    Generic, Mapping, TypeVar, Callable, Optional, Deque)
 
 if TYPE_CHECKING:
     _P = ParamSpec("_P")
@@ -20,9 +20,34 @@ class IgnoredMixin(ModuleExportControlMixin): ...
 class IncludeMixin(ModuleExportControlMixin): ...
 class IncludeInstanceMixin(ModuleExportControlMixin): ...
 
+class FrameStats:
+    times: Deque[float]
+    last: Union[float, None]
+    def __init__(self, size: int = ...) -> None: ...
+    def Record(self, frameTime: float) -> None: ...
+    def Tick(self) -> None: ...
+    def Reset(self) -> None: ...
+    def Percentile(self, percent: float) -> float: ...
+    @property
+    def count(self) -> int: ...
+    @property
+    def mean(self) -> float: ...
+    @property
+    def max(self) -> float: ...
+    @property
+    def p95(self) -> float: ...
+    @property
+    def p99(self) -> float: ...
+    def Summary(self) -> Dict[str, float]: ...
+
 class Clock:
+    spinThreshold: float = ...
     _fps: int = ...
     _frameDuration: float = ...
+    _start: float
+    _deadline: float
+    stats: FrameStats
+    idleCallback: Union[Callable[[float], None], None]
 
     def __init__(self) -> None: ...
     def Start(self, fps: Optional[int] = ...) -> None: ...
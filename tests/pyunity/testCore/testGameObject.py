@@ -70,3 +70,24 @@ class TestGameObject(TestCase):
         numComponents = len(gameObject.components)
         gameObject.RemoveComponents(Collider)
         assert len(gameObject.components) == numComponents
+
+    def testComponentCache(self):
+        gameObject = GameObject()
+        assert gameObject.GetComponent(Collider) is None
+        assert gameObject.GetComponents(Component) == [gameObject.transform]
+
+        collider = gameObject.AddComponent(Collider)
+        assert gameObject.GetComponent(Collider) is collider
+        assert gameObject.GetComponents(Component) == [gameObject.transform, collider]
+
+        collider2 = gameObject.AddComponent(Collider)
+        components = gameObject.GetComponents(Collider)
+        assert components == [collider, collider2]
+        components.clear()
+        assert gameObject.GetComponents(Collider) == [collider, collider2]
+
+        gameObject.RemoveComponent(Collider)
+        assert gameObject.GetComponent(Collider) is collider2
+        gameObject.RemoveComponents(Collider)
+        assert gameObject.GetComponent(Collider) is None
+        assert gameObject.GetComponents(Component) == [gameObject.transform]
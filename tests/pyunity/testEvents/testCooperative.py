@@ -0,0 +1,67 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, CooperativeEventLoopManager, EventLoopManager,
+                     GameObject, SceneManager, WaitForFixedUpdate,
+                     WaitForUpdate, config)
+from pyunity.scenes.runner import NonInteractiveRunner
+from . import SceneTestCase
+import threading
+import os
+
+class Counter(Behaviour):
+    async def Start(self):
+        self.updates = 0
+        self.fixedUpdates = 0
+        self.threads = set()
+        self.waited = 0
+        await WaitForFixedUpdate()
+        self.waited += 1
+
+    def Update(self, dt):
+        self.updates += 1
+        self.threads.add(threading.get_ident())
+        if self.updates == 20:
+            EventLoopManager.current.running = False
+
+    def FixedUpdate(self, dt):
+        self.fixedUpdates += 1
+        self.threads.add(threading.get_ident())
+
+class TestCooperativeEventLoopManager(SceneTestCase):
+    def setUp(self):
+        super().setUp()
+        os.environ["PYUNITY_INTERACTIVE"] = "0"
+        self.fps = config.fps
+        config.fps = 100
+
+    def tearDown(self):
+        config.fps = self.fps
+        super().tearDown()
+
+    def testRun(self):
+        scene = SceneManager.AddScene("Scene")
+        gameObject = GameObject("Counter")
+        counter = gameObject.AddComponent(Counter)
+        scene.Add(gameObject)
+
+        runner = NonInteractiveRunner()
+        runner.setScene(scene, clone=False)
+        runner.open()
+        runner.load(CooperativeEventLoopManager)
+        stats = runner.eventLoopManager.frameStats[WaitForUpdate]
+        try:
+            runner.eventLoopManager.start()
+        finally:
+            runner.quit()
+
+        assert counter.updates == 20
+        # 50 fixed updates per second vs 100 updates per second
+        assert 5 <= counter.fixedUpdates <= 15
+        assert counter.threads == {threading.get_ident()}
+        assert counter.waited == 1
+        assert stats.count == 19
+        # Frames are never shorter than 1 / fps, but may be longer on a busy machine
+        assert 0.009 < stats.mean < 0.05
+        assert EventLoopManager.current is None
@@ -0,0 +1,86 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, GameObject, GCPolicy, SceneManager,
+                     config)
+from pyunity.scenes.runner import NonInteractiveRunner
+from . import SceneTestCase, TestCase
+import gc
+
+class Garbage(Behaviour):
+    def Update(self, dt):
+        for _ in range(100):
+            a = []
+            a.append(a)
+
+class TestGCPolicy(TestCase):
+    def testStartStop(self):
+        threshold = gc.get_threshold()
+        policy = GCPolicy()
+        policy.Start()
+        try:
+            assert policy.running
+            assert gc.get_threshold()[2] > threshold[2]
+            assert gc.get_threshold()[:2] == threshold[:2]
+            assert policy.callback in gc.callbacks
+            if hasattr(gc, "get_freeze_count"):
+                assert gc.get_freeze_count() > 0
+        finally:
+            policy.Stop()
+        assert not policy.running
+        assert gc.get_threshold() == threshold
+        assert policy.callback not in gc.callbacks
+        if hasattr(gc, "get_freeze_count"):
+            assert gc.get_freeze_count() == 0
+
+    def testPauses(self):
+        policy = GCPolicy(freeze=False)
+        policy.Start()
+        try:
+            gc.collect(0)
+            policy.Idle(0)
+            assert policy.pauses.count == 1
+            assert policy.pauses.max > 0
+            assert policy.idlePauses.max == 0
+
+            for _ in range(gc.get_threshold()[0]):
+                a = []
+                a.append(a)
+            policy.Idle(1)
+            assert policy.pauses.count == 2
+            assert policy.idlePauses.max > 0
+            assert policy.collections[0] + policy.collections[1] >= 2
+        finally:
+            policy.Stop()
+
+    def testNotRunning(self):
+        policy = GCPolicy()
+        policy.Idle(1)
+        assert policy.pauses.count == 1
+        assert policy.totalPause == 0
+
+class TestGCPolicyRunner(SceneTestCase):
+    def testFastForward(self):
+        policy = GCPolicy()
+        threshold = gc.get_threshold()
+        scene = SceneManager.AddScene("Scene")
+        gameObject = GameObject("Garbage")
+        gameObject.AddComponent(Garbage)
+        scene.Add(gameObject)
+
+        config.gcPolicy = policy
+        try:
+            runner = NonInteractiveRunner()
+            runner.setScene(scene, clone=False)
+            runner.open()
+            runner.fastForward(ticks=10, dt=0.01)
+            assert runner.eventLoopManager.gcPolicy is policy
+            assert policy.running
+            runner.quit()
+        finally:
+            config.gcPolicy = None
+
+        assert not policy.running
+        assert policy.pauses.count == 10
+        assert gc.get_threshold() == threshold
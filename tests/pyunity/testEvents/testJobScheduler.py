@@ -0,0 +1,142 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, EventLoopManager, GameObject, JobScheduler,
+                     PyUnityException, ScheduleJob, SceneManager)
+from pyunity.scenes.runner import NonInteractiveRunner
+from . import SceneTestCase, TestCase
+import os
+
+class TestJobScheduler(TestCase):
+    def testPriority(self):
+        scheduler = JobScheduler(budget=1)
+        order = []
+        scheduler.Submit(order.append, 1)
+        scheduler.Submit(order.append, 2, priority=5)
+        scheduler.Submit(order.append, 3)
+        job = scheduler.Submit(lambda: 4)
+        scheduler.run()
+        assert order == [2, 1, 3]
+        assert job.done
+        assert job.result == 4
+        assert len(scheduler) == 0
+
+    def testBudget(self):
+        scheduler = JobScheduler(budget=0)
+        jobs = [scheduler.Submit(lambda: None) for _ in range(3)]
+        scheduler.run()
+        assert scheduler.ran == 1
+        assert scheduler.carried == 2
+        assert [job.done for job in jobs] == [True, False, False]
+
+    def testGenerator(self):
+        def work(n):
+            total = 0
+            for i in range(n):
+                total += i
+                yield
+            return total
+
+        scheduler = JobScheduler(budget=0)
+        job = scheduler.Submit(work, 3)
+        for _ in range(3):
+            scheduler.run()
+            assert not job.done
+        scheduler.run()
+        assert job.done
+        assert job.result == 3
+
+    def testCancel(self):
+        scheduler = JobScheduler(budget=1)
+        order = []
+        job = scheduler.Submit(order.append, 1)
+        job.Cancel()
+        scheduler.run()
+        assert order == []
+        assert job.cancelled
+
+    def testSlices(self):
+        scheduler = JobScheduler(budget=0)
+        jobs = [scheduler.Submit(lambda: None) for _ in range(4)]
+        scheduler.run(slices=3)
+        assert scheduler.ran == 3
+        assert [job.done for job in jobs] == [True, True, True, False]
+
+        scheduler = JobScheduler(budget=1000)
+        jobs = [scheduler.Submit(lambda: None) for _ in range(2)]
+        scheduler.run(slices=1)
+        assert scheduler.ran == 1
+        assert scheduler.carried == 1
+
+    def testCancelRunning(self):
+        closed = []
+        def work():
+            try:
+                # Cancelled from inside its own slice, as if
+                # from another thread while the slice runs
+                job.Cancel()
+                yield
+                yield
+            finally:
+                closed.append(True)
+
+        scheduler = JobScheduler(budget=1)
+        job = scheduler.Submit(work)
+        scheduler.run()
+        assert job.done
+        assert job.cancelled
+        assert closed == [True]
+        assert len(scheduler) == 0
+
+    def testClear(self):
+        closed = []
+        def work():
+            try:
+                while True:
+                    yield
+            finally:
+                closed.append(True)
+
+        scheduler = JobScheduler(budget=0)
+        job = scheduler.Submit(work)
+        scheduler.run()
+        scheduler.Clear()
+        assert job.cancelled
+        assert closed == [True]
+
+    def testNoManager(self):
+        with self.assertRaises(PyUnityException) as exc:
+            ScheduleJob(print)
+        assert exc.value == "No EventLoopManager running"
+
+class Planner(Behaviour):
+    async def Start(self):
+        self.result = None
+        self.result = await ScheduleJob(self.plan, 4)
+
+    def plan(self, n):
+        yield
+        return n * 2
+
+class TestJobsInScene(SceneTestCase):
+    def testAwait(self):
+        os.environ["PYUNITY_INTERACTIVE"] = "0"
+        scene = SceneManager.AddScene("Scene")
+        gameObject = GameObject("Planner")
+        planner = gameObject.AddComponent(Planner)
+        scene.Add(gameObject)
+
+        runner = NonInteractiveRunner()
+        runner.setScene(scene, clone=False)
+        runner.open()
+        try:
+            # Both slices of the job run after the first update,
+            # and the result is picked up in the second update
+            runner.fastForward(ticks=1, jobSlices=2)
+            assert planner.result is None
+            runner.fastForward(ticks=1, jobSlices=2)
+            assert planner.result == 8
+            assert len(EventLoopManager.current.jobs) == 0
+        finally:
+            runner.quit()
@@ -0,0 +1,40 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (EventLoop, EventLoopManager, PyUnityException,
+                     WaitForFixedUpdate, WaitForUpdate)
+from . import TestCase
+
+class TestStep(TestCase):
+    def setUp(self):
+        self.manager = EventLoopManager()
+        self.manager.begin(WaitForUpdate, WaitForFixedUpdate)
+        self.manager.mainLoop = EventLoop()
+
+    def tearDown(self):
+        loop = self.manager.mainLoop
+        self.manager.quit()
+        loop.close()
+
+    def testStep(self):
+        events = []
+
+        async def wait():
+            await WaitForUpdate()
+            events.append("resumed")
+
+        self.manager.mainLoop.create_task(wait())
+        self.manager.step(None)
+        self.manager.step(WaitForFixedUpdate)
+        assert events == []
+        self.manager.step(WaitForUpdate, lambda loop: events.append("update"))
+        assert events == ["update", "resumed"]
+        assert self.manager.waiting[WaitForUpdate] == []
+
+    def testRunning(self):
+        assert EventLoopManager.current is self.manager
+        assert self.manager.timers.singleThreaded
+        with self.assertRaises(PyUnityException) as exc:
+            EventLoopManager().begin()
+        assert exc.value == "Only one EventLoopManager can be running"
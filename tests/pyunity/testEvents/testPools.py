@@ -0,0 +1,65 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (EventLoop, EventLoopManager, RunInProcessPool,
+                     RunInThreadPool, SceneManager)
+from pyunity.scenes.runner import NonInteractiveRunner
+from . import SceneTestCase, TestCase
+import threading
+import os
+
+def square(x):
+    return x * x
+
+class TestPools(TestCase):
+    def tearDown(self):
+        EventLoopManager.shutdownPools()
+
+    def testThreadPool(self):
+        async def main():
+            thread = await RunInThreadPool(threading.get_ident)
+            result = await RunInThreadPool(pow, 2, exp=10)
+            return thread, result
+
+        loop = EventLoop()
+        try:
+            thread, result = loop.run_until_complete(main())
+        finally:
+            loop.close()
+        assert thread != threading.get_ident()
+        assert result == 1024
+
+    def testProcessPool(self):
+        async def main():
+            return await RunInProcessPool(square, 12)
+
+        loop = EventLoop()
+        try:
+            assert loop.run_until_complete(main()) == 144
+        finally:
+            loop.close()
+
+    def testShutdown(self):
+        pool = EventLoopManager.getThreadPool()
+        assert EventLoopManager.getThreadPool() is pool
+        # Managers quit on every scene change
+        manager = EventLoopManager()
+        manager.quit()
+        assert EventLoopManager.threadPool is pool
+        EventLoopManager.shutdownPools()
+        assert EventLoopManager.threadPool is None
+        assert EventLoopManager.getThreadPool() is not pool
+
+class TestPoolsInRunner(SceneTestCase):
+    def testQuit(self):
+        os.environ["PYUNITY_INTERACTIVE"] = "0"
+        scene = SceneManager.AddScene("Scene")
+        runner = NonInteractiveRunner()
+        runner.setScene(scene, clone=False)
+        runner.open()
+        runner.fastForward(ticks=1)
+        pool = EventLoopManager.getThreadPool()
+        runner.quit()
+        assert EventLoopManager.threadPool is None
+        assert pool._shutdown
@@ -0,0 +1,88 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, GameObject, SceneManager, TimerWheel,
+                     WaitForFrames, WaitForSeconds)
+from pyunity.scenes.runner import NonInteractiveRunner
+from . import SceneTestCase, TestCase, almostEqual
+import random
+import time
+import os
+
+class TestTimerWheel(TestCase):
+    def testExpiry(self):
+        wheel = TimerWheel(bits=2, levels=2)
+        random.seed(0)
+        delays = [random.randint(1, 40) for _ in range(200)]
+        for i, delay in enumerate(delays):
+            wheel.Schedule(delay, i)
+        assert len(wheel) == 200
+
+        for tick in range(1, 41):
+            expired = wheel.Advance(1)
+            assert sorted(expired) == [i for i, d in enumerate(delays) if d == tick]
+        assert len(wheel) == 0
+
+    def testLargeAdvance(self):
+        wheel = TimerWheel(bits=2, levels=2)
+        wheel.Schedule(5, "a")
+        wheel.Schedule(100, "b")
+        assert wheel.Advance(50) == ["a"]
+        assert wheel.Advance(49) == []
+        assert wheel.Advance(1) == ["b"]
+        # Skips ahead when empty
+        wheel.Advance(10 ** 9)
+        assert wheel.current == 10 ** 9 + 100
+
+class Waiter(Behaviour):
+    async def Start(self):
+        self.events = []
+        elapsed = await WaitForSeconds(0.5)
+        self.events.append(("seconds", round(elapsed, 6)))
+        elapsed = await WaitForFrames(3)
+        self.events.append(("frames", round(elapsed, 6)))
+
+class Timer(Behaviour):
+    async def Start(self):
+        self.elapsed = None
+        self.elapsed = await WaitForSeconds(2)
+
+class TestTimersInScene(SceneTestCase):
+    def makeRunner(self, component):
+        os.environ["PYUNITY_INTERACTIVE"] = "0"
+        scene = SceneManager.AddScene("Scene")
+        gameObject = GameObject("Waiter")
+        behaviour = gameObject.AddComponent(component)
+        scene.Add(gameObject)
+
+        runner = NonInteractiveRunner()
+        runner.setScene(scene, clone=False)
+        runner.open()
+        return runner, behaviour
+
+    def testGameTime(self):
+        runner, timer = self.makeRunner(Timer)
+        try:
+            start = time.perf_counter()
+            runner.fastForward(ticks=200, dt=0.01)
+            assert timer.elapsed is not None
+            # Game time is returned, not the wall clock time
+            assert almostEqual(timer.elapsed, 2)
+            assert time.perf_counter() - start < 2
+        finally:
+            runner.quit()
+
+    def testFastForward(self):
+        runner, waiter = self.makeRunner(Waiter)
+        try:
+            runner.fastForward(ticks=49, dt=0.01)
+            assert waiter.events == []
+            runner.fastForward(ticks=1, dt=0.01)
+            assert waiter.events == [("seconds", 0.5)]
+            runner.fastForward(ticks=2, dt=0.01)
+            assert len(waiter.events) == 1
+            runner.fastForward(ticks=1, dt=0.01)
+            assert waiter.events == [("seconds", 0.5), ("frames", 0.03)]
+        finally:
+            runner.quit()
@@ -0,0 +1,73 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (RGB, Behaviour, ClonePlan, GameObject, HideInInspector,
+                     Light, Material, Mesh, MeshRenderer, Prefab, SceneManager,
+                     ShowInInspector, Vector3)
+from . import SceneTestCase
+import copy
+
+class Follower(Behaviour):
+    target = ShowInInspector(GameObject)
+    others = HideInInspector(list, [])
+
+def makeRoot():
+    root = GameObject("Root")
+    child = GameObject("Child", root)
+    child.transform.localPosition = Vector3(1, 2, 3)
+    renderer = child.AddComponent(MeshRenderer)
+    renderer.mesh = Mesh.cube(1)
+    renderer.mat = Material(RGB(255, 0, 0))
+    light = root.AddComponent(Light)
+    light.color = RGB(0, 255, 0)
+    follower = root.AddComponent(Follower)
+    follower.target = child
+    follower.others = [child, renderer]
+    follower.enabled = False
+    return root
+
+class TestClonePlan(SceneTestCase):
+    def testExecute(self):
+        root = makeRoot()
+        plan = ClonePlan([x.gameObject for x in root.transform.GetDescendants()])
+        newRoot, newChild = plan.Execute()
+
+        assert newRoot is not root
+        assert newRoot.transform.children == [newChild.transform]
+        assert newChild.transform.parent is newRoot.transform
+        assert newChild.transform.localPosition == Vector3(1, 2, 3)
+        assert newRoot.scene is None
+        assert [type(x) for x in newRoot.components] == \
+            [type(x) for x in root.components]
+
+        follower = newRoot.GetComponent(Follower)
+        assert not follower.enabled
+        assert follower.target is newChild
+        assert follower.others == [newChild, newChild.GetComponent(MeshRenderer)]
+
+        renderer = newChild.GetComponent(MeshRenderer)
+        original = root.transform.children[0].gameObject.GetComponent(MeshRenderer)
+        assert renderer.mesh is original.mesh
+        assert renderer.mat is original.mat
+        assert renderer.transform is newChild.transform
+
+        light = newRoot.GetComponent(Light)
+        assert light.color == RGB(0, 255, 0)
+        assert light.color is not root.GetComponent(Light).color
+
+    def testMatchesDeepcopy(self):
+        prefab = Prefab(makeRoot())
+        scene = SceneManager.AddScene("Scene")
+        instance = prefab.Instantiate(scene)
+        deep = copy.deepcopy(prefab.gameObject)
+
+        a = list(instance.transform.GetDescendants())
+        b = list(deep.transform.GetDescendants())
+        assert len(a) == len(b)
+        for x, y in zip(a, b):
+            assert x.gameObject.name == y.gameObject.name
+            assert x.gameObject.scene is scene
+            assert x.localPosition == y.localPosition
+            assert [type(c) for c in x.gameObject.components] == \
+                [type(c) for c in y.gameObject.components]
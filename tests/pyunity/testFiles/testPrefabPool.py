@@ -0,0 +1,85 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (GameObject, Prefab, PrefabPool, PyUnityException,
+                     Rigidbody, SceneManager, Vector3)
+from . import SceneTestCase
+
+def makePrefab():
+    root = GameObject("Projectile")
+    child = GameObject("Trail", root)
+    child.transform.localPosition = Vector3(0, 1, 0)
+    root.AddComponent(Rigidbody)
+    return Prefab(root)
+
+class TestPrefabPool(SceneTestCase):
+    def testPrewarm(self):
+        scene = SceneManager.AddScene("Scene")
+        pool = PrefabPool(makePrefab(), capacity=3)
+        pool.Prewarm(5, scene)
+        assert pool.created == 3
+        assert pool.inactive == 3
+        assert len(scene.gameObjects) == 2 + 3 * 2
+        for gameObject in scene.gameObjects[2:]:
+            assert not gameObject.enabled
+
+    def testReuse(self):
+        scene = SceneManager.AddScene("Scene")
+        pool = PrefabPool(makePrefab())
+        root = pool.Acquire(scene, position=Vector3(5, 0, 0))
+        assert root.enabled
+        assert root.transform.position == Vector3(5, 0, 0)
+        assert pool.active == 1
+
+        root.GetComponent(Rigidbody).velocity = Vector3(1, 2, 3)
+        root.transform.children[0].localPosition = Vector3(4, 4, 4)
+        pool.Release(root)
+        assert not root.enabled
+        assert not root.transform.children[0].gameObject.enabled
+        assert pool.active == 0
+        assert pool.inactive == 1
+
+        root2 = pool.Acquire(scene)
+        assert root2 is root
+        assert root.enabled
+        assert root.GetComponent(Rigidbody).velocity == Vector3.zero()
+        assert root.transform.children[0].localPosition == Vector3(0, 1, 0)
+        assert pool.created == 1
+        assert pool.reused == 1
+        assert pool.released == 1
+
+    def testCapacity(self):
+        scene = SceneManager.AddScene("Scene")
+        pool = PrefabPool(makePrefab(), capacity=1)
+        a = pool.Acquire(scene)
+        b = pool.Acquire(scene)
+        pool.Release(a)
+        pool.Release(b)
+        assert pool.inactive == 1
+        assert pool.destroyed == 1
+        assert b.scene is None
+        assert a.scene is scene
+
+        pool.Clear()
+        assert pool.inactive == 0
+        assert a.scene is None
+
+    def testDestroyed(self):
+        scene = SceneManager.AddScene("Scene")
+        pool = PrefabPool(makePrefab())
+        a = pool.Acquire(scene)
+        pool.Release(a)
+        scene.Destroy(a)
+        b = pool.Acquire(scene)
+        assert b is not a
+        assert pool.created == 2
+
+    def testInvalidRelease(self):
+        scene = SceneManager.AddScene("Scene")
+        pool = PrefabPool(makePrefab())
+        gameObject = GameObject("Other")
+        scene.Add(gameObject)
+        with self.assertRaises(PyUnityException) as exc:
+            pool.Release(gameObject)
+        assert exc.value == "GameObject 'Other' was not acquired from this pool"
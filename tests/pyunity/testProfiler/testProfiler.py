@@ -0,0 +1,98 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, GameObject, Logger, Profiler, Rigidbody,
+                     SceneManager)
+from pyunity.scenes.runner import NonInteractiveRunner
+from . import SceneTestCase, TestCase
+import json
+import os
+
+class TestProfiler(TestCase):
+    def tearDown(self):
+        Profiler.Disable()
+        Profiler.Reset()
+
+    def testDisabled(self):
+        @Profiler.Profile("func")
+        def func():
+            return 1
+
+        assert func() == 1
+        with Profiler.Section("section"):
+            pass
+        assert Profiler.Summary() == {}
+
+    def testRecord(self):
+        Profiler.Enable()
+        Profiler.Record("a", "phase", 1, 1.5)
+        Profiler.Record("a", "phase", 2, 2.25)
+        Profiler.Record("b", "behaviour", 0, 0.1, task=True)
+
+        summary = Profiler.Summary()
+        assert list(summary) == ["a", "b"]
+        assert summary["a"]["count"] == 2
+        assert summary["a"]["total"] == 0.75
+        assert summary["a"]["max"] == 0.5
+        assert summary["b"]["tasks"] == 1
+        assert list(Profiler.Summary("behaviour")) == ["b"]
+
+        with Logger.TempRedirect(silent=True) as r:
+            Profiler.LogSummary(limit=1)
+        assert "a: 2 calls" in r.get()
+        assert "b:" not in r.get()
+
+    def testExport(self):
+        Profiler.Enable()
+        with Profiler.Section("section"):
+            pass
+        trace = Profiler.ExportTrace()
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert len(events) == 1
+        assert events[0]["name"] == "section"
+        assert events[0]["cat"] == "phase"
+        assert events[0]["dur"] >= 0
+        json.dumps(trace)
+
+class Spinner(Behaviour):
+    def Update(self, dt):
+        self.transform.localEulerAngles += 1
+
+    async def LateUpdate(self, dt):
+        pass
+
+class TestProfilerInScene(SceneTestCase):
+    def tearDown(self):
+        Profiler.Disable()
+        Profiler.Reset()
+        super().tearDown()
+
+    def testScene(self):
+        os.environ["PYUNITY_INTERACTIVE"] = "0"
+        scene = SceneManager.AddScene("Scene")
+        gameObject = GameObject("Spinner")
+        gameObject.AddComponent(Spinner)
+        gameObject.AddComponent(Rigidbody)
+        scene.Add(gameObject)
+
+        runner = NonInteractiveRunner()
+        runner.setScene(scene, clone=False)
+        runner.open()
+        Profiler.Enable()
+        try:
+            runner.fastForward(ticks=10, dt=0.02, fixedDt=0.02)
+        finally:
+            runner.quit()
+
+        summary = Profiler.Summary()
+        assert summary["updateScripts"]["count"] == 10
+        assert summary["updateFixed"]["count"] == 10
+        assert summary["CollManager.Step"]["count"] == 10
+        assert summary["Spinner.Update"]["count"] == 10
+        assert summary["Spinner.Update"]["tasks"] == 0
+        assert summary["Spinner.LateUpdate"]["tasks"] == 10
+
+        # Only Scene.Render itself is recorded under its name
+        scene.GetRenderers()
+        assert "Scene.Render" not in Profiler.Summary()
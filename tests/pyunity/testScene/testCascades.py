@@ -0,0 +1,111 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (GameObject, Light, LightType, Mesh, MeshRenderer,
+                     PyUnityException, SceneManager, Vector3)
+from pyunity import render
+from unittest.mock import Mock, patch
+from . import SceneTestCase
+import glm
+import copy
+
+class TestCascades(SceneTestCase):
+    def setUp(self):
+        super(TestCascades, self).setUp()
+        self.scene = SceneManager.AddScene("Scene")
+        self.renderers = []
+        for x in (0, 20):
+            gameObject = GameObject("Cube")
+            gameObject.transform.position = Vector3(x, 0, 0)
+            renderer = gameObject.AddComponent(MeshRenderer)
+            renderer.mesh = Mesh.cube(1)
+            self.scene.Add(gameObject)
+            self.renderers.append(renderer)
+        self.camera = self.scene.mainCamera
+        self.camera.shadows = True
+        self.lights = self.scene.FindComponents(Light)
+
+        self.gl = Mock()
+        self.gl.glGetIntegerv.return_value = [0, 0, 800, 500]
+        self.patches = [patch.object(render, "gl", self.gl),
+                        patch.object(render.cascadeBuffer, "Update"),
+                        patch.object(self.camera, "SetupDepthShader"),
+                        patch.object(self.camera, "DrawDepth")]
+        for item in self.patches:
+            item.start()
+
+    def tearDown(self):
+        for item in self.patches:
+            item.stop()
+        super(TestCascades, self).tearDown()
+
+    def render(self):
+        self.camera.SetupDepthShader.reset_mock()
+        self.camera.renderPass = True
+        self.camera.RenderDepth(self.scene.GetRenderers(), self.lights)
+        self.camera.renderPass = False
+        return [call.args[1] for call in self.camera.SetupDepthShader.call_args_list]
+
+    def testSplits(self):
+        cascades = self.camera.SetCascades(3, distance=50, sizes=[2048, 1024, 512])
+        assert len(cascades) == 3
+        assert cascades[0].near == self.camera.near
+        assert cascades[-1].far == 50
+        for a, b in zip(cascades, cascades[1:]):
+            assert a.near < a.far == b.near
+            assert a.far - a.near < b.far - b.near
+        assert [cascade.size for cascade in cascades] == [2048, 1024, 512]
+
+        with self.assertRaises(PyUnityException) as exc:
+            self.camera.SetCascades(5)
+        assert exc.value == "Number of cascades must be between 1 and 4"
+        with self.assertRaises(PyUnityException) as exc:
+            self.camera.SetCascades(2, intervals=[1])
+        assert exc.value == "Expected a size and an interval for each of the 2 cascades"
+
+    def testMatrix(self):
+        self.camera.transform.position = Vector3(3, 4, -10)
+        self.camera.transform.LookAtPoint(Vector3(0, 0, 5))
+        near, far = 5, 15
+        matrix = self.camera.getCascadeMatrix(self.lights[0], near, far, 1024)
+        inverse = glm.inverse(self.camera.getProjMat() * self.camera.getViewMat())
+        for x in (-1, 1):
+            for y in (-1, 1):
+                start = inverse * glm.vec4(x, y, -1, 1)
+                end = inverse * glm.vec4(x, y, 1, 1)
+                start = glm.vec3(start) / start.w
+                end = glm.vec3(end) / end.w
+                for distance in (near, far):
+                    t = (distance - self.camera.near) / (self.camera.far - self.camera.near)
+                    corner = matrix * glm.vec4(start + (end - start) * t, 1)
+                    assert all(-1 <= value <= 1 for value in glm.vec3(corner))
+
+    def testRender(self):
+        self.camera.SetCascades(2, intervals=[1, 2])
+        assert self.camera.getCascadeLight(self.lights) == 0
+        assert self.render() == [0, 1]
+        # The regular shadow map of the light is not drawn
+        assert all(call.args[0] == 0 for call in self.camera.SetupDepthShader.call_args_list)
+
+        # The second cascade follows the camera a frame later
+        self.camera.transform.position = Vector3(1, 0, -10)
+        assert self.render() == [0]
+        assert self.render() == [1]
+        assert self.render() == []
+
+        self.lights[0].type = LightType.Point
+        assert self.camera.getCascadeLight(self.lights) == -1
+        self.camera.shadows = False
+        self.lights[0].type = LightType.Directional
+        assert self.camera.getCascadeLight(self.lights) == -1
+
+    def testClone(self):
+        self.camera.SetCascades(2)
+        self.render()
+        cascade = self.camera.cascades[0]
+        assert cascade.matrix is not None
+        clone = copy.deepcopy(cascade)
+        assert clone.matrix is None
+        assert clone.shadowCache.key is None
+        assert (clone.near, clone.far, clone.size) == (cascade.near, cascade.far, cascade.size)
@@ -0,0 +1,116 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (GameObject, LODGroup, Mesh, MeshRenderer, PyUnityException,
+                     SceneManager, SimplifyMesh, Vector3)
+from pyunity import render
+from unittest.mock import Mock, patch
+from . import SceneTestCase
+
+class TestSimplifyMesh(SceneTestCase):
+    def testSphere(self):
+        mesh = Mesh.sphere(1, detail=16)
+        simplified = SimplifyMesh(mesh, 0.25)
+        assert len(simplified.triangles) <= len(mesh.triangles) // 4
+        assert len(simplified.verts) < len(mesh.verts)
+        assert len(simplified.normals) == len(simplified.verts)
+        assert len(simplified.texcoords) == len(simplified.verts)
+        assert max(max(triangle) for triangle in simplified.triangles) == len(simplified.verts) - 1
+        for vert, normal in zip(simplified.verts, simplified.normals):
+            assert 0.95 < vert.length <= 1.0001
+            assert vert.normalized().dot(normal) > 0.9
+
+    def testCube(self):
+        mesh = Mesh.cube(2)
+        simplified = SimplifyMesh(mesh, 0.1)
+        # Each face of the cube is separate and is never removed
+        assert len(simplified.triangles) == 6
+        assert simplified.min == mesh.min
+        assert simplified.max == mesh.max
+
+    def testRatio(self):
+        mesh = Mesh.cube(2)
+        assert len(SimplifyMesh(mesh, 1).triangles) == len(mesh.triangles)
+        with self.assertRaises(PyUnityException) as exc:
+            SimplifyMesh(mesh, 0)
+        assert exc.value == "Ratio must be between 0 and 1"
+
+class TestLODGroup(SceneTestCase):
+    def makeObject(self):
+        scene = SceneManager.AddScene("Scene")
+        gameObject = GameObject("Sphere")
+        renderer = gameObject.AddComponent(MeshRenderer)
+        renderer.mesh = Mesh.sphere(1, detail=8)
+        lodGroup = gameObject.AddComponent(LODGroup)
+        scene.Add(gameObject)
+        return scene, renderer, lodGroup
+
+    def testGenerate(self):
+        _, renderer, lodGroup = self.makeObject()
+        levels = lodGroup.Generate(renderer.mesh, [0.5, 0.2, 0.05])
+        assert lodGroup.levels == levels
+        assert levels[0].mesh is renderer.mesh
+        counts = [len(level.mesh.triangles) for level in levels]
+        assert counts[0] > counts[1] > counts[2]
+
+        with self.assertRaises(PyUnityException) as exc:
+            lodGroup.AddLevel(renderer.mesh, 0.1)
+        assert exc.value == "Screen size must be smaller than that of the previous level"
+
+    def testSelect(self):
+        _, renderer, lodGroup = self.makeObject()
+        lodGroup.AddLevel(renderer.mesh, 0.5)
+        lodGroup.AddLevel(renderer.mesh, 0.2)
+        lodGroup.hysteresis = 0
+        assert lodGroup.Select(0.6) == 0
+        assert lodGroup.Select(0.3) == 1
+        assert lodGroup.Select(0.1) == 2
+        assert lodGroup.Select(1) == 0
+
+        lodGroup.hysteresis = 0.1
+        assert lodGroup.Select(0.48) == 0
+        assert lodGroup.Select(0.44) == 1
+        assert lodGroup.Select(0.52) == 1
+        assert lodGroup.Select(0.56) == 0
+
+    def testCamera(self):
+        scene, renderer, lodGroup = self.makeObject()
+        high = renderer.mesh
+        low = Mesh.sphere(1, detail=4)
+        lodGroup.AddLevel(high, 0.3)
+        lodGroup.AddLevel(low, 0.1)
+        camera = scene.mainCamera
+        camera.transform.position = Vector3(0, 0, -15)
+        camera.transform.LookAtPoint(Vector3.zero())
+
+        size = camera.getScreenSize(renderer)
+        assert 0.1 < size < 0.3
+        assert camera.SelectLODs([renderer]) == [renderer]
+        assert camera.getMesh(renderer) is low
+        # The saved mesh is left alone
+        assert renderer.mesh is high
+        with patch.object(render, "gl", Mock()):
+            with patch.object(render.Shader, "getLocation", return_value=0):
+                camera.Draw([renderer])
+        assert camera.renderQueue.mesh is low
+
+        camera.transform.position = Vector3(0, 0, -2)
+        assert camera.SelectLODs([renderer]) == [renderer]
+        assert camera.getMesh(renderer) is high
+
+        camera.transform.position = Vector3(0, 0, -100)
+        assert camera.SelectLODs([renderer]) == []
+        assert lodGroup.current == 2
+        assert camera.lodMeshes == {}
+
+        camera.transform.position = Vector3.zero()
+        assert camera.getScreenSize(renderer) == float("inf")
+
+    def testClone(self):
+        scene, renderer, lodGroup = self.makeObject()
+        lodGroup.AddLevel(renderer.mesh, 0.3)
+        clone = scene.Clone()
+        copy = clone.FindGameObjectsByName("Sphere")[0].GetComponent(LODGroup)
+        assert copy.levels is not lodGroup.levels
+        assert copy.levels[0].mesh is renderer.mesh
@@ -0,0 +1,151 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (GameObject, Mesh, MeshRenderer, SceneManager,
+                     StaticBatch, Vector3)
+from pyunity.render import Camera, Frustum
+from pyunity.spatial import Octree
+from . import SceneTestCase
+import random
+
+class TestOctree(SceneTestCase):
+    def makeScene(self, count=200):
+        scene = SceneManager.AddScene("Scene")
+        random.seed(5)
+        cube = Mesh.cube(1)
+        renderers = []
+        for _ in range(count):
+            gameObject = GameObject("Cube")
+            gameObject.transform.position = Vector3(
+                *(random.uniform(-100, 100) for _ in range(3)))
+            renderer = gameObject.AddComponent(MeshRenderer)
+            renderer.mesh = cube
+            scene.Add(gameObject)
+            renderers.append(renderer)
+        return scene, renderers
+
+    def testQueryFrustum(self):
+        scene, renderers = self.makeScene()
+        camera = scene.mainCamera
+        matrix = camera.getProjMat() * camera.getViewMat()
+        expected = camera.Cull(renderers, matrix)
+        assert scene.Cull(Frustum(matrix)) == expected
+
+        octree = scene.EnableOctree(halfSize=128)
+        assert len(octree) == len(renderers)
+        assert set(scene.GetRenderers()) == set(renderers)
+        visible = camera.Cull(scene.GetRenderers(), matrix)
+        assert 0 < len(visible) < len(renderers)
+        assert set(visible) == set(expected)
+        assert scene.Cull(Frustum(matrix)) == visible
+        assert octree.QueryFrustum(Frustum(matrix)) == visible
+
+    def testMove(self):
+        scene, renderers = self.makeScene()
+        octree = scene.EnableOctree(halfSize=128)
+        renderer = renderers[0]
+        renderer.transform.position = Vector3(50, 50, 50)
+        assert renderer.transform in octree.dirty
+        octree.Update()
+        assert not octree.dirty
+        assert octree.nodes[renderer].Contains(50, 50, -50)
+        assert renderer in octree.QuerySphere(Vector3(50, 50, 50), 1)
+
+        renderer.transform.position = Vector3(500, 0, 0)
+        octree.Update()
+        assert octree.nodes[renderer] is octree.root
+        assert renderer in octree.QuerySphere(Vector3(500, 0, 0), 1)
+        assert octree.root.count == len(renderers)
+
+    def testSync(self):
+        scene, renderers = self.makeScene(count=10)
+        octree = scene.EnableOctree()
+        gameObject = GameObject("Empty")
+        scene.Add(gameObject)
+        renderer = gameObject.AddComponent(MeshRenderer)
+        assert renderer in octree.unplaced
+        renderer.mesh = Mesh.cube(2)
+        octree.Update()
+        assert renderer in octree.nodes
+        assert len(octree) == 11
+
+        gameObject.RemoveComponent(MeshRenderer)
+        assert renderer not in octree
+        scene.Destroy(renderers[0].gameObject)
+        assert renderers[0] not in octree
+        assert len(octree) == 9
+        assert octree.root.count == 9
+
+    def testMeshChanged(self):
+        scene, renderers = self.makeScene(count=10)
+        octree = scene.EnableOctree(halfSize=128)
+        camera = scene.mainCamera
+        matrix = camera.getProjMat() * camera.getViewMat()
+        renderer = renderers[0]
+        renderer.transform.position = Vector3(0, 0, 10)
+        octree.Update()
+
+        renderer.mesh = None
+        assert renderer not in octree.QueryFrustum(Frustum(matrix))
+        assert renderer not in octree.QuerySphere(Vector3(0, 0, 10), 1)
+        assert octree.Raycast(Vector3(0, 0, 5), Vector3.forward(), maxDistance=10) == []
+        assert renderer not in camera.Cull(scene.GetRenderers(), matrix)
+        assert renderer in octree.unplaced
+        camera.culling = False
+        assert renderer not in camera.Cull(scene.GetRenderers(), matrix)
+
+        renderer.mesh = Mesh.cube(1)
+        octree.Update()
+        small = octree.nodes[renderer]
+        renderer.mesh = Mesh.cube(100)
+        # Only the renderer that changed is looked at
+        assert octree.dirty == {renderer.transform}
+        octree.Update()
+        assert octree.nodes[renderer] is not small
+        assert octree.nodes[renderer].halfSize >= Camera.getBounds(renderer)[3]
+
+    def testStaticBatch(self):
+        scene, renderers = self.makeScene(count=10)
+        root = GameObject("Level")
+        scene.Add(root)
+        for renderer in renderers[:5]:
+            renderer.transform.ReparentTo(root.transform)
+        octree = scene.EnableOctree()
+        batch, = StaticBatch.Combine(root)
+        assert len(octree) == 6
+        assert batch.renderer in octree
+        assert renderers[0] not in octree
+        batch.Remove()
+        assert len(octree) == 10
+        assert batch.renderer not in octree
+
+    def testRaycast(self):
+        scene = SceneManager.AddScene("Scene")
+        renderers = []
+        for x in (5, 10, 15):
+            gameObject = GameObject("Cube")
+            gameObject.transform.position = Vector3(x, 0, 0)
+            renderer = gameObject.AddComponent(MeshRenderer)
+            renderer.mesh = Mesh.cube(2)
+            scene.Add(gameObject)
+            renderers.append(renderer)
+        octree = scene.EnableOctree(halfSize=64)
+
+        hits = octree.Raycast(Vector3.zero(), Vector3.right())
+        assert [hit[1] for hit in hits] == renderers
+        assert hits[0][0] < 5
+        assert octree.Raycast(Vector3.zero(), Vector3.right(), maxDistance=9) == hits[:2]
+        assert octree.Raycast(Vector3.zero(), Vector3.left()) == []
+        assert octree.Raycast(Vector3(0, 5, 0), Vector3.right()) == []
+
+    def testStandalone(self):
+        octree = Octree(halfSize=16, maxDepth=2)
+        gameObject = GameObject("Cube")
+        renderer = gameObject.AddComponent(MeshRenderer)
+        renderer.mesh = Mesh.cube(0.1)
+        octree.Add(renderer)
+        assert octree.nodes[renderer].depth == 2
+        octree.Remove(renderer)
+        assert len(octree) == 0
+        assert octree.root.children == [None] * 8
@@ -0,0 +1,144 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (RGB, GameObject, Material, Mesh, MeshRenderer,
+                     SceneManager, Vector3)
+from pyunity import render
+from unittest.mock import Mock, patch
+from . import SceneTestCase
+
+class RenderTestCase(SceneTestCase):
+    def setUp(self):
+        super(RenderTestCase, self).setUp()
+        self.scene = SceneManager.AddScene("Scene")
+        self.camera = self.scene.mainCamera
+        self.gl = Mock()
+        self.patch = patch.object(render, "gl", self.gl)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        super(RenderTestCase, self).tearDown()
+
+    def makeRenderer(self, mesh, mat, z=0):
+        gameObject = GameObject("Renderer")
+        gameObject.transform.position = Vector3(0, 0, z)
+        renderer = gameObject.AddComponent(MeshRenderer)
+        renderer.mesh = mesh
+        renderer.mat = mat
+        self.scene.Add(gameObject)
+        return renderer
+
+class TestInstancing(RenderTestCase):
+    def testGroups(self):
+        cube = Mesh.cube(1)
+        red = Material(RGB(255, 0, 0))
+        blue = Material(RGB(0, 0, 255))
+        reds = [self.makeRenderer(cube, red, z) for z in range(3)]
+        blues = [self.makeRenderer(cube, blue, z) for z in range(2)]
+        quad = self.makeRenderer(Mesh.quad(1), red)
+        renderers = reds + blues + [quad]
+        shader = self.camera.shader
+
+        self.camera.minInstances = 2
+        single, instanced = self.camera.GroupInstances(renderers, shader)
+        assert single == [quad]
+        assert instanced == [reds, blues]
+
+        self.camera.minInstances = 3
+        single, instanced = self.camera.GroupInstances(renderers, shader)
+        assert single == blues + [quad]
+        assert instanced == [reds]
+
+        # Depth passes ignore the material
+        single, instanced = self.camera.GroupInstances(
+            renderers, self.camera.depthShader, material=False)
+        assert single == [quad]
+        assert instanced == [reds + blues]
+
+        self.camera.instancing = False
+        single, instanced = self.camera.GroupInstances(renderers, shader)
+        assert single == renderers
+        assert instanced == []
+
+    def testTransparent(self):
+        cube = Mesh.cube(1)
+        glass = Material(RGB(255, 255, 255), Mock(transparent=True))
+        renderers = [self.makeRenderer(cube, glass, z) for z in range(3)]
+        single, instanced = self.camera.GroupInstances(renderers, self.camera.shader)
+        assert single == renderers
+        assert instanced == []
+
+    def testDraw(self):
+        cube = Mesh.cube(1)
+        red = Material(RGB(255, 0, 0))
+        renderers = [self.makeRenderer(cube, red, z) for z in range(4)]
+        renderers.append(self.makeRenderer(Mesh.quad(1), red))
+        queue = self.camera.renderQueue
+        queue.resetCounters()
+        with patch.object(render.Shader, "getLocation", return_value=0):
+            self.camera.Draw(renderers)
+        # One instanced draw for the cubes, one draw for the quad
+        assert queue.drawCalls == 2
+        assert queue.shaderChanges == 2
+
+class TestRenderQueue(RenderTestCase):
+    def setUp(self):
+        super(TestRenderQueue, self).setUp()
+        self.camera.instancing = False
+        self.camera.transform.position = Vector3(0, 0, -10)
+
+    def testOpaque(self):
+        cube = Mesh.cube(1)
+        quad = Mesh.quad(1)
+        bricks = Material(RGB(255, 255, 255), Mock(transparent=False))
+        renderers = [self.makeRenderer(mesh, bricks, z)
+                     for mesh, z in [(cube, 5), (quad, 1), (cube, -5), (quad, 3), (cube, 0)]]
+        draws = self.camera.QueueDraws(renderers, self.camera.shader)
+        order = [draw[2][0] for draw in draws]
+        meshes = [renderer.mesh for renderer in order]
+        # Each mesh is bound once, and drawn front to back
+        assert meshes in ([cube] * 3 + [quad] * 2, [quad] * 2 + [cube] * 3)
+        cubes = [renderer.transform.position.z for renderer in order if renderer.mesh is cube]
+        quads = [renderer.transform.position.z for renderer in order if renderer.mesh is quad]
+        assert cubes == [-5, 0, 5]
+        assert quads == [1, 3]
+
+    def testTransparent(self):
+        cube = Mesh.cube(1)
+        solid = Material(RGB(255, 255, 255))
+        glass = Material(RGB(255, 255, 255), Mock(transparent=True))
+        renderers = [self.makeRenderer(cube, glass, z) for z in (0, 5, -5)]
+        renderers.append(self.makeRenderer(cube, solid, 10))
+        draws = self.camera.QueueDraws(renderers, self.camera.shader)
+        order = [draw[2][0].transform.position.z for draw in draws]
+        # Opaque first, then transparent from back to front
+        assert order == [10, 5, 0, -5]
+
+    def testCounters(self):
+        queue = render.RenderQueue()
+        shader = Mock()
+        texture = Mock()
+        mesh = Mesh.cube(1)
+        queue.Begin(self.camera.transform.position)
+        assert queue.UseShader(shader)
+        assert not queue.UseShader(shader)
+        queue.UseTexture(texture)
+        queue.UseTexture(texture)
+        queue.UseTexture(None)
+        queue.DrawMesh(mesh)
+        queue.DrawMesh(mesh)
+        assert shader.use.call_count == 1
+        assert queue.drawCalls == 2
+        assert (queue.shaderChanges, queue.textureChanges, queue.meshChanges) == (1, 1, 1)
+        assert queue.stateChanges == 3
+
+        # The bound state is forgotten at the start of a pass
+        queue.Begin(self.camera.transform.position)
+        assert queue.UseShader(shader)
+        queue.DrawMesh(mesh)
+        assert queue.stateChanges == 5
+
+        queue.resetCounters()
+        assert queue.drawCalls == queue.stateChanges == 0
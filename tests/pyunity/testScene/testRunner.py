@@ -0,0 +1,86 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, GameObject, PyUnityException, SceneManager,
+                     WaitForUpdate)
+from pyunity.scenes.runner import NonInteractiveRunner
+from . import SceneTestCase, almostEqual
+import os
+
+class Counter(Behaviour):
+    def Start(self):
+        self.updates = 0
+        self.fixedUpdates = 0
+        self.time = 0
+        self.waited = 0
+
+    def Update(self, dt):
+        self.updates += 1
+        self.time += dt
+
+    def FixedUpdate(self, dt):
+        self.fixedUpdates += 1
+
+    async def Wait(self):
+        while True:
+            await WaitForUpdate()
+            self.waited += 1
+
+class TestFastForward(SceneTestCase):
+    def setUp(self):
+        super().setUp()
+        os.environ["PYUNITY_INTERACTIVE"] = "0"
+
+    def makeRunner(self):
+        scene = SceneManager.AddScene("Scene")
+        gameObject = GameObject("Counter")
+        counter = gameObject.AddComponent(Counter)
+        scene.Add(gameObject)
+
+        runner = NonInteractiveRunner()
+        runner.setScene(scene, clone=False)
+        runner.open()
+        return runner, counter
+
+    def testTicks(self):
+        runner, counter = self.makeRunner()
+        try:
+            assert runner.fastForward(ticks=100, dt=0.01, fixedDt=0.02) == 100
+            assert counter.updates == 100
+            assert counter.fixedUpdates == 50
+            assert almostEqual(counter.time, 1)
+
+            runner.fastForward(ticks=10, dt=0.01, fixedDt=0.02)
+            assert counter.updates == 110
+            assert counter.fixedUpdates == 55
+        finally:
+            runner.quit()
+
+    def testUntil(self):
+        runner, counter = self.makeRunner()
+        try:
+            ticks = runner.fastForward(
+                until=lambda scene: counter.updates >= 25, dt=0.02)
+            assert ticks == 25
+        finally:
+            runner.quit()
+
+    def testCoroutines(self):
+        runner, counter = self.makeRunner()
+        try:
+            runner.fastForward(ticks=1)
+            runner.loop.create_task(counter.Wait())
+            runner.fastForward(ticks=5)
+            assert counter.waited == 5
+        finally:
+            runner.quit()
+
+    def testInvalid(self):
+        runner = NonInteractiveRunner()
+        with self.assertRaises(PyUnityException) as exc:
+            runner.fastForward()
+        assert exc.value == "Either ticks or until must be provided"
+        with self.assertRaises(PyUnityException) as exc:
+            runner.fastForward(ticks=1)
+        assert exc.value == "Cannot fast-forward before opening runner"
@@ -162,6 +162,32 @@ class TestScene(SceneTestCase):
         assert r.get() == "\n".join([
             "/A", "/A/B", "/A/C", "/A/C/B", "/Light", "/Main Camera\n"])
 
+    def testClone(self):
+        scene = SceneManager.AddScene("Scene")
+        a = GameObject("A")
+        b = GameObject("B", a)
+        renderer = b.AddComponent(MeshRenderer)
+        renderer.mesh = Mesh.cube(2)
+        renderer.custom = [a]
+        scene.AddMultiple(a, b)
+
+        clone = scene.Clone()
+        assert clone is not scene
+        assert clone.name == "Scene"
+        assert len(clone.gameObjects) == 4
+        for original, copied in zip(scene.gameObjects, clone.gameObjects):
+            assert copied is not original
+            assert copied.name == original.name
+            assert copied.scene is clone
+        assert clone.mainCamera is clone.gameObjects[0].GetComponent(Camera)
+
+        newA, newB = clone.gameObjects[2:]
+        assert newB.transform.parent is newA.transform
+        assert newA.transform.children == [newB.transform]
+        newRenderer = newB.GetComponent(MeshRenderer)
+        assert newRenderer.mesh is renderer.mesh
+        assert newRenderer.custom == [newA]
+
     def testInsideFrustum(self):
         scene = SceneManager.AddScene("Scene")
         gameObject = GameObject("Cube")
@@ -171,7 +197,32 @@ class TestScene(SceneTestCase):
         assert not scene.insideFrustum(renderer)
 
         renderer.mesh = Mesh.cube(2)
-        # assert scene.insideFrustum(renderer))
+        assert scene.insideFrustum(renderer)
 
         gameObject.transform.position = Vector3(0, 0, -5)
-        # assert not scene.insideFrustum(renderer)
+        assert not scene.insideFrustum(renderer)
+
+    def testCull(self):
+        scene = SceneManager.AddScene("Scene")
+        renderers = []
+        for z in range(-40, 40):
+            gameObject = GameObject("Cube")
+            gameObject.transform.position = Vector3(0, 0, z * 5)
+            renderer = gameObject.AddComponent(MeshRenderer)
+            renderer.mesh = Mesh.cube(2)
+            scene.Add(gameObject)
+            renderers.append(renderer)
+
+        camera = scene.mainCamera
+        matrix = camera.getProjMat() * camera.getViewMat()
+        visible = camera.Cull(renderers, matrix)
+        assert [r.transform.position.z for r in visible] == [z * 5 for z in range(0, 40)]
+        assert visible == [r for r in renderers if scene.insideFrustum(r)]
+
+        bounds = renderers[0].worldBounds
+        assert camera.getBounds(renderers[0]) is bounds
+        renderers[0].transform.position = Vector3(0, 0, 10)
+        assert camera.getBounds(renderers[0]) is not bounds
+
+        camera.culling = False
+        assert camera.Cull(renderers, matrix) == renderers
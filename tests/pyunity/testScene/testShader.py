@@ -0,0 +1,135 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import SceneManager, Vector3
+from pyunity import render
+from unittest.mock import Mock, patch
+from . import SceneTestCase
+import glm
+
+class TestShader(SceneTestCase):
+    def setUp(self):
+        super(TestShader, self).setUp()
+        self.gl = Mock()
+        self.patch = patch.object(render, "gl", self.gl)
+        self.patch.start()
+        self.shader = render.Shader("", "", "Test")
+        self.shader.program = 1
+
+    def tearDown(self):
+        self.patch.stop()
+        render.shaders.pop("Test", None)
+        super(TestShader, self).tearDown()
+
+    def testChanged(self):
+        shader = self.shader
+        shader.setInt(b"textured", 1)
+        shader.setInt(b"textured", 1)
+        shader.setInt(b"textured", 0)
+        assert self.gl.glUniform1i.call_count == 2
+        assert shader.issued == 2
+        assert shader.skipped == 1
+        assert shader.uniforms["textured"] == 0
+
+        shader.setVec3(b"objectColor", Vector3(1, 0, 0))
+        shader.setVec3(b"objectColor", Vector3(1, 0, 0))
+        shader.setMat4(b"model", glm.mat4(1))
+        shader.setMat4(b"model", glm.mat4(2))
+        assert self.gl.glUniform3f.call_count == 1
+        assert self.gl.glUniformMatrix4fv.call_count == 2
+        assert (shader.issued, shader.skipped) == (5, 2)
+
+        shader.resetCounters()
+        assert (shader.issued, shader.skipped) == (0, 0)
+
+    def testLocations(self):
+        shader = self.shader
+        self.gl.glGetUniformLocation.return_value = 7
+        shader.setFloat(b"value", 0.5)
+        shader.setFloat(b"value", 0.25)
+        # Unknown names are only looked up once
+        assert self.gl.glGetUniformLocation.call_count == 1
+        self.gl.glUniform1f.assert_called_with(7, 0.25)
+
+    def testReflect(self):
+        shader = self.shader
+        shader.setInt(b"textured", 1)
+        self.gl.glGetProgramiv.return_value = 2
+        self.gl.glGetActiveUniform.side_effect = [
+            (b"textured", 1, None), (b"shadowMaps[0]", 3, None)]
+        self.gl.glGetUniformLocation.side_effect = lambda program, name: {
+            b"textured": 0, b"shadowMaps[0]": 1,
+            b"shadowMaps[1]": 2, b"shadowMaps[2]": 3}[name]
+        shader.reflect()
+        assert shader.locations == {
+            b"textured": 0, b"shadowMaps": 1, b"shadowMaps[0]": 1,
+            b"shadowMaps[1]": 2, b"shadowMaps[2]": 3}
+
+        # Values are forgotten, since the program may be new
+        shader.setInt(b"textured", 1)
+        assert self.gl.glUniform1i.call_count == 2
+        self.gl.glUniform1i.assert_called_with(0, 1)
+
+class TestUniformBuffer(SceneTestCase):
+    def setUp(self):
+        super(TestUniformBuffer, self).setUp()
+        self.gl = Mock()
+        self.patch = patch.object(render, "gl", self.gl)
+        self.patch.start()
+        self.buffer = render.UniformBuffer(b"Test", 5, 16)
+
+    def tearDown(self):
+        self.patch.stop()
+        render.uniformBuffers.pop(b"Test", None)
+        super(TestUniformBuffer, self).tearDown()
+
+    def testUpdate(self):
+        buffer = self.buffer
+        assert buffer.Update(bytes(16))
+        assert not buffer.Update(bytes(16))
+        assert buffer.Update(bytes(8) + b"\1" * 8)
+        assert buffer.uploads == 2
+        assert self.gl.glGenBuffers.call_count == 1
+        assert self.gl.glBufferSubData.call_count == 2
+        self.gl.glBindBufferBase.assert_called_once_with(
+            self.gl.GL_UNIFORM_BUFFER, 5, buffer.buffer)
+
+        # A new context needs the data uploaded again
+        buffer.reset()
+        assert buffer.Update(bytes(8) + b"\1" * 8)
+        assert self.gl.glGenBuffers.call_count == 2
+
+    def testBlockBinding(self):
+        shader = render.Shader("", "", "Test")
+        shader.program = 1
+        self.gl.glGetProgramiv.return_value = 0
+        try:
+            shader.reflect()
+        finally:
+            render.shaders.pop("Test", None)
+        self.gl.glGetUniformBlockIndex.assert_any_call(1, b"Test")
+        self.gl.glUniformBlockBinding.assert_any_call(
+            1, self.gl.glGetUniformBlockIndex.return_value, 5)
+
+class TestSkybox(SceneTestCase):
+    def setUp(self):
+        super(TestSkybox, self).setUp()
+        self.patches = [patch.object(render, "gl", Mock()),
+                        patch.object(render.Shader, "getLocation", return_value=0)]
+        for item in self.patches:
+            item.start()
+        self.camera = SceneManager.AddScene("Scene").mainCamera
+
+    def tearDown(self):
+        for item in self.patches:
+            item.stop()
+        super(TestSkybox, self).tearDown()
+
+    def testProjection(self):
+        camera = self.camera
+        camera.ortho = True
+        camera.RenderSkybox()
+        # The skybox keeps a perspective projection
+        assert camera.skyboxShader.uniforms["skyProj"] == camera.projMat
+        assert camera.getProjMat() != camera.projMat
@@ -0,0 +1,78 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (GameObject, Light, Mesh, MeshRenderer, SceneManager,
+                     StaticBatch, Vector3)
+from pyunity import render
+from unittest.mock import Mock, patch
+from . import SceneTestCase
+import copy
+
+class TestShadowCache(SceneTestCase):
+    def setUp(self):
+        super(TestShadowCache, self).setUp()
+        self.scene = SceneManager.AddScene("Scene")
+        self.renderers = []
+        for name in ["Cube", "Floor"]:
+            gameObject = GameObject(name)
+            renderer = gameObject.AddComponent(MeshRenderer)
+            renderer.mesh = Mesh.cube(1)
+            self.scene.Add(gameObject)
+            self.renderers.append(renderer)
+        self.camera = self.scene.mainCamera
+        self.camera.shadows = True
+        self.lights = self.scene.FindComponents(Light)
+
+        self.gl = Mock()
+        self.gl.glGetIntegerv.return_value = [0, 0, 800, 500]
+        self.patches = [patch.object(render, "gl", self.gl),
+                        patch.object(self.camera, "SetupDepthShader"),
+                        patch.object(self.camera, "DrawDepth")]
+        for item in self.patches:
+            item.start()
+
+    def tearDown(self):
+        for item in self.patches:
+            item.stop()
+        super(TestShadowCache, self).tearDown()
+
+    def render(self):
+        self.camera.DrawDepth.reset_mock()
+        self.camera.RenderDepth(self.scene.GetRenderers(), self.lights)
+        return [call.args[0] for call in self.camera.DrawDepth.call_args_list]
+
+    def testCached(self):
+        assert self.render() == [self.renderers]
+        assert self.camera.shadowsCached == 0
+        assert self.render() == []
+        assert self.camera.shadowsCached == 1
+
+        self.renderers[0].transform.position = Vector3(1, 0, 0)
+        assert self.render() == [self.renderers]
+        self.renderers[1].mesh = Mesh.cube(2)
+        assert self.render() == [self.renderers]
+        self.lights[0].transform.position = Vector3(10, 9, -10)
+        assert self.render() == [self.renderers]
+        assert self.render() == []
+
+        self.camera.shadowCaching = False
+        assert self.render() == [self.renderers]
+
+    def testStaticLayer(self):
+        cube, floor = self.renderers
+        batch, = StaticBatch.Combine(floor.gameObject)
+        assert batch.renderer.isStatic
+        assert self.render() == [[batch.renderer], [cube]]
+        assert self.gl.glBlitFramebuffer.call_count == 1
+
+        cube.transform.position = Vector3(1, 0, 0)
+        assert self.render() == [[cube]]
+        assert self.gl.glBlitFramebuffer.call_count == 2
+        assert self.render() == []
+
+    def testClone(self):
+        self.render()
+        cache = self.lights[0].shadowCache
+        assert cache.key is not None
+        assert copy.deepcopy(cache).key is None
@@ -0,0 +1,103 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, GameObject, Mesh, MeshRenderer, Quaternion,
+                     Rigidbody, SceneManager, ShowInInspector, StaticBatch, Vector3)
+from pyunity.scenes import SceneSnapshot
+from . import SceneTestCase
+
+class Holder(Behaviour):
+    target = ShowInInspector(GameObject)
+    values = ShowInInspector(list)
+
+class TestSceneSnapshot(SceneTestCase):
+    def makeScene(self):
+        scene = SceneManager.AddScene("Scene")
+        parent = GameObject("Parent")
+        parent.transform.localPosition = Vector3(1, 2, 3)
+        child = GameObject("Child", parent)
+        rb = child.AddComponent(Rigidbody)
+        rb.velocity = Vector3(0, 5, 0)
+        holder = parent.AddComponent(Holder)
+        holder.target = child
+        holder.values = [1, 2]
+        scene.AddMultiple(parent, child)
+        return scene, parent, child
+
+    def testRestore(self):
+        scene, parent, child = self.makeScene()
+        snapshot = SceneSnapshot(scene)
+        assert len(snapshot) == len(snapshot.data)
+
+        parent.transform.localPosition = Vector3(9, 9, 9)
+        parent.transform.localRotation = Quaternion.FromAxis(90, Vector3.up())
+        child.GetComponent(Rigidbody).velocity = Vector3.zero()
+        child.name = "Renamed"
+        holder = parent.GetComponent(Holder)
+        holder.values.append(3)
+        holder.target = None
+
+        snapshot.Restore()
+        assert parent.transform.localPosition == Vector3(1, 2, 3)
+        assert parent.transform.localRotation == Quaternion.identity()
+        assert child.GetComponent(Rigidbody).velocity == Vector3(0, 5, 0)
+        assert child.name == "Child"
+        assert holder.values == [1, 2]
+        assert holder.target is child
+
+        # Restoring again does not share the captured list
+        holder.values.append(3)
+        snapshot.Restore()
+        assert holder.values == [1, 2]
+
+    def testStructure(self):
+        scene, parent, child = self.makeScene()
+        snapshot = SceneSnapshot(scene)
+
+        added = GameObject("Added")
+        scene.Add(added)
+        scene.Destroy(child)
+        rb = child.GetComponent(Rigidbody)
+        child.RemoveComponent(Rigidbody)
+
+        snapshot.Restore()
+        assert added.scene is None
+        assert not scene.Has(added)
+        assert scene.Has(child)
+        assert child.scene is scene
+        assert child.GetComponent(Rigidbody) is rb
+        assert child.transform.parent is parent.transform
+        assert parent.transform.children == [child.transform]
+
+    def testOctree(self):
+        scene, parent, child = self.makeScene()
+        renderer = child.AddComponent(MeshRenderer)
+        renderer.mesh = Mesh.cube(1)
+        octree = scene.EnableOctree(halfSize=64)
+        snapshot = SceneSnapshot(scene)
+
+        added = GameObject("Added")
+        addedRenderer = added.AddComponent(MeshRenderer)
+        addedRenderer.mesh = Mesh.cube(1)
+        scene.Add(added)
+        batch, = StaticBatch.Combine(added)
+        scene.Destroy(child)
+        assert renderer not in octree
+        assert batch.renderer in octree
+
+        snapshot.Restore()
+        octree.Update()
+        assert set(octree) == {renderer}
+        assert scene.staticBatches == []
+        assert addedRenderer.staticBatch is None
+        assert octree.QuerySphere(child.transform.position, 1) == [renderer]
+
+    def testDeterministic(self):
+        scene, parent, child = self.makeScene()
+        first = SceneSnapshot(scene)
+        second = SceneSnapshot(scene)
+        assert first.data == second.data
+
+        parent.transform.localPosition = Vector3(1, 2, 4)
+        assert SceneSnapshot(scene).data != first.data
@@ -0,0 +1,87 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (GameObject, Material, Mesh, MeshRenderer, PyUnityException,
+                     RGB, SceneManager, StaticBatch, Vector3)
+from . import SceneTestCase, almostEqual
+
+class TestStaticBatch(SceneTestCase):
+    def makeLevel(self, scene, count=3):
+        red = Material(RGB(255, 0, 0))
+        blue = Material(RGB(0, 0, 255))
+        root = GameObject("Level")
+        scene.Add(root)
+        renderers = []
+        for i in range(count):
+            gameObject = GameObject("Block", root)
+            gameObject.transform.localPosition = Vector3(i * 2, 0, 0)
+            renderer = gameObject.AddComponent(MeshRenderer)
+            renderer.mesh = Mesh.cube(2)
+            renderer.mat = red if i % 2 == 0 else blue
+            scene.Add(gameObject)
+            renderers.append(renderer)
+        return root, renderers
+
+    def testCombine(self):
+        scene = SceneManager.AddScene("Scene")
+        root, renderers = self.makeLevel(scene)
+        batches = StaticBatch.Combine(root)
+        assert len(batches) == 2
+        assert scene.staticBatches == batches
+        red, blue = batches
+        assert red.renderers == [renderers[0], renderers[2]]
+        assert blue.renderers == [renderers[1]]
+        assert all(renderer.staticBatch is not None for renderer in renderers)
+        assert len(red.mesh.verts) == 2 * len(renderers[0].mesh.verts)
+        assert len(red.mesh.triangles) == 2 * len(renderers[0].mesh.triangles)
+        assert max(red.mesh.triangles[-1]) == len(red.mesh.verts) - 1
+        assert red.renderer.gameObject.scene is None
+        assert red.renderer.mat is red.material
+
+        assert almostEqual(red.mesh.min, Vector3(-1, -1, -1))
+        assert almostEqual(red.mesh.max, Vector3(5, 1, 1))
+
+        assert StaticBatch.Combine(root) == []
+
+    def testSplit(self):
+        scene = SceneManager.AddScene("Scene")
+        root, renderers = self.makeLevel(scene, count=6)
+        maxVertices = StaticBatch.maxVertices
+        StaticBatch.maxVertices = len(renderers[0].mesh.verts) * 2
+        try:
+            batches = StaticBatch.Combine(root)
+        finally:
+            StaticBatch.maxVertices = maxVertices
+        assert len(batches) == 4
+        assert [len(batch.renderers) for batch in batches] == [2, 1, 2, 1]
+
+    def testRemove(self):
+        scene = SceneManager.AddScene("Scene")
+        root, renderers = self.makeLevel(scene)
+        red, blue = StaticBatch.Combine(root)
+        red.Remove()
+        assert scene.staticBatches == [blue]
+        assert renderers[0].staticBatch is None
+        assert renderers[1].staticBatch is blue
+
+        scene.Destroy(renderers[1].gameObject)
+        assert scene.staticBatches == []
+
+    def testClone(self):
+        scene = SceneManager.AddScene("Scene")
+        root, renderers = self.makeLevel(scene)
+        StaticBatch.Combine(root)
+        clone = scene.Clone()
+        assert len(clone.staticBatches) == 2
+        batch = clone.staticBatches[0]
+        assert batch.scene is clone
+        assert batch.mesh is scene.staticBatches[0].mesh
+        renderer = clone.FindGameObjectsByName("Block")[0].GetComponent(MeshRenderer)
+        assert renderer.staticBatch is batch
+        assert batch.renderers[0] is renderer
+
+    def testNotInScene(self):
+        with self.assertRaises(PyUnityException) as exc:
+            StaticBatch.Combine(GameObject("Block"))
+        assert exc.value == "GameObject 'Block' is not part of a scene"
@@ -0,0 +1,193 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, BoxCollider, Camera, GameObject, Light,
+                     LightType, PyUnityException, Rigidbody, SceneManager)
+from pyunity.scenes.runner import NonInteractiveRunner
+from . import SceneTestCase
+import threading
+import time
+import os
+
+class Chunk(Behaviour):
+    def Awake(self):
+        self.awake = True
+        self.updates = 0
+        self.destroyed = False
+
+    def Start(self):
+        self.started = True
+
+    def Update(self, dt):
+        self.updates += 1
+
+    def OnDestroy(self):
+        self.destroyed = True
+
+class Streamer(Behaviour):
+    def Start(self):
+        self.operation = None
+        self.loaded = None
+
+    async def Load(self, source):
+        self.operation = SceneManager.LoadSceneAsync(source, additive=True)
+        self.loaded = await self.operation
+
+class TestStreaming(SceneTestCase):
+    def setUp(self):
+        super().setUp()
+        os.environ["PYUNITY_INTERACTIVE"] = "0"
+        self.runner = SceneManager.runner
+
+    def tearDown(self):
+        if SceneManager.runner.opened:
+            SceneManager.runner.quit()
+        SceneManager.runner = self.runner
+        super().tearDown()
+
+    def makeChunk(self, name="Chunk"):
+        chunk = SceneManager.AddBareScene(name)
+        gameObject = GameObject("Block")
+        gameObject.AddComponent(Chunk)
+        gameObject.AddComponent(BoxCollider)
+        gameObject.AddComponent(Rigidbody)
+        child = GameObject("Child", gameObject)
+        chunk.AddMultiple(gameObject, child)
+        return chunk
+
+    def makeRunner(self):
+        scene = SceneManager.AddScene("Main")
+        gameObject = GameObject("Streamer")
+        streamer = gameObject.AddComponent(Streamer)
+        scene.Add(gameObject)
+
+        runner = NonInteractiveRunner()
+        runner.setScene(scene, clone=False)
+        runner.open()
+        SceneManager.runner = runner
+        runner.fastForward(ticks=1)
+        return runner, streamer
+
+    def testAdditive(self):
+        chunk = self.makeChunk()
+        runner, streamer = self.makeRunner()
+        count = len(runner.scene.gameObjects)
+
+        operation = SceneManager.LoadSceneAdditive(chunk)
+        assert operation.state == "waiting"
+        assert operation.scene is not chunk
+        assert len(runner.scene.gameObjects) == count
+
+        runner.fastForward(ticks=2)
+        assert operation.done
+        assert operation.state == "loaded"
+        assert operation.progress == 1
+        assert len(runner.scene.gameObjects) == count + 2
+        block = operation.scene.gameObjects[0]
+        assert block.scene is runner.scene
+        component = block.GetComponent(Chunk)
+        assert component.awake
+        assert component.started
+        assert component.updates == 2
+        assert block.GetComponent(Rigidbody) in runner.scene.collManager.rigidbodies
+        assert SceneManager.LoadedScenes() == [runner.scene, operation.scene]
+        assert len(chunk.gameObjects) == 2
+        assert chunk.gameObjects[0].scene is chunk
+
+        SceneManager.UnloadScene(operation)
+        runner.fastForward(ticks=1)
+        assert operation.state == "unloaded"
+        assert component.destroyed
+        assert len(runner.scene.gameObjects) == count
+        assert block.GetComponent(Rigidbody) not in runner.scene.collManager.rigidbodies
+        assert SceneManager.LoadedScenes() == [runner.scene]
+
+    def testDefaults(self):
+        chunk = SceneManager.AddScene("Chunk")
+        lamp = GameObject("Lamp")
+        lamp.AddComponent(Light).type = LightType.Point
+        chunk.Add(lamp)
+        runner, streamer = self.makeRunner()
+        cameras = len(runner.scene.FindComponents(Camera))
+        lights = len(runner.scene.FindComponents(Light))
+
+        operation = SceneManager.LoadSceneAdditive(chunk)
+        runner.fastForward(ticks=1)
+        assert operation.state == "loaded"
+        # Only the point light is added
+        assert len(runner.scene.FindComponents(Camera)) == cameras
+        assert len(runner.scene.FindComponents(Light)) == lights + 1
+        assert runner.scene.mainCamera.gameObject not in operation.scene.gameObjects
+
+        SceneManager.UnloadScene(operation)
+        runner.fastForward(ticks=1)
+        assert len(runner.scene.FindComponents(Light)) == lights
+
+    def testAsync(self):
+        chunk = self.makeChunk()
+        runner, streamer = self.makeRunner()
+        threads = []
+
+        def factory():
+            threads.append(threading.get_ident())
+            return chunk
+
+        def loaded(scene):
+            time.sleep(0.001)
+            return streamer.loaded is not None
+
+        runner.loop.create_task(streamer.Load(factory))
+        runner.fastForward(until=loaded, ticks=1000)
+        assert streamer.loaded is chunk
+        assert streamer.operation.state == "loaded"
+        assert threads and threads[0] != threading.get_ident()
+        assert chunk.gameObjects[0].scene is runner.scene
+
+    def testReplace(self):
+        chunk = self.makeChunk()
+        runner, streamer = self.makeRunner()
+        operation = runner.streamer.Load(chunk, additive=False, background=False)
+        runner.fastForward(ticks=1)
+        assert operation.state == "loaded"
+        assert runner.scene is operation.scene
+        assert runner.scene.name == "Chunk"
+        # The new scene keeps fast-forwarding
+        block = runner.scene.gameObjects[0].GetComponent(Chunk)
+        runner.fastForward(ticks=2)
+        assert block.updates == 2
+        with self.assertRaises(PyUnityException) as exc:
+            SceneManager.UnloadScene(operation)
+        assert exc.value == "Only additive scenes can be unloaded"
+
+    def testFailed(self):
+        runner, streamer = self.makeRunner()
+
+        def factory():
+            return None
+
+        operation = runner.streamer.Load(factory, background=False)
+        assert operation.state == "failed"
+        assert isinstance(operation.exception, PyUnityException)
+        with self.assertRaises(PyUnityException) as exc:
+            runner.fastForward(ticks=1)
+        assert exc.value == "Expected Scene, got NoneType"
+
+    def testCancel(self):
+        chunk = self.makeChunk()
+        runner, streamer = self.makeRunner()
+        operation = SceneManager.LoadSceneAdditive(chunk)
+        SceneManager.UnloadScene(operation)
+        assert operation.state == "cancelled"
+        runner.fastForward(ticks=1)
+        assert len(runner.scene.gameObjects) == 3
+
+    def testNotRunning(self):
+        chunk = self.makeChunk()
+        SceneManager.runner = NonInteractiveRunner()
+        with self.assertRaises(PyUnityException) as exc:
+            SceneManager.LoadSceneAdditive(chunk)
+        assert exc.value == "Cannot load a scene before a scene is running"
+        with self.assertRaises(TypeError) as exc:
+            SceneManager.LoadSceneAsync(1)
+        assert exc.value == "Expected Scene or callable, got int"
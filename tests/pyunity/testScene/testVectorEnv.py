@@ -0,0 +1,84 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import (Behaviour, GameObject, PyUnityException, SceneManager,
+                     Vector3)
+from pyunity.scenes import VectorEnv
+from . import TestCase, almostEqual
+import signal
+import os
+
+class Mover(Behaviour):
+    def Start(self):
+        self.speed = 0
+
+    def Update(self, dt):
+        self.transform.position += self.speed * dt
+
+def makeScene(index):
+    scene = SceneManager.AddScene(f"Env {index}")
+    gameObject = GameObject("Mover")
+    gameObject.AddComponent(Mover)
+    scene.Add(gameObject)
+    return scene
+
+def observe(scene):
+    return list(scene.FindComponent(Mover).transform.position)
+
+def act(scene, action):
+    mover = scene.FindComponent(Mover)
+    mover.speed = Vector3(*action)
+
+def reward(scene):
+    return scene.FindComponent(Mover).transform.position.x
+
+def done(scene):
+    return scene.FindComponent(Mover).transform.position.x >= 1
+
+def failingAct(scene, action):
+    raise ValueError("Bad action")
+
+class TestVectorEnv(TestCase):
+    def testStep(self):
+        with VectorEnv(makeScene, 2, 3, 3, observe, act, reward, done,
+                       dt=0.1, ticksPerStep=2, context="fork") as env:
+            assert env.reset().tolist() == [[0, 0, 0], [0, 0, 0]]
+
+            obs, rewards, dones = env.step([[1, 0, 0], [2, 0, 0]])
+            obs = obs.tolist()
+            assert almostEqual(obs[0][0], 0.2)
+            assert almostEqual(obs[1][0], 0.4)
+            assert almostEqual(rewards[0], 0.2)
+            assert dones.tolist() == [0, 0]
+
+            for _ in range(2):
+                obs, rewards, dones = env.step([[1, 0, 0], [2, 0, 0]])
+            # Env 1 reached x = 1.2 and was rebuilt
+            assert dones.tolist() == [0, 1]
+            assert obs.tolist()[1] == [0, 0, 0]
+            assert almostEqual(obs.tolist()[0][0], 0.6)
+
+    def testErrors(self):
+        with VectorEnv(makeScene, 1, 3, 3, observe, failingAct,
+                       context="fork") as env:
+            env.reset()
+            with self.assertRaises(PyUnityException) as exc:
+                env.step([[0, 0, 0], [0, 0, 0]])
+            assert exc.value == "Expected 1 actions, got 2"
+            with self.assertRaises(PyUnityException) as exc:
+                env.step([[0, 0, 0]])
+            assert "ValueError: Bad action" in str(exc.value)
+        with self.assertRaises(PyUnityException) as exc:
+            env.reset()
+        assert exc.value == "VectorEnv has been closed"
+
+    def testWorkerDied(self):
+        with VectorEnv(makeScene, 2, 3, 3, observe, act,
+                       context="fork") as env:
+            env.reset()
+            os.kill(env.processes[1].pid, signal.SIGKILL)
+            env.processes[1].join()
+            with self.assertRaises(PyUnityException) as exc:
+                env.step([[0, 0, 0], [0, 0, 0]])
+            assert exc.value == "Environment 1: worker process stopped with exit code -9"
@@ -0,0 +1,78 @@
+## Copyright (c) 2020-2023 The PyUnity Team
+## This file is licensed under the MIT License.
+## See https://docs.pyunity.x10.bz/en/latest/license.html
+
+from pyunity import Clock, FrameStats
+from pyunity.values import other
+from unittest.mock import patch
+from . import TestCase, almostEqual
+
+class TestFrameStats(TestCase):
+    def testStats(self):
+        stats = FrameStats(size=100)
+        assert stats.mean == 0
+        assert stats.p99 == 0
+        for i in range(1, 101):
+            stats.Record(i / 1000)
+        assert stats.count == 100
+        assert almostEqual(stats.mean, 0.0505)
+        assert stats.p95 == 0.095
+        assert stats.p99 == 0.099
+        assert stats.max == 0.1
+
+        stats.Record(0.5)
+        assert stats.count == 100
+        assert stats.max == 0.5
+        assert stats.Summary()["max"] == 0.5
+
+        stats.Reset()
+        assert stats.count == 0
+
+class FakeTime:
+    """Clock that only moves when slept on, and a little on every read."""
+
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+
+    def perf_counter(self):
+        self.now += 0.00001
+        return self.now
+
+    def sleep(self, length):
+        self.sleeps.append(length)
+        self.now += length
+
+class TestClock(TestCase):
+    def setUp(self):
+        self.time = FakeTime()
+        self.patch = patch.object(other, "time", self.time)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+
+    def testPacing(self):
+        clock = Clock()
+        clock.Start(100)
+        start = self.time.perf_counter()
+        for _ in range(10):
+            clock.Maintain()
+        elapsed = self.time.perf_counter() - start
+        assert 0.1 <= elapsed < 0.101
+        assert clock.stats.count == 10
+        assert 0.01 <= clock.stats.mean < 0.0101
+        # Sleeps until spinThreshold before each frame ends
+        coarse = [length for length in self.time.sleeps if length]
+        assert len(coarse) == 10
+        assert all(0.0079 < length < 0.0081 for length in coarse)
+        # and yields while spinning for the rest
+        assert self.time.sleeps.count(0) >= 10
+
+    def testUnthrottled(self):
+        clock = Clock()
+        clock.Start(0)
+        for _ in range(100):
+            clock.Maintain()
+        assert self.time.sleeps == [0] * 100
+        assert clock.stats.count == 100